@@ -63,29 +63,12 @@ if TYPE_CHECKING:
     from pfund_plot.plots.scatter.marker import (
         Marker as marker,
     )
-
-# NOTE: data update in anywidget (backend=svelte) may have issues (especially in marimo) after loading panel extensions
-# if anywidget+svelte backend is not working, try to comment this out
-#
-# plotly/vega resolve to panel.models.* (bundled with Panel) — they don't import the
-# plotly/altair libs, so they're safe even when those optional extras aren't installed.
-# "ipywidgets" pulls in panel.io.ipywidget -> ipywidgets_bokeh, which is absent in WASM
-# (and where the anywidget/svelte backend isn't available anyway), so guard only that one.
-import importlib.util
-
-import panel as pn
+    from pfund_plot.plots.ta import (
+        TechnicalIndicator as ta,
+    )
 
 from pfund_plot.config import configure, get_config
 
-_panel_extensions = ["plotly", "vega"]
-if importlib.util.find_spec("ipywidgets_bokeh") is not None:
-    _panel_extensions.append("ipywidgets")
-pn.extension(*_panel_extensions)
-# NOTE: this MUST be True, otherwise, some widgets won't work properly, e.g. candlestick widgets, slider and input will both trigger each other due to panel's async update, which leads to infinite loop.
-pn.config.throttled = (
-    True  # If panel sliders and inputs should be throttled until release of mouse.
-)
-
 
 def __getattr__(name: str):
     if name == "__version__":
@@ -136,6 +119,10 @@ def __getattr__(name: str):
         from pfund_plot.plots.bar import Bar
 
         return Bar
+    elif name == "ta":
+        from pfund_plot.plots.ta import TechnicalIndicator
+
+        return TechnicalIndicator
     elif name in ("altair", "vega"):
         from pfund_plot.plots.altair import Altair
 
@@ -177,6 +164,7 @@ __all__ = (
     "panel",
     "plotly",
     "scatter",
+    "ta",
     "tabs",
     "vega",
 )
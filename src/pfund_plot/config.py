@@ -1,21 +1,34 @@
 from __future__ import annotations
 
+import importlib.util
 from pathlib import Path
 from typing import Any, ClassVar
 
-import panel as pn
 from pfund_kit.config import Configuration
 
-from pfund_plot.enums import PanelDesign, PanelTheme
+from pfund_plot.enums import PanelDesign, PanelTheme, PlottingBackend
 
 __all__ = [
     "configure",
     "get_config",
+    "load_panel_extensions",
 ]
 
 
 project_name = "pfund_plot"
 _config: PFundPlotConfig | None = None
+# Panel extensions required by each plotting backend, loaded on first render (see load_panel_extensions()).
+# plotly/vega resolve to panel.models.* (bundled with Panel) — they don't import the
+# plotly/altair libs, so they're safe even when those optional extras aren't installed.
+# "ipywidgets" pulls in panel.io.ipywidget -> ipywidgets_bokeh, which is absent in WASM
+# (and where the anywidget/svelte backend isn't available anyway), so it is only loaded if available.
+_BACKEND_EXTENSIONS: dict[PlottingBackend, str] = {
+    PlottingBackend.plotly: "plotly",
+    PlottingBackend.altair: "vega",
+    PlottingBackend.svelte: "ipywidgets",
+}
+# None until Panel is initialized by the first load_panel_extensions() call
+_loaded_extensions: set[str] | None = None
 
 
 def get_config() -> PFundPlotConfig:
@@ -66,6 +79,40 @@ def configure(
     return config
 
 
+def load_panel_extensions(backend: PlottingBackend | None = None) -> None:
+    """Initializes Panel (theme, design, extensions) on first use instead of at import time,
+    so that `import pfund_plot` doesn't pay for it, and loads the Panel extension the backend
+    needs if it hasn't been loaded yet. Called when a plot or its widgets are created,
+    widgets need pn.config.throttled, which is set here.
+    """
+    global _loaded_extensions
+    import panel as pn
+
+    extensions: list[str] = []
+    extension = _BACKEND_EXTENSIONS.get(backend) if backend is not None else None
+    if (
+        extension == "ipywidgets"
+        and importlib.util.find_spec("ipywidgets_bokeh") is None
+    ):
+        extension = None
+    if extension is not None and (
+        _loaded_extensions is None or extension not in _loaded_extensions
+    ):
+        extensions.append(extension)
+
+    # NOTE: data update in anywidget (backend=svelte) may have issues (especially in marimo) after loading panel extensions
+    # if anywidget+svelte backend is not working, try to skip loading them here
+    if _loaded_extensions is None:
+        config = get_config()
+        pn.extension(*extensions, theme=config.theme, design=config.design)
+        # NOTE: this MUST be True, otherwise, some widgets won't work properly, e.g. candlestick widgets, slider and input will both trigger each other due to panel's async update, which leads to infinite loop.
+        pn.config.throttled = True  # If panel sliders and inputs should be throttled until release of mouse.
+        _loaded_extensions = set(extensions)
+    elif extensions:
+        pn.extension(*extensions)
+        _loaded_extensions.update(extensions)
+
+
 class PFundPlotConfig(Configuration):
     DEFAULT_FILES: ClassVar[dict[str, bool]] = {}
 
@@ -81,8 +128,6 @@ class PFundPlotConfig(Configuration):
         self.disable_widgets: bool = self._data.get("disable_widgets", False)
         self.theme = self._data.get("theme", PanelTheme.default)
         self.design = self._data.get("design", PanelDesign.native)
-        pn.extension(theme=self.theme)
-        pn.extension(design=self.design)
 
     def to_dict(self) -> dict[str, Any]:
         return {
@@ -1,150 +1,255 @@
 # pyright: reportArgumentType=false, reportOptionalMemberAccess=false, reportOptionalSubscript=false, reportCallIssue=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportAttributeAccessIssue=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 if TYPE_CHECKING:
+    from collections.abc import Hashable
+
     from pfeed.requests.market_feed_stream_request import MarketFeedStreamRequest
     from pfeed.streaming import BarMessage, TickMessage
     from pfeed.streaming.market_data_message import MarketDataMessage
     from pfund.datas.resolution import Resolution
 
     from pfund_plot.plots.plot import MessageKey
+    from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
 
-import narwhals as nw
+import numpy as np
 from pfund_kit.style import RichColor, TextStyle, cprint
 
+# Columns (and their order) of the streaming buffers per message type.
+# streaming always uses polars internally, see ColumnarRingBuffer.to_frame()
+TICK_SCHEMA = {
+    "date": "datetime64[ns]",
+    "price": "float64",
+    # volume can be None (e.g. yahoo finance), stored as NaN
+    "volume": "float64",
+}
+BAR_SCHEMA = {
+    "date": "datetime64[ns]",
+    "open": "float64",
+    "high": "float64",
+    "low": "float64",
+    "close": "float64",
+    "volume": "float64",
+}
+
 
 class StreamingMarketFeedMixin:
+    # a dummy row is prepended to every new streaming buffer, see _create_streaming_buffer()
+    _HAS_DUMMY_ROW: ClassVar[bool] = True
+
     def _is_streaming_ready(self) -> bool:
-        """Return True if all streaming dataframes have at least 2 rows (needed for e.g. ohlc to compute candle width)."""
-        if not self._streaming_dfs:
+        """Return True if all streaming buffers have at least 2 rows (needed for e.g. ohlc to compute candle width)."""
+        self._flush_streaming_messages()
+        if not self._streaming_buffers:
             return False
-        return all(df.shape[0] >= 2 for df in self._streaming_dfs.values())
+        return all(len(buffer) >= 2 for buffer in self._streaming_buffers.values())
 
     def _start_streaming(self):
         from pfund_plot.utils import import_hvplot_df_module
 
-        # streaming always uses polars internally (see _create_streaming_row)
+        # streaming always uses polars internally (see ColumnarRingBuffer.to_frame)
         import_hvplot_df_module("polars")
 
+        aggregate = self._control.get("aggregate")
+        if aggregate is not None:
+            from pfund_plot.utils.ohlc import RESOLUTIONS
+
+            assert aggregate in RESOLUTIONS, (
+                f"aggregate must be one of {list(RESOLUTIONS)}, got {aggregate!r}"
+            )
+            # a tick can't carry the high/low/volume of the ticks conflated into it
+            assert self._control.get("backpressure") != "conflate", (
+                "backpressure='conflate' is not supported with aggregate, ticks folded into bars would be lost"
+            )
+
+        if self._y is not None:
+            y_cols = [self._y] if isinstance(self._y, str) else self._y
+            for data_type, schema in self._get_feed_schemas().items():
+                cols = list(self._get_streaming_schema(schema))[1:]
+                assert all(col in cols for col in y_cols), (
+                    f"y must be one of {cols} when streaming {data_type} data"
+                )
+
+        super()._start_streaming()
+
+    def _get_feed_schemas(self) -> dict[str, dict[str, str]]:
+        """Returns the schema of the messages streamed by the feed per data type, e.g. {"bar": BAR_SCHEMA}."""
+        schemas: dict[str, dict[str, str]] = {}
         requests = cast("list[MarketFeedStreamRequest]", self._feed._requests)
         for request in requests:
             resolution = cast("Resolution", request.target_resolution)
-            if resolution.is_bar():
-                if self._y is not None:
-                    assert self._y in ["open", "high", "low", "close", "volume"], (
-                        "y must be 'open', 'high', 'low', 'close', or 'volume' when streaming bar data"
-                    )
+            # ticks are folded into bars when aggregating
+            if resolution.is_bar() or (
+                resolution.is_tick() and self._control.get("aggregate") is not None
+            ):
+                schemas["bar"] = BAR_SCHEMA
             elif resolution.is_tick():
-                if self._y is not None:
-                    assert self._y in ["price", "volume"], (
-                        "y must be 'price' or 'volume' when streaming tick data"
-                    )
+                schemas["tick"] = TICK_SCHEMA
             else:
                 raise ValueError(f"Unsupported resolution: {resolution}")
+        return schemas
 
-        super()._start_streaming()
-
-    def _create_streaming_row(self, msg: MarketDataMessage) -> nw.DataFrame[Any]:
-        import polars as pl
-
+    def _create_streaming_row(self, msg: MarketDataMessage) -> tuple[Any, ...]:
+        """Create a row ordered as TICK_SCHEMA/BAR_SCHEMA from a message."""
         if msg.is_tick():
             tick_msg = cast("TickMessage", msg)
-            return nw.from_native(
-                pl.DataFrame(
-                    {
-                        # msg.ts is int64 ns since epoch; from_epoch yields a tz-naive
-                        # (already UTC) datetime[ns], preserving nanosecond precision
-                        "date": pl.from_epoch(pl.Series([tick_msg.ts]), time_unit="ns"),
-                        "price": [tick_msg.price],
-                        # volume can be None (e.g. yahoo finance); pin dtype so a leading
-                        # None row doesn't become a Null column and break later concats
-                        "volume": pl.Series([tick_msg.volume], dtype=pl.Float64),
-                    }
-                )
+            # msg.ts is int64 ns since epoch, i.e. a tz-naive (already UTC) datetime[ns]
+            return (
+                np.datetime64(tick_msg.ts, "ns"),
+                tick_msg.price,
+                tick_msg.volume,
             )
         elif msg.is_bar():
             bar_msg = cast("BarMessage", msg)
-            return nw.from_native(
-                pl.DataFrame(
-                    {
-                        # bar_msg.start_ts is int64 ns since epoch (start of bar);
-                        # from_epoch yields a tz-naive (already UTC) datetime[ns]
-                        "date": pl.from_epoch(
-                            pl.Series([bar_msg.start_ts]), time_unit="ns"
-                        ),
-                        "open": [bar_msg.open],
-                        "high": [bar_msg.high],
-                        "low": [bar_msg.low],
-                        "close": [bar_msg.close],
-                        "volume": [bar_msg.volume],
-                    }
-                )
+            # bar_msg.start_ts is int64 ns since epoch (start of bar)
+            return (
+                np.datetime64(bar_msg.start_ts, "ns"),
+                bar_msg.open,
+                bar_msg.high,
+                bar_msg.low,
+                bar_msg.close,
+                bar_msg.volume,
             )
         else:
             raise ValueError(f"Unsupported streaming message type: {type(msg)}")
 
-    def _create_streaming_df(
-        self, msg_key: MessageKey, msg: MarketDataMessage
-    ) -> nw.DataFrame[Any]:
-        new_row = self._create_streaming_row(msg)
+    def _create_streaming_buffer(
+        self,
+        msg_key: MessageKey,
+        schema: dict[str, str],
+        row: tuple[Any, ...],
+        resolution_seconds: int,
+    ) -> ColumnarRingBuffer:
+        from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
 
-        if msg_key not in self._streaming_dfs:
-            import datetime
+        buffer = ColumnarRingBuffer(
+            self._get_streaming_schema(schema), max_size=self._control["max_data"]
+        )
+        # prepend a dummy row (resolution_seconds before row) so the buffer starts with 2 rows,
+        # needed for DatetimeRangeWidget to derive slider step from date_col[1] - date_col[0]
+        dummy = (row[0] - np.timedelta64(resolution_seconds, "s"), *row[1:])
+        cprint(
+            f"Prepending dummy row for {msg_key} to ensure at least 2 data points for the {self._class_name}\n"
+            + "i.e. The first data point is dummy data",
+            style=TextStyle.BOLD + RichColor.YELLOW,
+        )
+        columns = [
+            np.array(values, dtype=dtype)
+            for values, dtype in zip(
+                zip(dummy, row, strict=True), schema.values(), strict=True
+            )
+        ]
+        self._write_streaming_rows(msg_key, buffer, None, columns)
+        return buffer
 
-            from pfund.datas.resolution import Resolution
+    def _update_streaming_buffer(
+        self, msg_key: MessageKey, msgs: list[MarketDataMessage]
+    ) -> None:
+        """Write a batch of messages of msg_key into its streaming buffer in one vectorized append."""
+        from pfund.datas.resolution import Resolution
 
-            # prepend a dummy row so df starts with 2 rows,
-            # needed for DatetimeRangeWidget to derive slider step from date_col[1] - date_col[0]
-            if msg.is_bar():
-                resolution_seconds = Resolution(msg.resolution).to_seconds()
+        from pfund_plot.utils.ohlc import RESOLUTIONS, aggregate_ticks
+
+        rows = [self._create_streaming_row(msg) for msg in msgs]
+        is_bar = msgs[0].is_bar()
+        schema = BAR_SCHEMA if is_bar else TICK_SCHEMA
+        columns = [
+            np.asarray(values, dtype=dtype)
+            for values, dtype in zip(
+                zip(*rows, strict=True), schema.values(), strict=True
+            )
+        ]
+        aggregate = self._control.get("aggregate")
+        is_aggregated = not is_bar and aggregate is not None
+        if is_aggregated:
+            # only the bars are kept, the raw ticks are dropped
+            columns = aggregate_ticks(*columns, aggregate)
+            schema = BAR_SCHEMA
+        if msg_key not in self._streaming_buffers:
+            if is_aggregated:
+                resolution_seconds = RESOLUTIONS[aggregate]
+            elif is_bar:
+                resolution_seconds = Resolution(msgs[0].resolution).to_seconds()
             else:
                 # for tick data, use 1 second as the dummy interval
                 resolution_seconds = 1
-            dummy = new_row.with_columns(
-                # cast back to ns: subtracting a timedelta downcasts datetime[ns] -> datetime[us],
-                # which would then fail to concat with the ns-precision new_row below
-                (nw.col("date") - datetime.timedelta(seconds=resolution_seconds)).cast(
-                    nw.Datetime("ns")
-                ),
+            self._streaming_buffers[msg_key] = self._create_streaming_buffer(
+                msg_key,
+                schema,
+                tuple(values[0] for values in columns),
+                resolution_seconds,
             )
-            cprint(
-                f"Prepending dummy row for {msg_key} to ensure at least 2 data points for the {self._class_name}\n"
-                + "i.e. The first data point is dummy data",
-                style=TextStyle.BOLD + RichColor.YELLOW,
+            columns = [values[1:] for values in columns]
+            if not len(columns[0]):
+                return
+        buffer = self._streaming_buffers[msg_key]
+        dates = columns[0]
+        last_date = buffer.last("date")
+        if dates[0] < last_date or np.any(dates[1:] < dates[:-1]):
+            raise ValueError(
+                f"New dates of {msg_key} are before the last date {last_date}, something is wrong with the streaming data"
             )
-            df = nw.concat([dummy, new_row])
-        else:
-            # update the streaming dataframe
-            existing_df = self._streaming_dfs[msg_key]
-            last_date = existing_df["date"][-1]
-            new_date = new_row["date"][0]
-            if new_date == last_date:
-                # same bar — replace last row
-                if msg.is_bar():
-                    df = nw.concat([existing_df.head(-1), new_row])
-                # NOTE: tick data could have the same timestamp!
-                elif msg.is_tick():
-                    df = nw.concat([existing_df, new_row])
-                else:
-                    raise ValueError(f"Unsupported streaming message type: {type(msg)}")
-            elif new_date > last_date:
-                df = nw.concat([existing_df, new_row])
-            else:
-                raise ValueError(
-                    f"New date {new_date} is before last date {last_date}, something is wrong with the streaming data"
+        last_row: tuple[Any, ...] | None = None
+        # NOTE: tick data could have the same timestamp, those rows are all kept
+        if is_aggregated:
+            # the ticks of the bar in progress are folded into it
+            if dates[0] == last_date:
+                _, open_, high, low, _, volume = (buffer.last(col) for col in schema)
+                last_row = (
+                    last_date,
+                    open_,
+                    max(high, columns[2][0]),
+                    min(low, columns[3][0]),
+                    columns[4][0],
+                    volume + columns[5][0],
                 )
-        return df
+                columns = [values[1:] for values in columns]
+        elif is_bar:
+            # successive updates of the same bar, only the last one is kept
+            is_last = np.r_[dates[1:] != dates[:-1], True]
+            if not is_last.all():
+                columns = [values[is_last] for values in columns]
+            # same bar as the last row in the buffer — replace it
+            if columns[0][0] == last_date:
+                last_row = tuple(values[0] for values in columns)
+                columns = [values[1:] for values in columns]
+        self._write_streaming_rows(msg_key, buffer, last_row, columns)
+
+    def _ingest_streaming_messages(self) -> None:
+        """Write the queued messages into the streaming buffers, one batch per message key."""
+        with self._streaming_lock:
+            # messages queued meanwhile are left for the next call
+            msgs = self._ingest_queue.drain()
+            if not msgs:
+                return
+            batches: dict[MessageKey, list[MarketDataMessage]] = {}
+            for msg in msgs:
+                batches.setdefault(self._create_msg_key(msg), []).append(msg)
+            for msg_key, msgs in batches.items():
+                self._update_streaming_buffer(msg_key, msgs)
 
     def _create_msg_key(self, msg: MarketDataMessage) -> MessageKey:
         """Create a message key for streaming"""
-        msg_key = (msg.product, msg.resolution)
+        aggregate = self._control.get("aggregate")
+        # aggregated ticks are keyed by the resolution of the bars they are folded into
+        resolution = (
+            aggregate if msg.is_tick() and aggregate is not None else msg.resolution
+        )
+        msg_key = (msg.product, resolution)
         # set the first product as active by default
         if self._active_msg_key is None:
             self._active_msg_key = msg_key
         return msg_key
 
+    def _get_conflation_key(self, msg: MarketDataMessage) -> Hashable:
+        """The latest update of each bar is kept, or the latest tick of each product."""
+        msg_key = self._create_msg_key(msg)
+        if msg.is_bar():
+            return (*msg_key, cast("BarMessage", msg).start_ts)
+        return msg_key
+
     # NOTE: this is added to streaming feed as a custom transformation
     def _on_streaming_callback(self, msg: MarketDataMessage) -> MarketDataMessage:
         # for bar data, skip incremental updates unless incremental_update is enabled
@@ -155,8 +260,9 @@ class StreamingMarketFeedMixin:
         ):  # pyright: ignore[reportAttributeAccessIssue]
             return msg
 
-        msg_key = self._create_msg_key(msg)
-        df = self._create_streaming_df(msg_key, msg)
-        self._update_streaming_df(msg_key, df)
+        # keep the feed fast, messages are only queued here and written into the buffers
+        # in batches when they are read (i.e. every update_interval), see _ingest_streaming_messages()
+        # the queue is bounded, see control(backpressure=...)
+        self._ingest_queue.put(msg)
 
         return msg
@@ -0,0 +1,68 @@
+# pyright: reportArgumentType=false, reportOptionalMemberAccess=false, reportOptionalSubscript=false, reportCallIssue=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportAttributeAccessIssue=false
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from pfund_plot.plots.plot import MessageKey
+
+
+# resolution part of the message key of a StreamSource's buffer, see _get_source_msg_key()
+SOURCE_RESOLUTION = "stream"
+
+
+class StreamingSourceMixin:
+    """Streams the rows pushed to a StreamSource (see pfund_plot.sources.stream) into the plot.
+
+    The plot follows a single stream, so there is nothing for the streaming widgets (e.g. ticker select)
+    to choose from, and the stream can start empty (e.g. no fills yet), which the DatetimeRangeWidget
+    can't show, so no widgets are created.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self._ChosenWidgetClasses = []
+        self._ChosenStreamingWidgetClasses = []
+        # row id (see ColumnarRingBuffer) of the next row to read from the source
+        self._source_row_id = 0
+
+    def _start_streaming(self):
+        from pfund_plot.utils import import_hvplot_df_module
+
+        # streaming always uses polars internally (see ColumnarRingBuffer.to_frame)
+        import_hvplot_df_module("polars")
+
+        if self._y is not None:
+            cols = list(self._get_streaming_schema(self._stream_source.schema))[1:]
+            y_cols = [self._y] if isinstance(self._y, str) else self._y
+            assert all(col in cols for col in y_cols), (
+                f"y must be one of {cols} when streaming {self._stream_source}"
+            )
+
+        super()._start_streaming()
+
+    def _get_source_msg_key(self) -> MessageKey:
+        return (self._stream_source.name, SOURCE_RESOLUTION)
+
+    def _connect_to_stream(self):
+        from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
+
+        msg_key = self._get_source_msg_key()
+        self._active_msg_key = msg_key
+        # created empty, plots of a source are ready before anything is pushed
+        self._streaming_buffers[msg_key] = ColumnarRingBuffer(
+            self._get_streaming_schema(self._stream_source.schema),
+            max_size=self._control["max_data"],
+        )
+        self._ingest_streaming = self._ingest_streaming_messages
+
+    def _ingest_streaming_messages(self) -> None:
+        """Copy the rows pushed since the last call into the streaming buffer in one vectorized append."""
+        with self._streaming_lock:
+            columns, self._source_row_id = self._stream_source.read(self._source_row_id)
+            if not len(columns[0]):
+                return
+            msg_key = self._get_source_msg_key()
+            self._write_streaming_rows(
+                msg_key, self._streaming_buffers[msg_key], None, columns
+            )
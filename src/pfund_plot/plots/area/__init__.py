@@ -8,6 +8,7 @@ if TYPE_CHECKING:
     from narwhals.typing import IntoFrame
     from pfeed.feeds.market_feed import MarketFeed
 
+    from pfund_plot.utils.datashader import RasterGlyph
     from pfund_plot.widgets.base import BaseStreamingWidget, BaseWidget
 
 from pfund_plot.enums import PlottingBackend
@@ -32,6 +33,7 @@ class AreaControl:
 
 class Area(BasePlot):
     SUPPORTED_BACKENDS: ClassVar[list[PlottingBackend]] = [PlottingBackend.bokeh]
+    RASTER_GLYPH: ClassVar[RasterGlyph] = "spike"
     SUPPORT_STREAMING: ClassVar[bool] = True
     SUPPORTED_WIDGETS: ClassVar[list[type[BaseWidget]]] = [DatetimeRangeWidget]
     SUPPORTED_STREAMING_WIDGETS: ClassVar[list[type[BaseStreamingWidget]]] = [
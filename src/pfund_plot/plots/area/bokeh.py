@@ -65,11 +65,20 @@ def style(
 def control(
     num_data: int | None = None,
     max_data: int | None = None,
+    aggregate: str | None = None,
     slider_step: int | None = None,
     widgets: bool = True,
     linked_axes: bool = True,
+    rasterize: bool | Literal["auto"] = False,
+    rasterize_threshold: int = 1_000_000,
+    downsample: Literal["lttb", "minmax"] | None = None,
     update_interval: int = 5000,  # ms
+    min_update_interval: int | None = 200,  # ms
     incremental_update: bool = True,
+    incremental_render: bool = True,
+    backpressure: Literal["block", "drop_oldest", "conflate"] = "block",
+    max_queued_messages: int = 10_000,
+    ingest_process: bool = False,
     datetime_precision: Literal["d", "s", "ms"] = "s",
 ):
     """
@@ -77,13 +86,37 @@ def control(
         num_data: (DatetimeRangeWidget) initial number of most recent data points to display.
         max_data: (streaming) maximum number of data points kept in memory.
             If None, data will continue to grow unbounded.
+        aggregate: (streaming) resolution (e.g. "1s", "1m", "1h") to fold streamed ticks into OHLCV bars on the fly,
+            only the bars are kept (bounded by max_data) and the raw ticks are dropped. If None, every tick is kept.
         slider_step: (DatetimeRangeWidget) step size in ms for the datetime range slider.
             If None, derived from data resolution.
         widgets: whether to show widgets. default is True.
             For granular control, use remove_widgets() to remove specific widget classes.
         linked_axes: whether to link axes across plots in a layout (plt.layout(...)).
+        rasterize: whether to render the data server-side into images with datashader instead of sending every data point to the browser,
+            re-rendered on zooming/panning. Hovering shows the values of a sample of about one point per pixel.
+            If "auto", only rasterize when the data has at least `rasterize_threshold` rows. default is False.
+        rasterize_threshold: number of rows from which the data is rasterized when rasterize="auto".
+        downsample: algorithm used to reduce the points sent to the browser to about one per pixel of the plot's width,
+            re-run on zooming/panning so the visible range keeps full detail.
+            "lttb" (Largest-Triangle-Three-Buckets) preserves the visual shape, "minmax" keeps the min and max of each pixel bucket (never drops spikes).
+            If None, all data points are plotted. default is None.
         incremental_update: (streaming) whether to update even when the bar is incomplete. default is True.
-        update_interval: (streaming) interval in ms to update the plot. default is 5000 ms.
+        incremental_render: (streaming) whether to only send the updated and newly added data points to the plot on refresh,
+            instead of re-rendering the whole plot. Falls back to a full re-render when the plot doesn't support it (e.g. downsampled). default is True.
+        backpressure: (streaming) what to do with the feed's messages once max_queued_messages are waiting to be written into the plot's data
+            (e.g. market-open bursts). "block": the feed waits for the plot to catch up, for at most update_interval,
+            then writes them itself, no message is lost. "drop_oldest": the oldest message is dropped.
+            "conflate": once the queue is full, only the latest update of each bar is kept, or the latest tick of each product, not supported with aggregate. default is "block".
+        max_queued_messages: (streaming) maximum number of messages waiting to be written into the plot's data, see backpressure.
+            The queue's depth and dropped messages can be monitored with get_ingest_metrics(). default is 10000.
+        ingest_process: (streaming) whether to run the feed, and the writing of its messages into the plot's data
+            (e.g. folding ticks into bars, computing indicators), in a separate process that publishes the rows into shared memory,
+            so that heavy feeds don't compete with the UI for the GIL. Requires cloudpickle. default is False.
+        update_interval: (streaming) longest interval in ms between two updates of the plot while new data arrives. default is 5000 ms.
+        min_update_interval: (streaming) shortest interval in ms between two updates of the plot.
+            In between, the interval adapts to how often new data arrives and how long the plot takes to update,
+            and updates are skipped when no new data has arrived. If None, the plot is updated every update_interval ms. default is 200 ms.
         datetime_precision: the precision of datetime formatting on the hover tooltip.
             "d" for days (%Y-%m-%d), "s" for seconds (default, %Y-%m-%d %H:%M:%S), "ms" for milliseconds (%Y-%m-%d %H:%M:%S.%3N).
     """
@@ -99,9 +132,9 @@ def plot(
     **kwargs: Any,
 ) -> NdOverlay:
     import hvplot
-    from bokeh.models import CrosshairTool
 
     from pfund_plot.plots.area import Area
+    from pfund_plot.utils.bokeh import create_crosshair_tool
 
     _ = hvplot.extension(PlottingBackend.bokeh)
 
@@ -110,9 +143,7 @@ def plot(
     y_cols = Area._derive_y_cols(df, x, y)
     datetime_precision = control["datetime_precision"]
 
-    crosshair_tool = CrosshairTool(
-        dimensions="height", line_color="gray", line_alpha=0.3
-    )
+    crosshair_tool = create_crosshair_tool()
 
     if len(y_cols) == 1:
         kwargs["color"] = style["color"]
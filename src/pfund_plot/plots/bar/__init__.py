@@ -8,6 +8,8 @@ if TYPE_CHECKING:
     from narwhals.typing import IntoFrame
     from pfeed.feeds.market_feed import MarketFeed
 
+    from pfund_plot.sources.stream import StreamSource
+    from pfund_plot.utils.datashader import RasterGlyph
     from pfund_plot.widgets.base import BaseStreamingWidget, BaseWidget
 
 from pfund_plot.enums import PlottingBackend
@@ -32,6 +34,7 @@ class BarControl:
 
 class Bar(BasePlot):
     SUPPORTED_BACKENDS: ClassVar[list[PlottingBackend]] = [PlottingBackend.bokeh]
+    RASTER_GLYPH: ClassVar[RasterGlyph] = "spike"
     SUPPORT_STREAMING: ClassVar[bool] = True
     SUPPORTED_WIDGETS: ClassVar[list[type[BaseWidget]]] = [DatetimeRangeWidget]
     SUPPORTED_STREAMING_WIDGETS: ClassVar[list[type[BaseStreamingWidget]]] = [
@@ -42,7 +45,7 @@ class Bar(BasePlot):
 
     def __init__(
         self,
-        data: IntoFrame | MarketFeed | None = None,
+        data: IntoFrame | MarketFeed | StreamSource | None = None,
         x: str | None = None,
         y: str | list[str] | None = None,
         by: str | list[str] | None = None,
@@ -53,7 +56,7 @@ class Bar(BasePlot):
     ):
         """
         Args:
-            data: The dataframe for static plot or pfeed's feed object for streaming plot
+            data: The dataframe for static plot or pfeed's feed object / a StreamSource for streaming plot
             x: Column name for x-positions. If not specified, the index is used.
                 Can refer to continuous and categorical data.
             y: Column name for the y-position.
@@ -52,8 +52,15 @@ def control(
     slider_step: int | None = None,
     widgets: bool = True,
     linked_axes: bool = True,
+    rasterize: bool | Literal["auto"] = False,
+    rasterize_threshold: int = 1_000_000,
     update_interval: int = 5000,  # ms
+    min_update_interval: int | None = 200,  # ms
     incremental_update: bool = True,
+    incremental_render: bool = True,
+    backpressure: Literal["block", "drop_oldest", "conflate"] = "block",
+    max_queued_messages: int = 10_000,
+    ingest_process: bool = False,
     datetime_precision: Literal["d", "s", "ms"] = "s",
 ):
     """
@@ -66,8 +73,26 @@ def control(
         widgets: whether to show widgets. default is True.
             For granular control, use remove_widgets() to remove specific widget classes.
         linked_axes: whether to link axes across plots in a layout (plt.layout(...)).
+        rasterize: whether to render the data server-side into images with datashader instead of sending every data point to the browser,
+            re-rendered on zooming/panning. Hovering shows the values of a sample of about one point per pixel.
+            If "auto", only rasterize when the data has at least `rasterize_threshold` rows. default is False.
+        rasterize_threshold: number of rows from which the data is rasterized when rasterize="auto".
         incremental_update: (streaming) whether to update even when the bar is incomplete. default is True.
-        update_interval: (streaming) interval in ms to update the plot. default is 5000 ms.
+        incremental_render: (streaming) whether to only send the updated and newly added data points to the plot on refresh,
+            instead of re-rendering the whole plot. Falls back to a full re-render when the plot doesn't support it (e.g. downsampled). default is True.
+        backpressure: (streaming) what to do with the feed's messages once max_queued_messages are waiting to be written into the plot's data
+            (e.g. market-open bursts). "block": the feed waits for the plot to catch up, for at most update_interval,
+            then writes them itself, no message is lost. "drop_oldest": the oldest message is dropped.
+            "conflate": once the queue is full, only the latest update of each bar is kept, or the latest tick of each product, not supported with aggregate. default is "block".
+        max_queued_messages: (streaming) maximum number of messages waiting to be written into the plot's data, see backpressure.
+            The queue's depth and dropped messages can be monitored with get_ingest_metrics(). default is 10000.
+        ingest_process: (streaming) whether to run the feed, and the writing of its messages into the plot's data
+            (e.g. folding ticks into bars, computing indicators), in a separate process that publishes the rows into shared memory,
+            so that heavy feeds don't compete with the UI for the GIL. Requires cloudpickle. default is False.
+        update_interval: (streaming) longest interval in ms between two updates of the plot while new data arrives. default is 5000 ms.
+        min_update_interval: (streaming) shortest interval in ms between two updates of the plot.
+            In between, the interval adapts to how often new data arrives and how long the plot takes to update,
+            and updates are skipped when no new data has arrived. If None, the plot is updated every update_interval ms. default is 200 ms.
         datetime_precision: the precision of datetime formatting on the hover tooltip.
             "d" for days (%Y-%m-%d), "s" for seconds (default, %Y-%m-%d %H:%M:%S), "ms" for milliseconds (%Y-%m-%d %H:%M:%S.%3N).
     """
@@ -83,10 +108,12 @@ def plot(
     **kwargs: Any,
 ) -> Overlay:
     import hvplot
-    from bokeh.models import CrosshairTool
 
     from pfund_plot.plots.bar import Bar
-    from pfund_plot.utils.bokeh import create_bundled_hover_tool
+    from pfund_plot.utils.bokeh import (
+        create_bundled_hover_tool,
+        create_crosshair_tool,
+    )
 
     _ = hvplot.extension(PlottingBackend.bokeh)
 
@@ -95,9 +122,7 @@ def plot(
     datetime_precision = control["datetime_precision"]
 
     is_single = len(y_cols) == 1
-    crosshair_tool = CrosshairTool(
-        dimensions="height", line_color="gray", line_alpha=0.3
-    )
+    crosshair_tool = create_crosshair_tool()
     if is_single:
         tools = [
             create_bundled_hover_tool(df, x_col, y_cols, datetime_precision),
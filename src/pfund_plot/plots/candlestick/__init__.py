@@ -1,14 +1,18 @@
 # pyright: reportArgumentType=false, reportOptionalMemberAccess=false, reportOptionalSubscript=false, reportCallIssue=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, ClassVar, cast
+from typing import TYPE_CHECKING, Any, ClassVar, cast
 
 if TYPE_CHECKING:
+    import narwhals as nw
     from pfeed.requests.market_feed_stream_request import MarketFeedStreamRequest
     from pfund.datas.resolution import Resolution
 
+    from pfund_plot.typing import Plot
     from pfund_plot.widgets.base import BaseStreamingWidget, BaseWidget
 
+import numpy as np
+
 from pfund_plot.enums import PlottingBackend
 from pfund_plot.mixins.streaming_market_feed_mixin import StreamingMarketFeedMixin
 from pfund_plot.plots.plot import BasePlot
@@ -18,6 +22,10 @@ from pfund_plot.widgets.ticker_widget import TickerSelectWidget
 __all__ = ["Candlestick"]
 
 
+# minimum width of a candle in pixels when bars are re-aggregated on zoom (control(resample_on_zoom=True))
+MIN_BAR_WIDTH = 3
+
+
 class CandlestickStyle:
     from pfund_plot.plots.candlestick.bokeh import style as bokeh_style
     from pfund_plot.plots.candlestick.svelte import style as svelte_style
@@ -49,6 +57,13 @@ class Candlestick(StreamingMarketFeedMixin, BasePlot):
     style = CandlestickStyle
     control = CandlestickControl
 
+    _DERIVED_ATTRS: ClassVar[frozenset[str]] = BasePlot._DERIVED_ATTRS | {
+        "_candle_half_width"
+    }
+
+    # half the width of the rendered candles, set when the plot is built, see _get_stream_columns()
+    _candle_half_width: np.timedelta64 | None = None
+
     def _create_component(self):
         # NOTE: somehow data update on anywidget (svelte) in marimo notebook doesn't work using Panel
         # (probably need a refresh of the marimo cell to reflect the changes), so use mo.vstack() as a workaround
@@ -68,10 +83,108 @@ class Candlestick(StreamingMarketFeedMixin, BasePlot):
         else:
             super()._create_component()
 
+    def _is_view_dependent(self) -> bool:
+        return super()._is_view_dependent() or bool(
+            self._control.get("resample_on_zoom")
+        )
+
+    def _build_plot(
+        self,
+        df: nw.DataFrame[Any] | None = None,
+        x_range: tuple[Any, Any] | None = None,
+        y_range: tuple[Any, Any] | None = None,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> Plot:
+        if df is None:
+            self._collect_lazy_df()
+            df = self._df
+        if df is not None and self._control.get("resample_on_zoom"):
+            df = self._resample_for_view(df, x_range=x_range, width=width)
+        if df is not None and len(df) >= 2:
+            # same candle width as hvplot's ohlc (bar_width=0.5), based on the df's min spacing
+            self._candle_half_width = np.diff(df["date"].to_numpy()).min() * 0.5 / 2.0
+        return super()._build_plot(
+            df, x_range=x_range, y_range=y_range, width=width, height=height
+        )
+
+    def _resample_for_view(
+        self,
+        df: nw.DataFrame[Any],
+        x_range: tuple[Any, Any] | None = None,
+        width: int | None = None,
+    ) -> nw.DataFrame[Any]:
+        """Re-aggregates the bars to a coarser resolution (e.g. 1m -> 1h) when the visible range
+        holds more bars than fit into the plot's width, and only keeps the bars around the visible range.
+        Zooming back in restores the original resolution.
+        """
+        from pfund_plot.utils.downsample import DEFAULT_NUM_POINTS
+        from pfund_plot.utils.ohlc import (
+            choose_resolution,
+            infer_resolution,
+            resample_ohlc,
+        )
+
+        if len(df) < 2:
+            return df
+        dates = df["date"].to_numpy()
+        start, end = dates[0], dates[-1]
+        if x_range is not None and None not in x_range:
+            # range values are epoch ms (Bokeh's datetime unit) once synced back from the browser
+            view_start, view_end = (
+                np.datetime64(int(value * 1e6), "ns")
+                if isinstance(value, int | float)
+                else np.datetime64(value, "ns")
+                for value in x_range
+            )
+            # only the visible part of the data counts, a range that doesn't overlap
+            # the data (e.g. the data was just replaced) is ignored
+            if view_start < end and view_end > start:
+                start, end = max(view_start, start), min(view_end, end)
+        span_ns = float((end - start) / np.timedelta64(1, "ns"))
+        max_bars = (width or DEFAULT_NUM_POINTS) // MIN_BAR_WIDTH
+        resolution = choose_resolution(infer_resolution(dates), span_ns, max_bars)
+        if resolution is not None:
+            resampled_df = resample_ohlc(df, resolution)
+            # hvplot's ohlc needs at least 2 bars
+            if len(resampled_df) >= 2:
+                df = resampled_df
+                dates = df["date"].to_numpy()
+        # keep one view's worth of bars on each side, so panning doesn't show empty space
+        # before the plot is rebuilt
+        margin = end - start
+        first = int(np.searchsorted(dates, start - margin, side="left"))
+        last = int(np.searchsorted(dates, end + margin, side="right"))
+        return df[first:last] if last - first >= 2 else df
+
+    def _get_stream_columns(self, df: nw.DataFrame[Any]) -> dict[str, Any]:
+        """Adds the columns hvplot's ohlc derives from df: the candle bounds
+        (lbound/ubound for the wicks, left/right/bottom/top for the bodies) and the body color.
+        """
+        columns = super()._get_stream_columns(df)
+        # streamed candles are as wide as the rendered ones, so only df (the new rows) is read,
+        # without it, the candle bounds are missing and the plot is re-rendered instead
+        if self._candle_half_width is None:
+            return columns
+        dates = columns["date"]
+        open_, close = columns["open"], columns["close"]
+        columns["lbound"] = columns["left"] = dates - self._candle_half_width
+        columns["ubound"] = columns["right"] = dates + self._candle_half_width
+        columns["bottom"], columns["top"] = open_, close
+        columns["color"] = np.where(
+            open_ > close, self._style["neg_color"], self._style["pos_color"]
+        ).tolist()
+        return columns
+
+    def _get_y_range_cols(self) -> list[str]:
+        return ["low", "high"]
+
     def _start_streaming(self):
         requests = cast("list[MarketFeedStreamRequest]", self._feed._requests)
-        assert all(
+        assert self._control.get("aggregate") is not None or all(
             cast("Resolution", request.target_resolution).is_bar()
             for request in requests
-        ), "candlestick streaming only supports bar data"
+        ), (
+            "candlestick streaming only supports bar data, use control(aggregate=...) to fold ticks into bars"
+        )
         super()._start_streaming()
@@ -49,10 +49,17 @@ def style(
 def control(
     num_data: int = DEFAULT_NUM_DATA,
     max_data: int | None = None,
+    aggregate: str | None = None,
     slider_step: int | None = None,
     linked_axes: bool = True,
+    resample_on_zoom: bool = False,
     update_interval: int = 5000,  # ms
+    min_update_interval: int | None = 200,  # ms
     incremental_update: bool = True,
+    incremental_render: bool = True,
+    backpressure: Literal["block", "drop_oldest", "conflate"] = "block",
+    max_queued_messages: int = 10_000,
+    ingest_process: bool = False,
     widgets: bool = True,
     datetime_precision: Literal["d", "s", "ms"] = "s",
 ):
@@ -61,11 +68,30 @@ def control(
         num_data: (DatetimeRangeWidget) initial number of most recent data points to display.
         max_data: (streaming) maximum number of data points kept in memory.
             If None, data will continue to grow unbounded.
+        aggregate: (streaming) resolution (e.g. "1s", "1m", "1h") to fold streamed ticks into OHLCV bars on the fly,
+            only the bars are kept (bounded by max_data) and the raw ticks are dropped. If None, every tick is kept.
         slider_step: (DatetimeRangeWidget) step size in ms for the datetime range slider.
             If None, derived from data resolution.
         linked_axes: whether to link axes across plots in a layout (plt.layout(...)).
-        update_interval: (streaming) interval in ms to update the plot. default is 5000 ms.
+        resample_on_zoom: whether to re-aggregate the bars to a coarser resolution (e.g. 1m -> 5m, 1h, 1d)
+            when the visible range holds more bars than fit into the plot's width, re-run on zooming/panning.
+            Zooming in restores the original resolution. default is False.
+        update_interval: (streaming) longest interval in ms between two updates of the plot while new data arrives. default is 5000 ms.
+        min_update_interval: (streaming) shortest interval in ms between two updates of the plot.
+            In between, the interval adapts to how often new data arrives and how long the plot takes to update,
+            and updates are skipped when no new data has arrived. If None, the plot is updated every update_interval ms. default is 200 ms.
         incremental_update: (streaming) whether to update even when the bar is incomplete. default is True.
+        incremental_render: (streaming) whether to only send the updated and newly added data points to the plot on refresh,
+            instead of re-rendering the whole plot. Falls back to a full re-render when the plot doesn't support it (e.g. downsampled). default is True.
+        backpressure: (streaming) what to do with the feed's messages once max_queued_messages are waiting to be written into the plot's data
+            (e.g. market-open bursts). "block": the feed waits for the plot to catch up, for at most update_interval,
+            then writes them itself, no message is lost. "drop_oldest": the oldest message is dropped.
+            "conflate": once the queue is full, only the latest update of each bar is kept, or the latest tick of each product, not supported with aggregate. default is "block".
+        max_queued_messages: (streaming) maximum number of messages waiting to be written into the plot's data, see backpressure.
+            The queue's depth and dropped messages can be monitored with get_ingest_metrics(). default is 10000.
+        ingest_process: (streaming) whether to run the feed, and the writing of its messages into the plot's data
+            (e.g. folding ticks into bars, computing indicators), in a separate process that publishes the rows into shared memory,
+            so that heavy feeds don't compete with the UI for the GIL. Requires cloudpickle. default is False.
         widgets: whether to show widgets. default is True.
             For granular control, use remove_widgets() to remove specific widget classes.
         datetime_precision: the precision of datetime formatting on the hover tooltip.
@@ -83,10 +109,12 @@ def plot(
     **kwargs: Any,
 ) -> Overlay:
     import hvplot
-    from bokeh.models import CrosshairTool
 
     from pfund_plot.plots.candlestick import Candlestick
-    from pfund_plot.utils.bokeh import create_bundled_hover_tool
+    from pfund_plot.utils.bokeh import (
+        create_bundled_hover_tool,
+        create_crosshair_tool,
+    )
 
     _ = hvplot.extension(PlottingBackend.bokeh)
 
@@ -106,7 +134,7 @@ def plot(
                 create_bundled_hover_tool(
                     df, date_col, value_cols, control["datetime_precision"]
                 ),
-                CrosshairTool(dimensions="height", line_color="gray", line_alpha=0.3),
+                create_crosshair_tool(),
             ],
             responsive=True,
             grid=style["grid"],
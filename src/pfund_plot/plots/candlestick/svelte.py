@@ -2,9 +2,10 @@
 from __future__ import annotations
 
 from pathlib import Path
-from typing import Any, Literal
+from typing import Any, ClassVar, Literal
 
 import narwhals as nw
+import numpy as np
 import traitlets
 from anywidget import AnyWidget
 
@@ -41,7 +42,7 @@ class CandlestickWidget(AnyWidget):
     # carrying only the keys the chart actually uses (e.g. total_height is a
     # Panel-layer concern and stays out). All are set in __init__, so no
     # default_value is needed.
-    data = traitlets.List().tag(sync=True)  # list of dicts with OHLC + time
+    data = traitlets.Dict().tag(sync=True)  # column name -> float64 buffer, OHLC + time
     style = traitlets.Dict().tag(sync=True)
     control = traitlets.Dict().tag(sync=True)
 
@@ -66,10 +67,16 @@ class CandlestickWidget(AnyWidget):
         self.control = {"datetime_precision": control["datetime_precision"]}
         self.update_data(df)
 
-    @staticmethod
-    def _format_data(df: nw.DataFrame[Any]) -> list[dict[str, Any]]:
+    # columns the chart uses, volume is optional (only shown in the tooltip)
+    _COLUMNS: ClassVar[list[str]] = ["time", "open", "high", "low", "close", "volume"]
+
+    @classmethod
+    def _format_data(cls, df: nw.DataFrame[Any]) -> dict[str, memoryview]:
         """
-        Convert dataframe to format supported by lightweight-charts,
+        Convert dataframe to columnar binary buffers, one contiguous float64 buffer per column,
+        e.g. { "time": <float64 bytes>, "open": <float64 bytes>, ... }
+        which ipywidgets sends as binary message buffers (no JSON encoding), and the frontend
+        reads as Float64Arrays and assembles into lightweight-charts' bars,
         e.g. [ { "open": 10, "high": 10.63, "low": 9.49, "close": 9.55, "time": 1642377600 } ]
 
         `time` is sent as a UNIX timestamp in seconds (UTCTimestamp). Stringifying
@@ -78,22 +85,36 @@ class CandlestickWidget(AnyWidget):
         onto a single point. Epoch seconds keep hourly/minute bars distinct and work
         for daily bars too. `dt.timestamp` yields the UTC epoch (naive datetimes are
         read as UTC wall-clock), which lightweight-charts renders back in UTC, so
-        input time == displayed time.
+        input time == displayed time. Epoch seconds are exact in float64, so all
+        columns share one dtype on the JS side.
         """
         if "date" in df.columns:
             # narwhals' dt.timestamp only goes down to milliseconds; floor to seconds.
             df = df.with_columns(time=nw.col("date").dt.timestamp("ms") // 1_000).drop(
                 "date"
             )
-        return df.rows(named=True)
+        return {
+            col: memoryview(np.ascontiguousarray(df[col].to_numpy(), dtype=np.float64))
+            for col in cls._COLUMNS
+            if col in df.columns
+        }
 
     def update_data(self, df: nw.DataFrame[Any]):
-        """Update the widget's data from a DataFrame"""
+        """Replace the widget's data with a DataFrame"""
         self.data = self._format_data(df)
 
     def append_data(self, new_df: nw.DataFrame[Any]):
-        """Append new data points for streaming"""
-        self.data += self._format_data(new_df)
+        """Send only the new data points for streaming, as a custom message with binary buffers.
+        The frontend applies each bar with lightweight-charts' update(), which replaces the
+        last bar if the time matches (i.e. an incomplete bar) or appends a new one.
+
+        NOTE: the appended bars are not written back to `data`, so a view created after
+        the appends (e.g. the cell is displayed again) starts from the last update_data().
+        """
+        data = self._format_data(new_df)
+        self.send(
+            {"type": "append", "columns": list(data)}, buffers=list(data.values())
+        )
 
 
 def style(
@@ -130,9 +151,15 @@ def style(
 def control(
     num_data: int = DEFAULT_NUM_DATA,
     max_data: int | None = None,
+    aggregate: str | None = None,
     slider_step: int | None = None,
     update_interval: int = 5000,  # ms
+    min_update_interval: int | None = 200,  # ms
     incremental_update: bool = True,
+    incremental_render: bool = True,
+    backpressure: Literal["block", "drop_oldest", "conflate"] = "block",
+    max_queued_messages: int = 10_000,
+    ingest_process: bool = False,
     widgets: bool = True,
     datetime_precision: Literal["d", "s"] = "s",
 ):
@@ -141,10 +168,26 @@ def control(
         num_data: (DatetimeRangeWidget) initial number of most recent data points to display.
         max_data: (streaming) maximum number of data points kept in memory.
             If None, data will continue to grow unbounded.
+        aggregate: (streaming) resolution (e.g. "1s", "1m", "1h") to fold streamed ticks into OHLCV bars on the fly,
+            only the bars are kept (bounded by max_data) and the raw ticks are dropped. If None, every tick is kept.
         slider_step: (DatetimeRangeWidget) step size in ms for the datetime range slider.
             If None, derived from data resolution.
-        update_interval: (streaming) interval in ms to update the plot. default is 5000 ms.
+        update_interval: (streaming) longest interval in ms between two updates of the plot while new data arrives. default is 5000 ms.
+        min_update_interval: (streaming) shortest interval in ms between two updates of the plot.
+            In between, the interval adapts to how often new data arrives and how long the plot takes to update,
+            and updates are skipped when no new data has arrived. If None, the plot is updated every update_interval ms. default is 200 ms.
         incremental_update: (streaming) whether to update even when the bar is incomplete. default is True.
+        incremental_render: (streaming) whether to only send the updated and newly added data points to the plot on refresh,
+            instead of re-sending all the data. default is True.
+        backpressure: (streaming) what to do with the feed's messages once max_queued_messages are waiting to be written into the plot's data
+            (e.g. market-open bursts). "block": the feed waits for the plot to catch up, for at most update_interval,
+            then writes them itself, no message is lost. "drop_oldest": the oldest message is dropped.
+            "conflate": once the queue is full, only the latest update of each bar is kept, or the latest tick of each product, not supported with aggregate. default is "block".
+        max_queued_messages: (streaming) maximum number of messages waiting to be written into the plot's data, see backpressure.
+            The queue's depth and dropped messages can be monitored with get_ingest_metrics(). default is 10000.
+        ingest_process: (streaming) whether to run the feed, and the writing of its messages into the plot's data
+            (e.g. folding ticks into bars, computing indicators), in a separate process that publishes the rows into shared memory,
+            so that heavy feeds don't compete with the UI for the GIL. Requires cloudpickle. default is False.
         widgets: whether to show widgets. default is True.
             For granular control, use remove_widgets() to remove specific widget classes.
         datetime_precision: the precision of datetime shown on the time axis / crosshair.
@@ -4,7 +4,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
+    import narwhals as nw
     from narwhals.typing import IntoFrame
+    from pfeed.feeds.market_feed import MarketFeed
+
+    from pfund_plot.sources.stream import StreamSource
 
 from pfund_plot.enums import PlottingBackend
 from pfund_plot.plots.plot import BasePlot
@@ -26,12 +30,13 @@ class LabelControl:
 
 class Label(BasePlot):
     SUPPORTED_BACKENDS: ClassVar[list[PlottingBackend]] = [PlottingBackend.bokeh]
+    SUPPORT_STREAMING: ClassVar[bool] = True
     style = LabelStyle
     control = LabelControl
 
     def __init__(
         self,
-        data: IntoFrame,
+        data: IntoFrame | MarketFeed | StreamSource,
         text: str,
         x: str | None = None,
         y: str | list[str] | None = None,
@@ -41,3 +46,13 @@ class Label(BasePlot):
         self._text = text
         super().__init__(data=data, x=x, y=y, name=name, **reactive_params)
         self._plot_kwargs["text"] = text
+
+    def _get_stream_columns(self, df: nw.DataFrame[Any]) -> dict[str, Any]:
+        from holoviews import Dimension
+
+        columns = super()._get_stream_columns(df)
+        # the text is formatted by HoloViews, e.g. 1 -> "1"
+        if self._text in columns:
+            pprint_value = Dimension(self._text).pprint_value
+            columns[self._text] = [pprint_value(value) for value in columns[self._text]]
+        return columns
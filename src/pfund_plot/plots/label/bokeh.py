@@ -46,13 +46,39 @@ def style(
 
 
 def control(
+    max_data: int | None = None,
     widgets: bool = True,
     linked_axes: bool = True,
+    update_interval: int = 5000,  # ms
+    min_update_interval: int | None = 200,  # ms
+    incremental_update: bool = True,
+    incremental_render: bool = True,
+    backpressure: Literal["block", "drop_oldest", "conflate"] = "block",
+    max_queued_messages: int = 10_000,
+    ingest_process: bool = False,
 ):
     """
     Args:
+        max_data: (streaming) maximum number of data points kept in memory.
+            If None, data will continue to grow unbounded.
         widgets: whether to show widgets. default is True.
         linked_axes: whether to link axes across plots in a layout (plt.layout(...)).
+        update_interval: (streaming) longest interval in ms between two updates of the plot while new data arrives. default is 5000 ms.
+        min_update_interval: (streaming) shortest interval in ms between two updates of the plot.
+            In between, the interval adapts to how often new data arrives and how long the plot takes to update,
+            and updates are skipped when no new data has arrived. If None, the plot is updated every update_interval ms. default is 200 ms.
+        incremental_update: (streaming) whether to update even when the bar is incomplete. default is True.
+        incremental_render: (streaming) whether to only send the updated and newly added data points to the plot on refresh,
+            instead of re-rendering the whole plot. Falls back to a full re-render when the plot doesn't support it (e.g. downsampled). default is True.
+        backpressure: (streaming) what to do with the feed's messages once max_queued_messages are waiting to be written into the plot's data
+            (e.g. market-open bursts). "block": the feed waits for the plot to catch up, for at most update_interval,
+            then writes them itself, no message is lost. "drop_oldest": the oldest message is dropped.
+            "conflate": once the queue is full, only the latest update of each bar is kept, or the latest tick of each product, not supported with aggregate. default is "block".
+        max_queued_messages: (streaming) maximum number of messages waiting to be written into the plot's data, see backpressure.
+            The queue's depth and dropped messages can be monitored with get_ingest_metrics(). default is 10000.
+        ingest_process: (streaming) whether to run the feed, and the writing of its messages into the plot's data
+            (e.g. folding ticks into bars, computing indicators), in a separate process that publishes the rows into shared memory,
+            so that heavy feeds don't compete with the UI for the GIL. Requires cloudpickle. default is False.
     """
     return locals()
 
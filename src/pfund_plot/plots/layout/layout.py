@@ -5,6 +5,9 @@ from typing import TYPE_CHECKING, ClassVar, Literal
 if TYPE_CHECKING:
     from pfund_plot.typing import RawFigure
 
+import time
+from concurrent.futures import ThreadPoolExecutor
+
 from pfund_kit.style import RichColor, TextStyle, cprint
 
 from pfund_plot.enums import PlottingBackend
@@ -40,6 +43,8 @@ class BaseLayout(BasePlot):
         Child plots inside Layout are never rendered directly — only Layout's
         renderer gets render() called. Without this, child streaming plots'
         periodic callbacks (e.g. _refresh_streaming_ui) would never start.
+        Their streaming refreshes are moved to Layout's RefreshScheduler,
+        so that all child plots share one frame budget.
         """
         assert self._renderer is not None, "renderer is not set"
         for lazyplot in self._plots:
@@ -47,6 +52,8 @@ class BaseLayout(BasePlot):
             assert plot._renderer is not None, f"{plot.name} renderer is not set"
             for cb in plot._renderer._periodic_callbacks:
                 self._renderer.add_periodic_callback(cb)
+            for entry in plot._renderer.streaming_refreshes:
+                self._renderer.add_streaming_refresh(entry)
 
     def is_streaming(self):
         return any(lazyplot.is_streaming for lazyplot in self._plots)
@@ -57,6 +64,11 @@ class BaseLayout(BasePlot):
             if plot.is_streaming():
                 plot._start_streaming()
 
+    def _stop_streaming(self):
+        super()._stop_streaming()
+        for lazyplot in self._plots:
+            lazyplot._plot._stop_streaming()
+
     def _wait_for_streaming_ready(self):
         for lazyplot in self._plots:
             plot = lazyplot._plot
@@ -106,8 +118,63 @@ class BaseLayout(BasePlot):
     def _create_pane(self):
         pass
 
+    def _get_eager_plots(self) -> list[BasePlot]:
+        """Child plots built when the layout is created."""
+        return [lazyplot._plot for lazyplot in self._plots]
+
+    def _build_plots(self):
+        """Build the child plots before the layout's component is created.
+
+        The expensive part that doesn't create any Panel/Bokeh models (collecting the data and
+        building the HoloViews plot, see BasePlot._prepare_plot()) runs concurrently in a thread pool,
+        only creating the panes, widgets and components is done one plot after another.
+        """
+        plots = [plot for plot in self._get_eager_plots() if plot._component is None]
+        # HoloViews plots are plain Python objects, the other backends create their models right away
+        concurrent_plots = [
+            plot for plot in plots if plot._backend == PlottingBackend.bokeh
+        ]
+        max_workers = self._control.get("max_workers")
+        prepare_times: dict[int, float] = {}
+
+        def _prepare(plot: BasePlot) -> float:
+            start = time.perf_counter()
+            _ = plot._prepare_plot()
+            return time.perf_counter() - start
+
+        if len(concurrent_plots) > 1 and max_workers != 1:
+            with ThreadPoolExecutor(
+                max_workers=max_workers, thread_name_prefix="pfund_plot-layout"
+            ) as executor:
+                for plot, duration in zip(
+                    concurrent_plots,
+                    executor.map(_prepare, concurrent_plots),
+                    strict=True,
+                ):
+                    prepare_times[id(plot)] = duration
+
+        timings: list[tuple[str, float | None, float]] = []
+        for plot in plots:
+            start = time.perf_counter()
+            plot._create()
+            timings.append(
+                (plot.name, prepare_times.get(id(plot)), time.perf_counter() - start)
+            )
+        if self._control.get("report_timings"):
+            lines = [
+                f"{i}. {name}: "
+                + (f"prepared in {prepare:.3f}s (concurrently), " if prepare else "")
+                + f"created in {create:.3f}s"
+                for i, (name, prepare, create) in enumerate(timings)
+            ]
+            cprint(
+                f"{self._class_name} built {len(timings)} plots:\n" + "\n".join(lines),
+                style=TextStyle.BOLD + RichColor.YELLOW,
+            )
+
     def _create_component(self):
         self._apply_linked_axes()
+        self._build_plots()
         self._component = self._plot_func(
             *self._plots,
             style=self._style,
@@ -22,7 +22,19 @@ def control(
     allow_drag: bool = True,
     allow_resize: bool = True,
     linked_axes: bool = True,
+    max_workers: int | None = None,
+    report_timings: bool = False,
 ):
+    """
+    Args:
+        num_cols: Number of columns of the grid when the plots have no grid_spec.
+        allow_drag: Whether the plots can be dragged around the grid.
+        allow_resize: Whether the plots can be resized.
+        linked_axes: Whether to link axes across plots.
+        max_workers: Number of threads preparing the plots concurrently (their data and HoloViews plots),
+            1 prepares them one after another. If None, ThreadPoolExecutor's default.
+        report_timings: Whether to print how long each plot took to be prepared and created.
+    """
     return locals()
 
 
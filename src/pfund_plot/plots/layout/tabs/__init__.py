@@ -6,6 +6,8 @@ from typing import TYPE_CHECKING
 if TYPE_CHECKING:
     from panel import Tabs as PanelTabs
 
+    from pfund_plot.plots.plot import BasePlot
+
 import importlib
 
 from pfund_plot.plots.layout.layout import BaseLayout
@@ -27,6 +29,12 @@ class Tabs(BaseLayout):
     style = TabsStyle
     control = TabsControl
 
+    def _get_eager_plots(self) -> list[BasePlot]:
+        # the other tabs are built when they are first activated
+        if self._control.get("lazy"):
+            return [lazyplot._plot for lazyplot in self._plots[:1]]
+        return super()._get_eager_plots()
+
     # tabs is not at the top level of plots, it's inside layout/tabs, so we need to override the _plot property
     @property
     def _plot_func(self) -> Callable[..., PanelTabs]:
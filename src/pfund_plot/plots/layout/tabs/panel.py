@@ -7,7 +7,7 @@ if TYPE_CHECKING:
     from pfund_plot.plots.lazy import LazyPlot
     from pfund_plot.typing import RawFigure
 
-from panel import Tabs
+from panel import Column, Tabs
 
 __all__ = ["control", "plot", "style"]
 
@@ -21,16 +21,28 @@ def style(
 
 def control(
     dynamic: bool = False,
+    lazy: bool = False,
+    pause_hidden: bool = False,
     closable: bool = False,
     position: Literal["above", "below", "left", "right"] = "above",
     linked_axes: bool = True,
+    max_workers: int | None = None,
+    report_timings: bool = False,
 ):
     """
     Args:
         dynamic: Dynamically populate only the active tab.
+        lazy: Only build a tab's plot (pane, widgets, etc.) when the tab is first activated,
+            so that startup only costs the first tab. Streaming plots of tabs not opened yet
+            keep receiving data, and are built with the latest data when their tab is activated.
+        pause_hidden: Pause the streaming updates of the plots in hidden tabs,
+            they catch up with the latest data when their tab is activated.
         closable: Whether it should be possible to close tabs.
         position: The location of the tabs relative to the tab contents.
         linked_axes: Whether to link axes across plots in different tabs.
+        max_workers: Number of threads preparing the plots concurrently (their data and HoloViews plots),
+            1 prepares them one after another. If None, ThreadPoolExecutor's default.
+        report_timings: Whether to print how long each plot took to be prepared and created.
     """
     return locals()
 
@@ -41,22 +53,61 @@ def plot(
     control: dict[str, Any],
     **kwargs: Any,
 ) -> Tabs:
-    # In the marimo + svelte combo the plot's component is a mo.vstack (see
-    # Candlestick._create_component), which carries no name, so Panel assigns a
-    # default tab label like "Column01805". Panel's Tabs accepts a (name, object)
-    # tuple to label a tab explicitly, so pass the plot's name in that case.
-    # Every other component is a pn.Column that already carries its own name.
-    items = [
-        (plot.name, plot.component)
-        if plot._plot._is_using_marimo_svelte_combo()
-        else plot.component
-        for plot in plots
-    ]
-    return Tabs(
-        *items,
+    # plots of the tabs that haven't been activated yet, keyed by their placeholder's id
+    pending: dict[int, LazyPlot] = {}
+    # plots keyed by the id of their tab's object
+    tab_plots: dict[int, LazyPlot] = {}
+
+    def _create_item(i: int, plot: LazyPlot) -> Any:
+        # In the marimo + svelte combo the plot's component is a mo.vstack (see
+        # Candlestick._create_component), which carries no name, so Panel assigns a
+        # default tab label like "Column01805". Panel's Tabs accepts a (name, object)
+        # tuple to label a tab explicitly, so pass the plot's name in that case.
+        # Every other component is a pn.Column that already carries its own name.
+        if plot._plot._is_using_marimo_svelte_combo():
+            return (plot.name, plot.component)
+        if control["lazy"] and i > 0:
+            placeholder = Column(name=plot._plot._get_component_name())
+            pending[id(placeholder)] = tab_plots[id(placeholder)] = plot
+            item = placeholder
+        else:
+            item = plot.component
+            tab_plots[id(item)] = plot
+        if control["pause_hidden"] and i > 0:
+            plot._plot._pause_streaming(True)
+        return item
+
+    tabs = Tabs(
+        *(_create_item(i, plot) for i, plot in enumerate(plots)),
         height=style["height"],
         width=style["width"],
         dynamic=control["dynamic"],
         closable=control["closable"],
         tabs_location=control["position"],
     )
+
+    def _on_active(event: Any) -> None:
+        objects = tabs.objects
+        # the previous tab may have been closed
+        if (
+            control["pause_hidden"]
+            and 0 <= event.old < len(objects)
+            and (plot := tab_plots.get(id(objects[event.old])))
+        ):
+            plot._plot._pause_streaming(True)
+        if not 0 <= event.new < len(objects):
+            return
+        obj = objects[event.new]
+        plot = tab_plots.get(id(obj))
+        if plot is None:
+            return
+        if pending.pop(id(obj), None) is not None:
+            component = plot.component
+            del tab_plots[id(obj)]
+            tab_plots[id(component)] = plot
+            tabs[event.new] = component
+        plot._plot._pause_streaming(False)
+
+    if pending or control["pause_hidden"]:
+        _ = tabs.param.watch(_on_active, "active")
+    return tabs
@@ -4,7 +4,9 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
-    from narwhals.typing import IntoFrame
+    from collections.abc import Mapping
+
+    from narwhals.typing import IntoDataFrame, IntoFrame
     from panel.io.server import Server
     from panel.pane import Pane
     from panel.viewable import Viewable
@@ -12,6 +14,8 @@ if TYPE_CHECKING:
 
     from pfund_plot.enums import DisplayMode, PlottingBackend
     from pfund_plot.plots.plot import BasePlot
+    from pfund_plot.sources.stream import StreamSource
+    from pfund_plot.streaming.ingest_queue import IngestMetrics
     from pfund_plot.typing import (
         Component,
         Figure,
@@ -159,6 +163,7 @@ class LazyPlot:
 
     @property
     def df(self) -> IntoFrame | None:
+        self._plot._collect_lazy_df()
         if self._plot._df is None:
             return None
         return self._plot._df.to_native()
@@ -167,6 +172,41 @@ class LazyPlot:
     def feed(self) -> MarketFeed | None:
         return self._plot._feed
 
+    @property
+    def stream_source(self) -> StreamSource | None:
+        return self._plot._stream_source
+
+    def _get_stream_source(self) -> StreamSource:
+        source = self._plot._stream_source
+        if source is None:
+            raise RuntimeError(
+                f"{self.name} is not streaming from a StreamSource, "
+                + "create the plot with one to push data into it, "
+                + "e.g. plt.line(StreamSource({'date': 'datetime64[ns]', 'pnl': 'float64'}), y='pnl')"
+            )
+        return source
+
+    def push(self, row: Mapping[str, Any]) -> None:
+        """Push a row into the plot's StreamSource, shown on the plot's next streaming refresh.
+
+        Thread-safe, rows can be pushed from any thread (e.g. a backtest or an OMS event handler).
+        Overlays have their own sources, push into them directly.
+
+        Example:
+            pnl = plt.line(StreamSource({'date': 'datetime64[ns]', 'pnl': 'float64'}), y='pnl')
+            pnl.push({'date': datetime.datetime.now(), 'pnl': 1.5})
+        """
+        self._get_stream_source().push(row)
+
+    def push_batch(self, data: Mapping[str, Any] | IntoDataFrame) -> None:
+        """Push a batch of rows into the plot's StreamSource in one vectorized append, see push().
+
+        Args:
+            data: one array-like (e.g. NumPy array) per column, or a dataframe
+                (e.g. a pyarrow Table, polars or pandas DataFrame) with the columns of the source.
+        """
+        self._get_stream_source().push_batch(data)
+
     def style(self, **kwargs) -> LazyPlot:
         """Configure style options.
 
@@ -203,6 +243,23 @@ class LazyPlot:
     def get_control(self) -> dict:
         return self._plot._control
 
+    def get_ingest_metrics(self) -> IngestMetrics | None:
+        """Returns the counters of the queue between the feed and the plot, see control(backpressure=...).
+
+        Example:
+            metrics = candlestick.get_ingest_metrics()
+            metrics.depth, metrics.max_depth, metrics.num_dropped
+        """
+        return self._plot.get_ingest_metrics()
+
+    def stop(self) -> None:
+        """Stops streaming, i.e. refreshing the plot and the ingest processes (see control(ingest_process=True)).
+
+        In notebook mode, nothing else stops the ingest processes until the kernel exits.
+        In server mode, streams are stopped when the sessions showing them are destroyed.
+        """
+        self._plot._stop_streaming()
+
     def backend(self, backend: PlottingBackend | str) -> LazyPlot:
         """Override backend for this plot only.
 
@@ -287,6 +344,9 @@ class LazyPlot:
 
         Use this when running with: panel serve myfile.py --show --autoreload
 
+        Every session runs myfile.py and so creates its own plot, streaming plots of
+        the same feed share one running stream across sessions (see StreamingHub).
+
         Args:
             title: Optional title for the browser tab
 
@@ -297,7 +357,13 @@ class LazyPlot:
             fig = plt.ohlc(df).backend('bokeh')
             fig.servable()
         """
-        return self.component.servable(title=title)
+        if self._plot.is_streaming():
+            self._plot._start_streaming()
+            self._plot._wait_for_streaming_ready()
+        component = self.component.servable(title=title)
+        # the periodic callbacks (e.g. streaming refresh) belong to the current session
+        self._plot._renderer.run_periodic_callbacks()
+        return component
 
     def _repr_mimebundle_(self, include=None, exclude=None) -> dict[str, Any]:
         """Auto-render in Jupyter/IPython notebooks.
@@ -355,8 +421,6 @@ class LazyPlot:
             candlestick * markers      # overlay markers on candlestick
             candlestick * volume_bars  # overlay volume on candlestick
         """
-        from copy import deepcopy
-
         if not isinstance(other, LazyPlot):
             raise TypeError(f"Cannot overlay {type(other).__name__} onto a plot.")
 
@@ -370,13 +434,14 @@ class LazyPlot:
             raise RuntimeError("Cannot overlay plots with different backends.")
         if other_plot._mode != current_plot._mode:
             raise RuntimeError("Cannot overlay plots with different modes.")
-        # NOTE: deepcopy both plots so the originals are not mutated —
+        # NOTE: clone both plots so the originals are not mutated —
         # conceptually the result is a new plot instance that carries its own _overlays list.
         # The overlay must also be cloned so that _parent_plot doesn't get shared
         # when the same overlay is reused across multiple compositions.
+        # Clones share the (immutable) dataframes, so memory stays flat as the chain grows.
         try:
-            cloned_plot = deepcopy(self._plot)
-            cloned_plot._add_overlay(deepcopy(other._plot))
+            cloned_plot = current_plot._clone()
+            cloned_plot._add_overlay(other_plot._clone())
         except (RuntimeError, AttributeError, TypeError) as e:
             raise RuntimeError(
                 "Cannot overlay a plot that has already been rendered. "
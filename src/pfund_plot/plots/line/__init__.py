@@ -4,6 +4,7 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, ClassVar
 
 if TYPE_CHECKING:
+    from pfund_plot.utils.datashader import RasterGlyph
     from pfund_plot.widgets.base import BaseStreamingWidget, BaseWidget
 
 from pfund_plot.enums import PlottingBackend
@@ -28,6 +29,7 @@ class LineControl:
 
 class Line(BasePlot):
     SUPPORTED_BACKENDS: ClassVar[list[PlottingBackend]] = [PlottingBackend.bokeh]
+    RASTER_GLYPH: ClassVar[RasterGlyph] = "line"
     SUPPORT_STREAMING: ClassVar[bool] = True
     SUPPORTED_WIDGETS: ClassVar[list[type[BaseWidget]]] = [DatetimeRangeWidget]
     SUPPORTED_STREAMING_WIDGETS: ClassVar[list[type[BaseStreamingWidget]]] = [
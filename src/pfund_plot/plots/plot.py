@@ -1,10 +1,11 @@
 # pyright: reportAttributeAccessIssue=false, reportOptionalMemberAccess=false, reportConstantRedefinition=false, reportUnusedParameter=false, reportUnknownVariableType=false, reportUnknownMemberType=false, reportUnknownArgumentType=false
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from typing import TYPE_CHECKING, Any, ClassVar, Literal, TypeAlias, cast
 
 if TYPE_CHECKING:
+    import numpy as np
     from anywidget import AnyWidget
     from holoviews.streams import Pipe
     from narwhals.typing import IntoFrame
@@ -17,6 +18,11 @@ if TYPE_CHECKING:
 
     from pfund_plot.plots.lazy import LazyPlot
     from pfund_plot.renderers.base import BaseRenderer
+    from pfund_plot.sources.stream import StreamSource
+    from pfund_plot.streaming.hub import StreamKey
+    from pfund_plot.streaming.ingest_queue import IngestMetrics, IngestQueue
+    from pfund_plot.streaming.ingest_worker import IngestWorker
+    from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
     from pfund_plot.typing import (
         Component,
         Control,
@@ -26,14 +32,18 @@ if TYPE_CHECKING:
         RenderedResult,
         Style,
     )
+    from pfund_plot.utils.bokeh import ToolCache
+    from pfund_plot.utils.datashader import RasterGlyph
+    from pfund_plot.utils.render_scheduler import RenderScheduler
 
     MessageKey: TypeAlias = tuple[ProductName, ResolutionRepr]
-    StreamingDfs: TypeAlias = dict[MessageKey, Any]  # MessageKey -> nw.DataFrame
+    StreamingBuffers: TypeAlias = dict[MessageKey, ColumnarRingBuffer]
 
 import asyncio
 import importlib
 import time
-from threading import Thread
+from threading import Lock
+from weakref import WeakSet
 
 import narwhals as nw
 import panel as pn
@@ -52,6 +62,48 @@ class BasePlot:
     SUPPORT_STREAMING: ClassVar[bool] = False
     SUPPORTED_WIDGETS: ClassVar[list[type[BaseWidget]] | None] = None
     SUPPORTED_STREAMING_WIDGETS: ClassVar[list[type[BaseStreamingWidget]] | None] = None
+    # how data points are drawn when rasterized (control(rasterize=...)), None if not supported
+    RASTER_GLYPH: ClassVar[RasterGlyph | None] = None
+    # whether the first row written into a new streaming buffer is a dummy row, see StreamingMarketFeedMixin
+    _HAS_DUMMY_ROW: ClassVar[bool] = False
+    # attributes shared by a plot and its clones instead of being copied, see _clone()
+    _SHARED_ATTRS: ClassVar[frozenset[str]] = frozenset(
+        {"_df", "_lazy_df", "_feed", "_stream_source", "_reactive_callback"}
+    )
+    # attributes derived from the data, reset in clones and recreated lazily, see _clone()
+    _DERIVED_ATTRS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "_parent_plot",  # set when the parent is rendered
+            "_plot",
+            "_prebuilt_plot",
+            "_render_scheduler",
+            "_bokeh_tools",
+            "_widgets",
+            "_reactive_widgets",
+        }
+    )
+    # attributes bound to this process (rendering, streaming state), left out of the copy
+    # sent to the ingest process, see _clone_for_ingest()
+    _PROCESS_LOCAL_ATTRS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "_reactive_params",
+            "_reactive_widgets",
+            "_anywidget",
+            "_pane",
+            "_component",
+            "_overlays",
+            "_renderer",
+            "_streaming_widgets",
+            "_streaming_pipe",
+            "_rendered_plots",
+            "_streaming_buffers",
+            "_streaming_lock",
+            "_ingest_queue",
+            "_ingest_streaming",
+            "_ingest_worker",
+            "_stream_key",
+        }
+    )
     _ChosenWidgetClasses: ClassVar[list[type[BaseWidget]]] = []
     _ChosenStreamingWidgetClasses: ClassVar[list[type[BaseStreamingWidget]]] = []
     # Wrapper class like CandlestickStyle, used to access the style() function based on backend
@@ -84,7 +136,24 @@ class BasePlot:
             return cls
         from pfeed.feeds.base_feed import BaseFeed
 
-        if isinstance(data, BaseFeed):
+        from pfund_plot.sources.stream import StreamSource
+
+        if isinstance(data, StreamSource):
+            from pfund_plot.mixins.streaming_market_feed_mixin import (
+                StreamingMarketFeedMixin,
+            )
+            from pfund_plot.mixins.streaming_source_mixin import StreamingSourceMixin
+
+            # e.g. candlestick, which is built for market data messages
+            if StreamingMarketFeedMixin in cls.__mro__:
+                raise ValueError(f"{cls.__name__} only supports streaming market feeds")
+            if StreamingSourceMixin not in cls.__mro__:
+                return type(
+                    cls.__name__,
+                    (StreamingSourceMixin, cls),
+                    {"__module__": cls.__module__},
+                )
+        elif isinstance(data, BaseFeed):
             from pfeed.feeds.market_feed import MarketFeed
 
             if isinstance(data, MarketFeed):
@@ -113,6 +182,55 @@ class BasePlot:
             setattr(new, k, deepcopy(v, memo))
         return new
 
+    def __reduce__(self) -> tuple[Any, ...]:
+        # bypass __new__ which would call __init__ and wrap in LazyPlot, e.g. when unpickled by the IngestWorker
+        return object.__new__, (type(self),), self.__dict__
+
+    def _clone(self) -> BasePlot:
+        """Returns a copy-on-write copy of the plot, used for overlay composition (see LazyPlot.__mul__).
+
+        The data (attributes in _SHARED_ATTRS) is shared instead of copied, it is never
+        mutated in place, only replaced (e.g. in _update_df()). Mutable configuration
+        (style, control, opts, etc.) is deep-copied, overlays are cloned recursively,
+        and objects derived from the data (plot, widgets) are reset to be recreated lazily.
+        """
+        from copy import deepcopy
+
+        if self._pane is not None or self._component is not None:
+            raise RuntimeError(f"{self._class_name} has already been rendered")
+        cls = type(self)
+        # bypass __new__ which would call __init__ and wrap in LazyPlot
+        new = object.__new__(cls)
+        memo: dict[int, Any] = {id(self): new}
+        for k, v in self.__dict__.items():
+            if k in self._SHARED_ATTRS:
+                setattr(new, k, v)
+            elif k in self._DERIVED_ATTRS:
+                setattr(new, k, {} if isinstance(v, dict) else None)
+            elif k == "_overlays":
+                setattr(new, k, [overlay._clone() for overlay in v])
+            else:
+                setattr(new, k, deepcopy(v, memo))
+        return new
+
+    def _clone_for_ingest(self) -> BasePlot:
+        """Returns a copy of the plot without its data and the state bound to this process,
+        i.e. only what writing the feed's messages into the streaming buffers needs, see IngestWorker.
+        """
+        cls = type(self)
+        new = object.__new__(cls)
+        excluded_attrs = (
+            self._SHARED_ATTRS | self._DERIVED_ATTRS | self._PROCESS_LOCAL_ATTRS
+        )
+        for k, v in self.__dict__.items():
+            if k not in excluded_attrs:
+                setattr(new, k, v)
+            elif isinstance(v, dict):
+                setattr(new, k, {})
+            else:
+                setattr(new, k, None)
+        return new
+
     def __init_subclass__(cls, **kwargs: Any) -> None:
         super().__init_subclass__(**kwargs)
         class_name = cls.__name__
@@ -135,7 +253,7 @@ class BasePlot:
 
     def __init__(
         self,
-        data: IntoFrame | MarketFeed | None = None,
+        data: IntoFrame | MarketFeed | StreamSource | None = None,
         x: str | None = None,
         y: str | list[str] | None = None,
         callback: Callable[..., Any] | None = None,
@@ -145,7 +263,9 @@ class BasePlot:
     ):
         """
         Args:
-            data: The dataframe for static plot or pfeed's feed object for streaming plot
+            data: The dataframe for static plot or pfeed's feed object for streaming plot.
+                Can also be a MemoryMappedSource, to plot a memory-mapped Arrow IPC or Parquet file,
+                or a StreamSource, to stream the rows pushed to it.
             x: the column name of the x-axis, if None, will use the index or the first column of the dataframe
             y: the column name of the y-axis, if None, will plot all numeric columns of the dataframe
             callback: A reactive callback function. When provided with **reactive_params,
@@ -160,13 +280,26 @@ class BasePlot:
         from pfeed.feeds.base_feed import BaseFeed
         from pfund_kit.utils import get_notebook_type
 
-        # check if data is a dataframe or a feed
-        if not isinstance(data, BaseFeed):
-            self._df: nw.DataFrame[Any] = data
-            self._feed: MarketFeed | None = None
-        else:
+        from pfund_plot.sources.memory_mapped import MemoryMappedSource
+        from pfund_plot.sources.stream import StreamSource
+
+        if isinstance(data, MemoryMappedSource):
+            data = data.to_native()
+        self._stream_source: StreamSource | None = None
+        # check if data is a dataframe, a feed or a stream source
+        if isinstance(data, BaseFeed):
             self._df: nw.DataFrame[Any] | None = None
             self._feed: MarketFeed | None = data
+        elif isinstance(data, StreamSource):
+            self._df: nw.DataFrame[Any] | None = None
+            self._feed: MarketFeed | None = None
+            self._stream_source = data
+        else:
+            self._df: nw.DataFrame[Any] = data
+            self._feed: MarketFeed | None = None
+        # the data if it is a lazy frame (e.g. polars' scan_parquet), kept lazy so that only
+        # the rows shown are collected into self._df, see _collect_lazy_df()
+        self._lazy_df: nw.LazyFrame[Any] | None = None
         self.name: str = name or self._class_name
         self._reactive_params: dict[str, Any] = reactive_params
         self._reactive_callback: Callable[..., Any] | None = callback
@@ -175,8 +308,13 @@ class BasePlot:
         self._x: str | None = x
         self._y: str | list[str] | None = y
         if self._df is not None:
-            self._df = self._standardize_df(self._df)
-            self._x = self._derive_x_col(self._df, self._x)
+            df = nw.from_native(self._df)
+            if isinstance(df, nw.LazyFrame):
+                self._lazy_df, self._df = self._standardize_lazy_df(df), None
+                self._x = self._derive_x_col(self._lazy_df, self._x)
+            else:
+                self._df = self._standardize_df(df)
+                self._x = self._derive_x_col(self._df, self._x)
         self._plot_kwargs: dict[str, Any] = plot_kwargs or {}
         self._pane_kwargs: dict[str, Any] = {}
         self._anywidget: AnyWidget | None = None
@@ -184,9 +322,38 @@ class BasePlot:
         self._pane: Pane | None = None
         self._widgets: dict[type[BaseWidget], BaseWidget] = {}
         self._active_msg_key: MessageKey | None = None
-        self._streaming_dfs: dict[MessageKey, nw.DataFrame[Any]] = {}
+        self._streaming_buffers: StreamingBuffers = {}
+        # messages received from the feed, written into the streaming buffers in batches,
+        # created when streaming starts (see _create_ingest_queue()), the stream writer's if shared
+        self._ingest_queue: IngestQueue[StreamingMessage] | None = None
+        # runs the feed in a separate process with control(ingest_process=True)
+        self._ingest_worker: IngestWorker | None = None
+        # created when streaming starts, Lock can't be deep-copied by _clone()
+        self._streaming_lock: Lock | None = None
+        # writes the queued messages into the streaming buffers, the stream writer's if shared
+        self._ingest_streaming: Callable[[], None] | None = None
         self._streaming_pipe: Pipe | None = None
-        self._streaming_thread: Thread | None = None
+        # row id (see ColumnarRingBuffer) of the first row of self._df during streaming
+        self._df_row_id: int = 0
+        # row id one past the last row sent to the rendered plot, None if the plot's data
+        # didn't come from the streaming refresh (e.g. filtered by a widget)
+        self._streamed_row_id: int | None = None
+        # set while the plot is hidden (e.g. in an inactive tab), see _pause_streaming()
+        self._is_streaming_paused = False
+        # version (see _get_streaming_version()) of the data last shown by the pane and widgets
+        self._rendered_version: tuple[MessageKey | None, int] | None = None
+        # key of the stream subscribed to in the StreamingHub, see _subscribe_to_stream()
+        self._stream_key: StreamKey | None = None
+        # coalesces widget-driven re-renders, see _schedule_update_pane()
+        self._render_scheduler: RenderScheduler | None = None
+        # (df, plot) built off the event loop by the render scheduler,
+        # returned by the DynamicMap instead of rebuilding the plot when it receives df
+        self._prebuilt_plot: tuple[nw.DataFrame[Any], Plot] | None = None
+        # hover/crosshair tools reused by every _build_plot(), see utils.bokeh.cache_tools()
+        self._bokeh_tools: ToolCache = {}
+        # HoloViews plots rendering this plot's own glyphs (i.e. not its overlays'), in every
+        # rendered root, which the streaming data is sent to, see _track_rendered_plots()
+        self._rendered_plots: WeakSet[Any] = WeakSet()
         self._streaming_widgets: dict[
             type[BaseStreamingWidget], BaseStreamingWidget
         ] = {}
@@ -232,12 +399,22 @@ class BasePlot:
     def _class_name(self) -> str:
         return self.__class__.__name__.lower()
 
+    @staticmethod
+    def _find_date_col(columns: list[str]) -> str | None:
+        """Returns the date-like column (case-insensitive), if any."""
+        col_lookup = {col.lower(): col for col in columns}
+        for alias in ("date", "datetime", "timestamp"):
+            if alias in col_lookup:
+                return col_lookup[alias]
+        return None
+
     def _standardize_df(self, df: IntoFrame) -> nw.DataFrame[Any]:
         import datetime
 
         df = nw.from_native(df)
         if isinstance(df, nw.LazyFrame):
-            df = df.collect()
+            # push the column projection and conversions down into the query before collecting
+            df = self._project_lazy_df(self._standardize_lazy_df(df)).collect()
 
         if self.REQUIRED_COLS:
             missing_cols = [col for col in self.REQUIRED_COLS if col not in df.columns]
@@ -245,12 +422,7 @@ class BasePlot:
                 raise ValueError(f"Missing required columns: {missing_cols}")
 
         # find a date-like column (case-insensitive) and ensure it's a proper datetime type
-        col_lookup = {col.lower(): col for col in df.columns}
-        date_col: str | None = None
-        for alias in ("date", "datetime", "timestamp"):
-            if alias in col_lookup:
-                date_col = col_lookup[alias]
-                break
+        date_col = self._find_date_col(df.columns)
         if date_col is not None and df.shape[0] > 0:
             date_value = df.select(date_col).row(0)[0]
             if not isinstance(date_value, datetime.datetime):
@@ -272,6 +444,77 @@ class BasePlot:
                 )
         return df
 
+    def _standardize_lazy_df(self, df: nw.LazyFrame[Any]) -> nw.LazyFrame[Any]:
+        """Same as _standardize_df() without collecting the lazy frame,
+        i.e. based on its schema, the conversions are added to the query.
+        """
+        schema = df.collect_schema()
+        if self.REQUIRED_COLS:
+            missing_cols = [col for col in self.REQUIRED_COLS if col not in schema]
+            if missing_cols:
+                raise ValueError(f"Missing required columns: {missing_cols}")
+
+        date_col = self._find_date_col(schema.names())
+        if date_col is not None:
+            date_dtype = schema[date_col]
+            if date_dtype == nw.String:
+                df = df.with_columns(nw.col(date_col).str.to_datetime(format=None))
+            elif not isinstance(date_dtype, nw.Datetime):
+                raise TypeError(
+                    f"Column '{date_col}' cannot be converted to datetime (got {date_dtype})"
+                )
+            # normalize to naive UTC — Panel/Bokeh widgets don't handle tz-aware datetimes consistently
+            elif date_dtype.time_zone is not None:
+                df = df.with_columns(
+                    nw.col(date_col)
+                    .dt.convert_time_zone("UTC")
+                    .dt.replace_time_zone(None)
+                )
+        return df
+
+    def _project_lazy_df(self, df: nw.LazyFrame[Any]) -> nw.LazyFrame[Any]:
+        """Selects only the columns used by the plot, so that the others are never read.
+
+        The columns are the required, optional, date, x and y columns and the ones referenced
+        in plot_kwargs (e.g. text="..."). If y is None, all columns are plotted (see _derive_y_cols()),
+        so nothing is projected away unless the plot has REQUIRED_COLS.
+        """
+        columns = df.collect_schema().names()
+        if self._y is None and not self.REQUIRED_COLS:
+            return df
+        used_cols = {
+            *(self.REQUIRED_COLS or []),
+            *self.OPTIONAL_COLS,
+            self._find_date_col(columns),
+            self._x,
+        }
+        used_cols.update([self._y] if isinstance(self._y, str) else self._y or [])
+        for value in self._plot_kwargs.values():
+            if isinstance(value, str):
+                used_cols.add(value)
+            elif isinstance(value, list | tuple):
+                used_cols.update(v for v in value if isinstance(v, str))
+        return df.select([col for col in columns if col in used_cols])
+
+    def _collect_lazy_df(self) -> None:
+        """Collects the rows of the lazy source shown initially into self._df, if not collected yet.
+
+        Only the columns used by the plot are read, and only the last `num_data` rows when the
+        DatetimeRangeWidget is active, which collects the rows of the selected range from the
+        lazy source itself on every range change.
+        """
+        if self._lazy_df is None or self._df is not None:
+            return
+        self._lazy_df = self._project_lazy_df(self._lazy_df)
+        df = self._lazy_df
+        if (
+            self._control
+            and self._control.get("num_data") is not None
+            and self._widgets_enabled()
+        ):
+            df = df.tail(self._control["num_data"])
+        self._df = df.collect()
+
     def _widgets_enabled(self) -> bool:
         """Whether interactive widgets are active for this plot."""
         from pfund_plot.config import get_config
@@ -293,17 +536,25 @@ class BasePlot:
         if not self._widgets_enabled():
             return
 
+        from pfund_plot.config import load_panel_extensions
+
+        # widgets can be built before the plot (e.g. LazyPlot.widgets), they need pn.config.throttled
+        load_panel_extensions(self._backend)
+        self._collect_lazy_df()
         for WidgetClass in self._ChosenWidgetClasses:
             if WidgetClass not in self._widgets and _has_required_cols(WidgetClass):
                 self._widgets[WidgetClass] = WidgetClass(
-                    self._df, self._control, self._update_pane
+                    self._df,
+                    self._control,
+                    self._schedule_update_pane,
+                    lazy_df=self._lazy_df,
                 )
 
         if self.is_streaming():
             for WidgetClass in self._ChosenStreamingWidgetClasses:
                 if WidgetClass not in self._streaming_widgets:
                     self._streaming_widgets[WidgetClass] = WidgetClass(
-                        self._streaming_dfs,
+                        self._streaming_buffers,
                         self._active_msg_key,
                         self._update_active_stream,
                     )
@@ -314,7 +565,7 @@ class BasePlot:
         for widget in self._widgets.values():
             widget.update_df(df)
         for widget in self._streaming_widgets.values():
-            widget.update_streaming_state(self._streaming_dfs)
+            widget.update_streaming_state(self._streaming_buffers)
 
     def _append_toolbox(
         self,
@@ -474,6 +725,9 @@ class BasePlot:
         """Create Panel widgets from reactive params. Binding is deferred to _attach_reactive_widgets."""
         if not self._reactive_params:
             return
+        from pfund_plot.config import load_panel_extensions
+
+        load_panel_extensions(self._backend)
         for name, value in self._reactive_params.items():
             self._reactive_widgets[name] = self._infer_widget(name, value)
 
@@ -485,13 +739,14 @@ class BasePlot:
         widgets = self._reactive_widgets
         overlays = self._overlays
 
-        def on_change(*events: Any) -> None:
+        def fetch() -> tuple[nw.DataFrame[Any], dict[BasePlot, nw.DataFrame[Any]]]:
+            """Runs the callbacks, off the event loop (see RenderScheduler)."""
             kwargs = {name: w.value for name, w in widgets.items()}
             df = callback(**kwargs)
             df = self._standardize_df(df)
-            self._update_df(df)
 
             # Fan out merged params to overlays
+            overlay_dfs: dict[BasePlot, nw.DataFrame[Any]] = {}
             if merged_params:
                 for overlay in overlays:
                     if overlay._reactive_callback is not None:
@@ -503,11 +758,21 @@ class BasePlot:
                             if p in overlay_kwargs:
                                 overlay_kwargs[p] = widgets[p].value
                         overlay_df = overlay._reactive_callback(**overlay_kwargs)
-                        overlay_df = overlay._standardize_df(overlay_df)
-                        overlay._update_df(overlay_df)
+                        overlay_dfs[overlay] = overlay._standardize_df(overlay_df)
+            return df, overlay_dfs
 
+        def apply(
+            result: tuple[nw.DataFrame[Any], dict[BasePlot, nw.DataFrame[Any]]],
+        ) -> None:
+            df, overlay_dfs = result
+            self._update_df(df)
+            for overlay, overlay_df in overlay_dfs.items():
+                overlay._update_df(overlay_df)
             self._update_pane(df)
 
+        def on_change(*events: Any) -> None:
+            self._get_render_scheduler().submit(fetch, apply)
+
         for widget in widgets.values():
             _ = widget.param.watch(on_change, "value")
 
@@ -595,35 +860,47 @@ class BasePlot:
     def _update_active_stream(self, msg_key: MessageKey) -> None:
         """Switch which streaming product is displayed."""
         self._active_msg_key = msg_key
-        if msg_key in self._streaming_dfs:
-            df = self._streaming_dfs[msg_key]
-            self._update_df(df)
+        if msg_key in self._streaming_buffers:
+            self._rendered_version = self._get_streaming_version()
+            self._sync_streaming_df()
+            df = self._df
             self._update_pane(df)
             # Update other widgets (e.g. datetime range) for the new product's data
             for widget in self._widgets.values():
                 widget.update_df(df)
 
-    def _update_streaming_df(self, msg_key: MessageKey, df: nw.DataFrame[Any]):
-        # if exceeds max_data, truncate the dataframe
-        df = self._truncate_streaming_df(df)
-        self._streaming_dfs[msg_key] = df
-        # update the data reference if the received message key is the active key
-        if msg_key == self._active_msg_key:
+    def _sync_streaming_df(self) -> None:
+        """Point self._df at a zero-copy snapshot of the active stream's buffer."""
+        self._flush_streaming_messages()
+        if self._active_msg_key is None and self._streaming_buffers:
+            # subscribers of a shared stream (see StreamingHub) don't receive its messages
+            self._active_msg_key = next(iter(self._streaming_buffers))
+        buffer = self._streaming_buffers.get(self._active_msg_key)
+        if buffer is not None:
+            df, self._df_row_id = buffer.read_frame()
+            if self._x is None:
+                # only derived from static data in __init__, streaming data always has a "date" column
+                self._x = self._derive_x_col(df, None)
             self._update_df(df)
 
+    def _get_component_name(self) -> str:
+        """Name of the component, used e.g. as the tab label in plt.tabs."""
+        # `title` is always present in the style dict (defaults to ""), so
+        # `.get("title", self.name)` would never fall back. Treat an empty
+        # title as "no title" so the component name falls back to the
+        # plot's name, e.g. "line".
+        if self._style:
+            return self._style.get("title") or self.name
+        return self.name
+
     def _create_component(self) -> None:
         if self._style:
             height = self._style.get("total_height")
             width = self._style.get("width")
-            # `title` is always present in the style dict (defaults to ""), so
-            # `.get("title", self.name)` would never fall back. Treat an empty
-            # title as "no title" so the component name (used as the tab label
-            # in plt.tabs) falls back to the plot's name, e.g. "line".
-            name = self._style.get("title") or self.name
         else:
             height = None
             width = None
-            name = self.name
+        name = self._get_component_name()
         self._component = pn.Column(
             self._pane,
             name=name,
@@ -659,11 +936,22 @@ class BasePlot:
         return cls.SUPPORT_STREAMING
 
     def is_streaming(self):
-        return self.is_support_streaming() and self._feed is not None
+        return self.is_support_streaming() and (
+            self._feed is not None or self._stream_source is not None
+        )
 
     def is_in_notebook_mode(self) -> bool:
         return self._mode == DisplayMode.notebook
 
+    def get_ingest_metrics(self) -> IngestMetrics | None:
+        """Returns the counters (e.g. queue depth, dropped messages) of the queue between the feed and the plot,
+        None if the plot is not streaming from a feed, hasn't started streaming yet,
+        or its feed runs in a separate process (control(ingest_process=True)).
+        """
+        if self._ingest_queue is None:
+            return None
+        return self._ingest_queue.metrics
+
     @staticmethod
     def _derive_y_cols(
         df: nw.DataFrame[Any], x: str | None, y: str | list[str] | None
@@ -694,18 +982,20 @@ class BasePlot:
 
         from pfund_plot.utils import import_hvplot_df_module, match_df_with_data_tool
 
+        is_streaming_data = self._feed is not None or self._stream_source is not None
         if self.REQUIRED_DATA:
-            assert self._df is not None or self._feed is not None, (
-                f"{self._class_name} requires either a dataframe or a feed"
+            assert self._df is not None or is_streaming_data, (
+                f"{self._class_name} requires either a dataframe, a feed or a stream source"
             )
 
         if self._df is not None:
             import_hvplot_df_module(match_df_with_data_tool(self._df))
 
-        if self.is_streaming() and self.REQUIRED_DATA:
+        if is_streaming_data and self.REQUIRED_DATA:
             assert self.SUPPORT_STREAMING, (
                 f"{self._class_name} does not support streaming"
             )
+        if self._feed is not None and self.REQUIRED_DATA:
             if not isinstance(self._feed, StreamingFeedMixin):
                 raise ValueError(
                     "feed must be a pfeed's Feed object that supports streaming"
@@ -720,11 +1010,14 @@ class BasePlot:
             assert self._reactive_callback is not None, (
                 "callback is required when reactive_params are provided"
             )
-            assert self._feed is None, (
-                "reactive params are not supported with streaming feed"
+            assert not is_streaming_data, (
+                "reactive params are not supported with streaming data"
             )
 
     def _create(self):
+        from pfund_plot.config import load_panel_extensions
+
+        load_panel_extensions(self._backend)
         if self._pane is None:
             self._create_pane()
         if not self._widgets:
@@ -738,7 +1031,7 @@ class BasePlot:
             self._attach_reactive_widgets()
 
     def _add_periodic_callback(self, callback: Callable[..., Any]):
-        """Add a periodic callback to the renderer.
+        """Add a periodic callback to the renderer (the parent's if this plot is an overlay).
         Args:
             periodic_callback: The periodic callback to add.
                 it is created by `panel.state.add_periodic_callback`.
@@ -748,65 +1041,418 @@ class BasePlot:
             period=self._control["update_interval"],  # in ms
             start=False,
         )
-        self._renderer.add_periodic_callback(periodic_callback)
+        self._get_root_plot()._renderer.add_periodic_callback(periodic_callback)
+
+    def _add_streaming_refresh(self):
+        """Refresh the streaming plot at an interval adapted to its data arrival rate and refresh cost,
+        or every update_interval ms if control["min_update_interval"] is None.
+        """
+        from pfund_plot.utils.refresh_scheduler import RefreshEntry
+
+        min_update_interval = self._control.get("min_update_interval")
+        if min_update_interval is None:
+            self._add_periodic_callback(self._refresh_streaming_ui)
+            return
+        # overlays are refreshed by the renderer of the plot they are composited into
+        self._get_root_plot()._renderer.add_streaming_refresh(
+            RefreshEntry(
+                refresh=self._refresh_streaming_ui,
+                get_version=self._get_streaming_version,
+                min_interval=min(min_update_interval, self._control["update_interval"]),
+                max_interval=self._control["update_interval"],
+            )
+        )
+
+    def _get_streaming_version(self) -> tuple[MessageKey | None, int]:
+        """Returns a value that changes whenever the data of the active stream changes."""
+        self._flush_streaming_messages()
+        buffer = self._streaming_buffers.get(self._active_msg_key)
+        return self._active_msg_key, buffer.version if buffer is not None else -1
 
     def _on_streaming_callback(self, msg: StreamingMessage) -> StreamingMessage:
         raise NotImplementedError(f"{self._class_name} does not support streaming")
 
     def _is_streaming_ready(self) -> bool:
-        return bool(self._streaming_dfs)
+        self._flush_streaming_messages()
+        return bool(self._streaming_buffers)
 
-    def _create_streaming_row(self, msg: StreamingMessage) -> nw.DataFrame[Any]:
+    def _ingest_streaming_messages(self) -> None:
         raise NotImplementedError(f"{self._class_name} does not support streaming")
 
-    def _create_streaming_df(
-        self, msg_key: MessageKey, msg: StreamingMessage
-    ) -> nw.DataFrame[Any]:
+    def _flush_streaming_messages(self) -> None:
+        """Brings the streaming buffers up to date with the messages received so far."""
+        if self._ingest_streaming is not None:
+            self._ingest_streaming()
+
+    def _create_streaming_row(self, msg: StreamingMessage) -> tuple[Any, ...]:
         raise NotImplementedError(f"{self._class_name} does not support streaming")
 
-    def _truncate_streaming_df(self, df: nw.DataFrame[Any]) -> nw.DataFrame[Any]:
-        assert self._control is not None, "control is not set"
-        max_data = self._control["max_data"]
-        if max_data and df.shape[0] > max_data:
-            df = df.tail(max_data)
-        return df
+    def _update_streaming_buffer(
+        self, msg_key: MessageKey, msgs: list[StreamingMessage]
+    ) -> None:
+        raise NotImplementedError(f"{self._class_name} does not support streaming")
+
+    def _get_streaming_schema(self, schema: dict[str, str]) -> dict[str, str]:
+        """Returns the columns of the streaming buffers holding messages with the given schema.
+        Subclasses add the columns they derive from the messages (e.g. technical indicators).
+        """
+        return schema
+
+    def _write_streaming_rows(
+        self,
+        msg_key: MessageKey,
+        buffer: ColumnarRingBuffer,
+        last_row: tuple[Any, ...] | None,
+        columns: list[np.ndarray],
+    ) -> None:
+        """Writes the rows created from the messages of msg_key into its streaming buffer.
+
+        Args:
+            last_row: replaces the buffer's last row if not None (e.g. an update of the bar in progress).
+            columns: rows appended to the buffer, one array per column of the messages' schema.
+        """
+        if last_row is not None:
+            buffer.replace_last(last_row)
+        buffer.extend(columns)
+
+    def _get_stream_params(self) -> tuple[Hashable, ...]:
+        """Everything besides the feed that changes the content of the streaming buffers,
+        see StreamingHub.create_key().
+        """
+        return (
+            self._class_name,
+            self._control.get("max_data"),
+            self._control.get("incremental_update"),
+            self._control.get("aggregate"),
+            self._control.get("backpressure"),
+            self._control.get("max_queued_messages"),
+            self._control.get("ingest_process"),
+        )
 
     def _start_streaming(self):
         if not self.is_streaming():
             return
 
+        self._streaming_lock = Lock()
+        self._connect_to_stream()
+        self._add_streaming_refresh()
+
+        # start streaming for overlays that have their own feeds
+        for overlay in self._overlays:
+            if overlay.is_streaming():
+                # the overlay's refresh is added to this plot's renderer
+                overlay._parent_plot = self
+                overlay._start_streaming()
+
+    def _connect_to_stream(self):
+        """Routes the feed's messages into the streaming buffers, see _on_streaming_callback()."""
         assert self._feed is not None, "feed is not set"
         requests = cast("list[MarketFeedStreamRequest]", self._feed._requests)
         assert all(request.is_streaming() for request in requests), (
             "Not all requests in the streaming feed are for streaming"
         )
 
-        self._add_periodic_callback(self._refresh_streaming_ui)
-
-        for dataflows in self._feed._dataflows.values():
-            for dataflow in dataflows:
-                dataflow.add_default_transformations([self._on_streaming_callback])
-
-        if not self._feed.is_running():
-            if not self.is_in_notebook_mode():
-                self._streaming_thread = Thread(
-                    target=self._feed.run,
-                    daemon=True,
-                )
-                self._streaming_thread.start()
-            else:
+        if not self.is_in_notebook_mode():
+            self._subscribe_to_stream()
+        elif self._control.get("ingest_process"):
+            self._create_ingest_worker().start()
+            self._ingest_streaming = self._ingest_from_worker
+        else:
+            self._ingest_queue = self._create_ingest_queue()
+            for dataflows in self._feed._dataflows.values():
+                for dataflow in dataflows:
+                    dataflow.add_default_transformations([self._on_streaming_callback])
+            self._ingest_streaming = self._ingest_streaming_messages
+            if not self._feed.is_running():
                 asyncio.get_running_loop().create_task(self._feed.run_async())
 
-        # start streaming for overlays that have their own feeds
+    def _stop_streaming(self):
+        """Stops refreshing the plot and the ingest processes of the plot and its overlays.
+        In server mode, the streams are shared by the sessions and stopped when they are
+        destroyed instead, see StreamingHub.
+        """
+        if not self._is_overlay() and self._renderer is not None:
+            self._renderer.stop_periodic_callbacks()
+        # owned by the hub if subscribed
+        if self._ingest_worker is not None and self._stream_key is None:
+            self._ingest_worker.stop()
+            self._ingest_worker = None
         for overlay in self._overlays:
-            if overlay.is_streaming():
-                overlay._start_streaming()
+            overlay._stop_streaming()
+
+    def _create_ingest_queue(self) -> IngestQueue[StreamingMessage]:
+        """Creates the bounded queue between the feed and the streaming buffers, see control(backpressure=...)."""
+        from pfund_plot.streaming.ingest_queue import IngestQueue
+
+        return IngestQueue(
+            max_size=self._control["max_queued_messages"],
+            policy=self._control["backpressure"],
+            key_func=self._get_conflation_key,
+            on_overflow=self._ingest_streaming_messages,
+            # in notebook mode, the feed runs in the event loop that drains the queue, so it can't wait for it,
+            # otherwise the feed runs in its own thread, and the queue is drained at least every update_interval
+            block_timeout=0
+            if self.is_in_notebook_mode()
+            else self._control["update_interval"] / 1000,
+        )
+
+    def _create_ingest_worker(self) -> IngestWorker:
+        """Creates the worker running the feed in a separate process, see control(ingest_process=True)."""
+        import numpy as np
+
+        from pfund_plot.streaming.ingest_worker import IngestWorker
+
+        # checked here since the worker process would only fail when creating its shared rings
+        if object_cols := sorted(
+            {
+                col
+                for schema in self._get_feed_schemas().values()
+                for col, dtype in self._get_streaming_schema(schema).items()
+                if np.dtype(dtype).hasobject
+            }
+        ):
+            raise ValueError(
+                f"{self._class_name} can't stream with control(ingest_process=True), "
+                f"its columns {object_cols} of dtype object can't be shared with the ingest process"
+            )
+        interval = (
+            self._control.get("min_update_interval") or self._control["update_interval"]
+        )
+        self._ingest_worker = IngestWorker(self, self._feed, interval=interval / 1000)
+        return self._ingest_worker
+
+    def _ingest_from_worker(self) -> None:
+        """Copies the rows written by the ingest process since the last call into the streaming buffers."""
+        with self._streaming_lock:
+            self._ingest_worker.ingest(self._streaming_buffers)
+
+    def _get_feed_schemas(self) -> dict[str, dict[str, str]]:
+        """Returns the schema of the messages streamed by the feed per data type, before _get_streaming_schema()."""
+        raise NotImplementedError(f"{self._class_name} does not support streaming")
+
+    def _get_conflation_key(self, msg: StreamingMessage) -> Hashable:
+        """Returns the key of msg for control(backpressure="conflate"), only the latest message per key is kept."""
+        raise NotImplementedError(f"{self._class_name} does not support streaming")
+
+    def _subscribe_to_stream(self):
+        """Subscribes to the feed's stream in the process-level StreamingHub, so that all sessions
+        of a server (e.g. `panel serve`, where every session builds its own plot and feed) showing
+        the same stream share one running feed and its streaming buffers.
+        The subscription is dropped when the current session is destroyed.
+        """
+        from pfund_plot.streaming.hub import get_streaming_hub
+
+        if self._stream_key is not None:
+            return
+        hub = get_streaming_hub()
+        key = hub.create_key(self._feed, *self._get_stream_params())
+        is_ingest_process = bool(self._control.get("ingest_process"))
+        self._streaming_buffers, self._ingest_queue, self._ingest_streaming = (
+            hub.subscribe(
+                key,
+                self._feed,
+                self._streaming_buffers,
+                None if is_ingest_process else self._create_ingest_queue(),
+                self._on_streaming_callback,
+                self._ingest_from_worker
+                if is_ingest_process
+                else self._ingest_streaming_messages,
+                create_worker=self._create_ingest_worker if is_ingest_process else None,
+            )
+        )
+        self._stream_key = key
+        doc = pn.state.curdoc
+        if doc is not None and doc.session_context is not None:
+            doc.on_session_destroyed(lambda _session_context: hub.unsubscribe(key))
 
     def _refresh_streaming_ui(self):
         """during streaming, update pane and widgets accordingly using the newly updated data (updated in _on_streaming_callback)"""
-        if self._df is not None and self._is_streaming_ready():
-            self._update_pane(self._df)
+        # not built yet (e.g. in a tab that hasn't been opened), it is built with the latest data
+        if self._is_streaming_paused or self._get_root_plot()._component is None:
+            return
+        if not self._is_streaming_ready():
+            return
+        # read before the snapshot, data arriving in between is rendered again on the next refresh
+        version = self._get_streaming_version()
+        # nothing arrived since the last refresh (e.g. a quiet instrument outside market hours)
+        if version == self._rendered_version:
+            return
+        self._sync_streaming_df()
+        if self._df is not None:
+            if not self._stream_pane(self._df):
+                self._update_pane(self._df)
+                self._streamed_row_id = self._df_row_id + len(self._df)
             self._update_widgets(self._df)
+            self._rendered_version = version
+
+    def _pause_streaming(self, paused: bool) -> None:
+        """Pause or resume refreshing the streaming plot and its overlays (e.g. while in a hidden tab),
+        the data keeps streaming into the buffers and is shown as soon as the plot is resumed.
+        """
+        for plot in (self, *self._overlays):
+            was_paused, plot._is_streaming_paused = plot._is_streaming_paused, paused
+            if was_paused and not paused and plot.is_streaming():
+                plot._refresh_streaming_ui()
+
+    def _get_stream_columns(self, df: nw.DataFrame[Any]) -> dict[str, Any]:
+        """Returns the columns that can be streamed into the rendered plot's data sources.
+        Subclasses add the columns their plot function derives from df (e.g. candle bounds).
+        """
+        return {col: df[col].to_numpy() for col in df.columns}
+
+    def _get_y_range_cols(self) -> list[str]:
+        """Returns the columns the y-axis is fitted to when streaming incrementally."""
+        y_cols = [self._y] if isinstance(self._y, str) else self._y
+        return y_cols or [
+            col for col, dtype in self._df.schema.items() if dtype.is_numeric()
+        ]
+
+    def _stream_pane(self, df: nw.DataFrame[Any]) -> bool:
+        """Sends only the changed last row and the newly appended rows of df to the rendered
+        plot, instead of re-rendering the whole plot with the full df.
+
+        Overlays are streamed into their own glyphs of the parent's rendered plot,
+        so the parent and each of its overlays only send their own new rows.
+
+        Returns False if the rendered plot can't be updated incrementally
+        (e.g. not rendered yet, or its data sources don't map to df's columns),
+        in which case the caller should fall back to _update_pane().
+        """
+        if (
+            not self._control.get("incremental_render", False)
+            or self._streamed_row_id is None
+            or self._get_root_plot()._pane is None
+        ):
+            return False
+        # index in df of the last row that has been sent, it is re-sent in case it was updated
+        last_idx = self._streamed_row_id - 1 - self._df_row_id
+        if not 0 <= last_idx < len(df):
+            return False
+        if self._backend == PlottingBackend.bokeh:
+            is_streamed = self._stream_bokeh_pane(df, last_idx)
+        elif self._backend == PlottingBackend.svelte and not self._is_overlay():
+            assert self._anywidget is not None, "anywidget is not set"
+            self._anywidget.append_data(df[last_idx:])
+            is_streamed = True
+        else:
+            is_streamed = False
+        if is_streamed:
+            self._streamed_row_id = self._df_row_id + len(df)
+        return is_streamed
+
+    def _stream_bokeh_pane(self, df: nw.DataFrame[Any], last_idx: int) -> bool:
+        """Patches the last sent row and streams the new rows (df[last_idx:]) into the
+        ColumnDataSources of the plot's own glyphs in the rendered HoloViews plot, then moves
+        its ranges along, unless it is an overlay (the ranges follow the parent's data).
+        """
+        import numpy as np
+        from bokeh.models import Range1d
+
+        from pfund_plot.utils.bokeh import (
+            fit_y_range,
+            follow_x_range,
+            get_hv_plot_sources,
+            run_on_hv_plot,
+            stream_to_sources,
+            to_epoch_ms,
+        )
+
+        root_plot = self._get_root_plot()
+        # view dependent plots (e.g. downsampled) don't hold every row, so they are re-rendered instead
+        if not getattr(root_plot._pane, "_plots", None) or self._is_view_dependent():
+            return False
+        window = df[last_idx:]
+        columns = self._get_stream_columns(window)
+        # streaming data always has a "date" column, but self._x is only derived from static data
+        x_col, y_cols = self._x or "date", self._get_y_range_cols()
+        max_data = self._control.get("max_data")
+
+        is_overlay = self._is_overlay()
+        hv_plots = [hv_plot for hv_plot, _ in root_plot._pane._plots.values()]
+        updates: list[tuple[Any, dict[Any, dict[str, Any]]]] = []
+        for hv_plot in hv_plots:
+            sources = get_hv_plot_sources(hv_plot, subplots=self._rendered_plots)
+            x_range = hv_plot.handles.get("x_range")
+            y_range = hv_plot.handles.get("y_range")
+            if not sources or not (
+                is_overlay
+                or (isinstance(x_range, Range1d) and isinstance(y_range, Range1d))
+            ):
+                return False
+            plot_updates: dict[Any, dict[str, Any]] = {}
+            for source in sources:
+                if not all(col in columns for col in source.data):
+                    return False
+                source_columns: dict[str, Any] = {}
+                for col, current in source.data.items():
+                    values = columns[col]
+                    # e.g. datetime64[ns] from the buffer -> datetime64[us] used by HoloViews
+                    if hasattr(current, "dtype") and hasattr(values, "astype"):
+                        values = values.astype(current.dtype, copy=False)
+                    source_columns[col] = values
+                plot_updates[source] = source_columns
+            updates.append((hv_plot, plot_updates))
+
+        if is_overlay:
+            for hv_plot, plot_updates in updates:
+                run_on_hv_plot(
+                    hv_plot,
+                    lambda plot_updates=plot_updates: stream_to_sources(
+                        plot_updates, rollover=max_data
+                    ),
+                )
+            # the parent's DynamicMap would otherwise return its cached plot (with this overlay's
+            # stale data) to a new session, same as for the parent's own data at the end
+            root_plot._streaming_pipe._on_trigger()
+            return True
+
+        # sorted x values in ns, zero-copy views of the streaming buffer, only the bounds and
+        # the visible rows are read so that the cost doesn't grow with the number of rows
+        dates = df[x_col].to_numpy().astype("datetime64[ns]", copy=False).view("int64")
+        # the sources currently hold the rows from streamed_row_id - num_rows up to the last sent row
+        num_rows = len(next(iter(next(iter(updates[0][1])).data.values())))
+        old_first_idx = max(self._streamed_row_id - num_rows - self._df_row_id, 0)
+        # epoch ms, Bokeh's datetime unit
+        old_bounds = (dates[old_first_idx] / 1e6, dates[last_idx] / 1e6)
+        new_bounds = (dates[0] / 1e6, dates[-1] / 1e6)
+        # rows before old_first_idx aren't in the sources, so they can't be visible
+        sent_dates = dates[old_first_idx:]
+        y_values = [df[old_first_idx:][col].to_numpy() for col in y_cols]
+        for hv_plot, plot_updates in updates:
+            x_range, y_range = hv_plot.handles["x_range"], hv_plot.handles["y_range"]
+
+            def _update(
+                x_range: Range1d = x_range,
+                y_range: Range1d = y_range,
+                plot_updates: dict[Any, dict[str, Any]] = plot_updates,
+            ) -> None:
+                stream_to_sources(plot_updates, rollover=max_data)
+                follow_x_range(x_range, old_bounds, new_bounds)
+                start, end = to_epoch_ms(x_range.start), to_epoch_ms(x_range.end)
+                first = int(np.searchsorted(sent_dates, start * 1e6, side="left"))
+                last = int(np.searchsorted(sent_dates, end * 1e6, side="right"))
+                if first >= last:
+                    return
+                # NaN during e.g. the warm-up of technical indicators
+                y_min = min(
+                    np.nanmin(values[first:last], initial=np.inf) for values in y_values
+                )
+                y_max = max(
+                    np.nanmax(values[first:last], initial=-np.inf)
+                    for values in y_values
+                )
+                # all visible values are NaN
+                if y_min <= y_max:
+                    fit_y_range(y_range, y_min, y_max)
+
+            run_on_hv_plot(hv_plot, _update)
+
+        # keep the pipe's data current without triggering a re-render, so that a new session
+        # (e.g. browser refresh) renders the latest data; the memoization counter is bumped
+        # since the DynamicMap would otherwise return its cached (stale) plot
+        self._streaming_pipe.update(data=df)
+        self._streaming_pipe._on_trigger()
+        return True
 
     def _wait_for_streaming_ready(self):
         if not self.is_streaming():
@@ -818,6 +1464,7 @@ class BasePlot:
                     style=TextStyle.BOLD + RichColor.YELLOW,
                 )
                 time.sleep(1)
+            self._sync_streaming_df()
         for overlay in self._overlays:
             if overlay.is_streaming():
                 overlay._wait_for_streaming_ready()
@@ -830,6 +1477,7 @@ class BasePlot:
                     style=TextStyle.BOLD + RichColor.YELLOW,
                 )
                 await asyncio.sleep(1)
+            self._sync_streaming_df()
 
     def _render(self) -> RenderedResult:
         self._create()
@@ -1033,17 +1681,45 @@ class BasePlot:
         else:
             return None
 
-    def _build_plot(self, df: nw.DataFrame[Any] | None = None) -> Plot:
-        """Returns a plot object for the given data, composing overlays and opts if any."""
-        df = df if df is not None else self._df
-        result = self._plot_func(
-            df=df,
-            x=self._x,
-            y=self._y,
-            style=self._style,
-            control=self._control,
-            **self._plot_kwargs,
-        )
+    def _build_plot(
+        self,
+        df: nw.DataFrame[Any] | None = None,
+        x_range: tuple[Any, Any] | None = None,
+        y_range: tuple[Any, Any] | None = None,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> Plot:
+        """Returns a plot object for the given data, composing overlays and opts if any.
+
+        Args:
+            x_range: the visible x range, only used for downsampling and rasterizing.
+            y_range: the visible y range, only used for rasterizing.
+            width: the plot's width in pixels, only used for downsampling and rasterizing.
+            height: the plot's height in pixels, only used for rasterizing.
+        """
+        from pfund_plot.utils.bokeh import cache_tools
+
+        if df is None:
+            self._collect_lazy_df()
+            df = self._df
+        with cache_tools(self._bokeh_tools):
+            if df is not None and self._is_rasterized(df):
+                result = self._build_rasterized_plot(
+                    df, x_range=x_range, y_range=y_range, width=width, height=height
+                )
+            else:
+                if df is not None and self._control and self._control.get("downsample"):
+                    df = self._downsample_df(df, x_range=x_range, width=width)
+                result = self._plot_func(
+                    df=df,
+                    x=self._x,
+                    y=self._y,
+                    style=self._style,
+                    control=self._control,
+                    **self._plot_kwargs,
+                )
+        if self.is_streaming() and self._is_hvplot(result):
+            result = self._track_rendered_plots(result)
         if self._overlays:
             for overlay in self._overlays:
                 overlay_plot = overlay._build_plot()
@@ -1055,10 +1731,114 @@ class BasePlot:
                 result = result.opts(*args, **kwargs)
         return result
 
+    def _track_rendered_plots(self, plot: Plot) -> Plot:
+        """Adds a plot hook to the elements of plot, registering the HoloViews plots
+        they are rendered by (and re-rendered by, they are reused) in self._rendered_plots.
+
+        Once composited with overlays (a * b), the elements of a and b are rendered by the
+        subplots of the same HoloViews plot, this tells the subplots of a from those of b.
+        """
+        from holoviews import Element
+
+        def _register(hv_plot: Any, _element: Any) -> None:
+            self._rendered_plots.add(hv_plot)
+
+        return plot.map(lambda element: element.opts(hooks=[_register]), [Element])
+
+    def _downsample_df(
+        self,
+        df: nw.DataFrame[Any],
+        x_range: tuple[Any, Any] | None = None,
+        width: int | None = None,
+    ) -> nw.DataFrame[Any]:
+        """Reduces df to about one point per pixel of the visible x range, using control["downsample"]."""
+        from pfund_plot.utils.downsample import downsample_df
+
+        x_col = self._x if self._x in df.columns else None
+        return downsample_df(
+            df,
+            x_col,
+            self._derive_y_cols(df, x_col, self._y),
+            algorithm=self._control["downsample"],
+            num_points=width,
+            x_range=x_range,
+        )
+
+    def _is_rasterized(self, df: nw.DataFrame[Any]) -> bool:
+        from pfund_plot.utils.datashader import is_rasterized
+
+        return (
+            self.RASTER_GLYPH is not None
+            and self._x in df.columns
+            and is_rasterized(self._control, len(df))
+        )
+
+    def _build_rasterized_plot(
+        self,
+        df: nw.DataFrame[Any],
+        x_range: tuple[Any, Any] | None = None,
+        y_range: tuple[Any, Any] | None = None,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> Plot:
+        """Returns the data rendered server-side as images with datashader, overlaid with a
+        sampled, invisible scatter layer (about one point per pixel) that carries the hover tooltips.
+        """
+        from pfund_plot.utils.bokeh import create_hover_scatter
+        from pfund_plot.utils.datashader import rasterize_df
+        from pfund_plot.utils.downsample import downsample_df
+
+        style = self._style
+        x_col = self._x
+        y_cols = [
+            col
+            for col in self._derive_y_cols(df, x_col, self._y)
+            if df.schema[col].is_numeric()
+        ]
+        images = rasterize_df(
+            df,
+            x_col,
+            y_cols,
+            self.RASTER_GLYPH,
+            color=style.get("color") if len(y_cols) == 1 else None,
+            x_range=x_range,
+            y_range=y_range,
+            width=width,
+            height=height,
+        )
+        sampled_df = downsample_df(
+            df, x_col, y_cols, "minmax", num_points=width, x_range=x_range
+        )
+        hover_scatter = create_hover_scatter(
+            sampled_df,
+            x_col,
+            y_cols,
+            self._control.get("datetime_precision", "s"),
+        )
+        return (images * hover_scatter).opts(
+            title=style.get("title", ""),
+            xlabel=style.get("xlabel", ""),
+            ylabel=style.get("ylabel", ""),
+            height=style["height"],
+            responsive=True,
+            show_grid=style.get("grid", False),
+            bgcolor=style.get("bg_color") or None,
+        )
+
     def _create_plot(self):
+        self._collect_lazy_df()
         self._plot = self._build_plot(df=self._df)
 
-    def _create_pane(self):
+    def _prepare_plot(self) -> nw.DataFrame[Any] | None:
+        """Builds the initial plot, i.e. the part of _create_pane() that doesn't create any Panel/Bokeh
+        models (collecting the data and building the HoloViews plot), so it can run in a worker thread
+        (see BaseLayout._build_plots()).
+
+        Returns the initially shown df.
+        """
+        self._collect_lazy_df()
+        if self._prebuilt_plot is not None:
+            return self._prebuilt_plot[0]
         # num_data is the initial value of the DatetimeRangeWidget slider, so it
         # only applies when widgets are active. With widgets disabled there is no
         # slider to reveal the rest of the data, so show the full df instead.
@@ -1073,8 +1853,15 @@ class BasePlot:
             df = self._df
 
         if self._plot is None:
-            self._create_plot()
+            # only build the rows shown, e.g. the last num_data rows of a memory-mapped source,
+            # the DynamicMap in _create_pane() starts from the same plot instead of building it again
+            self._plot = self._build_plot(df=df)
+            if df is not None and not self._is_view_dependent():
+                self._prebuilt_plot = (df, self._plot)
+        return df
 
+    def _create_pane(self):
+        df = self._prepare_plot()
         backend = self._backend
 
         if backend == PlottingBackend.panel:
@@ -1093,9 +1880,18 @@ class BasePlot:
                 from holoviews.streams import Pipe
 
                 self._streaming_pipe = Pipe(data=df)
+                streams = [self._streaming_pipe, *self._create_view_streams()]
                 dmap = DynamicMap(
-                    lambda data: self._build_plot(df=data),
-                    streams=[self._streaming_pipe],
+                    lambda data, x_range=None, y_range=None, width=None, height=None, **kwargs: (
+                        self._build_dmap_plot(
+                            df=data,
+                            x_range=x_range,
+                            y_range=y_range,
+                            width=width,
+                            height=height,
+                        )
+                    ),
+                    streams=streams,
                 )
                 self._pane = pn.pane.HoloViews(
                     dmap, linked_axes=self._control.get("linked_axes", True)
@@ -1115,10 +1911,93 @@ class BasePlot:
         else:
             raise ValueError(f"Unsupported backend: {backend}")
 
+    def _build_dmap_plot(
+        self,
+        df: nw.DataFrame[Any] | None = None,
+        x_range: tuple[Any, Any] | None = None,
+        y_range: tuple[Any, Any] | None = None,
+        width: int | None = None,
+        height: int | None = None,
+    ) -> Plot:
+        """The DynamicMap's callback, returns the plot prebuilt for df by the render scheduler if any."""
+        # consumed, later calls with the same df (e.g. re-renders triggered by overlays) rebuild the plot
+        prebuilt_plot, self._prebuilt_plot = self._prebuilt_plot, None
+        if prebuilt_plot is not None and prebuilt_plot[0] is df:
+            return prebuilt_plot[1]
+        return self._build_plot(
+            df=df, x_range=x_range, y_range=y_range, width=width, height=height
+        )
+
+    def _get_render_scheduler(self) -> RenderScheduler:
+        if self._render_scheduler is None:
+            from pfund_plot.utils.render_scheduler import RenderScheduler
+
+            self._render_scheduler = RenderScheduler()
+        return self._render_scheduler
+
+    def _schedule_update_pane(self, df: nw.DataFrame[Any]) -> None:
+        """Widgets' update callback, _update_pane(df) through the render scheduler,
+        so that bursts of widget events cause a single re-render.
+
+        The plot is built off the event loop when it doesn't depend on the view
+        (i.e. the DynamicMap would build it exactly the same way).
+        """
+        if self._is_overlay():
+            # the overlay is composited inside the parent's DynamicMap,
+            # re-render the parent (superseded by the parent's own update if it follows)
+            self._update_df(df)
+            self._streamed_row_id = None
+            parent = self._parent_plot
+            assert parent._streaming_pipe is not None, (
+                "Overlay widgets require the base plot to be rendered via a HoloViews pipe."
+            )
+            parent._schedule_update_pane(parent._streaming_pipe.data)
+            return
+
+        def prebuild() -> nw.DataFrame[Any]:
+            if (
+                self._backend == PlottingBackend.bokeh
+                and self._streaming_pipe is not None
+                and not self._is_view_dependent()
+            ):
+                self._prebuilt_plot = (df, self._build_plot(df=df))
+            return df
+
+        self._get_render_scheduler().submit(prebuild, self._update_pane)
+
+    def _is_view_dependent(self) -> bool:
+        """Whether the plotted data depends on the visible range and plot size
+        (e.g. downsampled or rasterized), i.e. the plot is rebuilt when zooming, panning or resizing.
+        """
+        return bool(
+            (self.RASTER_GLYPH is not None and self._control.get("rasterize"))
+            or self._control.get("downsample")
+        )
+
+    def _create_view_streams(self) -> list[Any]:
+        """Returns the HoloViews streams of the visible range and plot size for view dependent plots."""
+        from holoviews.streams import PlotSize, RangeX, RangeXY
+
+        if not self._is_view_dependent():
+            return []
+        elif self.RASTER_GLYPH is not None and self._control.get("rasterize"):
+            return [RangeXY(), PlotSize()]
+        else:
+            return [RangeX(), PlotSize()]
+
     def _is_overlay(self) -> bool:
         return self._parent_plot is not None
 
+    def _get_root_plot(self) -> BasePlot:
+        """Returns the plot rendering this plot, i.e. the outermost parent if this plot is an overlay."""
+        plot = self
+        while plot._parent_plot is not None:
+            plot = plot._parent_plot
+        return plot
+
     def _update_pane(self, df: nw.DataFrame[Any]):
+        # the caller sets it again if df is the full streaming snapshot
+        self._streamed_row_id = None
         if self._is_overlay():
             self._update_df(df)
             assert self._parent_plot._streaming_pipe is not None, (
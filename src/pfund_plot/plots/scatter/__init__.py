@@ -4,8 +4,12 @@ from __future__ import annotations
 from typing import TYPE_CHECKING, Any, ClassVar
 
 if TYPE_CHECKING:
+    import narwhals as nw
     from narwhals.typing import IntoFrame
+    from pfeed.feeds.market_feed import MarketFeed
 
+    from pfund_plot.sources.stream import StreamSource
+    from pfund_plot.utils.datashader import RasterGlyph
     from pfund_plot.widgets.base import BaseWidget
 
 from pfund_plot.enums import PlottingBackend
@@ -34,18 +38,20 @@ class Scatter(BasePlot):
     Works standalone or composed onto another plot via the * operator.
 
     Args:
-        data: DataFrame with point positions
+        data: DataFrame with point positions, or pfeed's feed object / a StreamSource for streaming points
         x: Column name for x-axis position
         y: Column name for y-axis position
 
     Example:
         plt.scatter(df, x='x', y='y')
         plt.ohlc(ohlc_df) * plt.scatter(df, x='date', y='price')
+        plt.ohlc(feed) * plt.scatter(StreamSource({'date': 'datetime64[ns]', 'price': 'float64'}), y='price')
     """
 
     SUPPORTED_BACKENDS: ClassVar[list[PlottingBackend]] = [PlottingBackend.bokeh]
+    RASTER_GLYPH: ClassVar[RasterGlyph] = "point"
     # TODO: support other streaming feeds like EngineFeed etc.
-    # SUPPORT_STREAMING: ClassVar[bool] = True
+    SUPPORT_STREAMING: ClassVar[bool] = True
     SUPPORTED_WIDGETS: ClassVar[list[type[BaseWidget]]] = [DatetimeRangeWidget]
     style = ScatterStyle
     control = ScatterControl
@@ -53,10 +59,28 @@ class Scatter(BasePlot):
     # TODO: add "by" parameter to group by, see https://hvplot.holoviz.org/en/docs/latest/ref/api/manual/hvplot.hvPlot.scatter.html
     def __init__(
         self,
-        data: IntoFrame,
+        data: IntoFrame | MarketFeed | StreamSource,
         x: str | None = None,
         y: str | list[str] | None = None,
         name: str | None = None,
         **reactive_params: Any,
     ):
         super().__init__(data=data, x=x, y=y, name=name, **reactive_params)
+
+    def _get_stream_columns(self, df: nw.DataFrame[Any]) -> dict[str, Any]:
+        from holoviews.core.util import dimension_sanitizer
+
+        from pfund_plot.plots.scatter.bokeh import MARKER_MAP
+
+        columns = super()._get_stream_columns(df)
+        # per-point color/marker columns are mapped onto the glyph's color/marker by HoloViews,
+        # and renamed if they aren't valid Bokeh field names (e.g. "_color" -> "A__color")
+        for prop in ("color", "marker"):
+            col = self._style.get(prop)
+            if not (isinstance(col, str) and col in columns):
+                continue
+            values = columns[col]
+            if prop == "marker":
+                values = [MARKER_MAP.get(marker, marker) for marker in values]
+            columns[prop] = columns[dimension_sanitizer(col)] = values
+        return columns
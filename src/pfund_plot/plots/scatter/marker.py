@@ -1,15 +1,20 @@
 # pyright: reportArgumentType=false, reportOptionalMemberAccess=false, reportOptionalSubscript=false, reportCallIssue=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Hashable
 from typing import TYPE_CHECKING, Any, Literal
 
 if TYPE_CHECKING:
     from narwhals.typing import IntoFrame
+    from pfeed.feeds.market_feed import MarketFeed
 
+    from pfund_plot.plots.plot import MessageKey
+    from pfund_plot.sources.stream import StreamSource
+    from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
     from pfund_plot.typing import Control, Plot, Style
 
 import narwhals as nw
+import numpy as np
 
 from pfund_plot.plots.scatter import Scatter
 
@@ -22,7 +27,7 @@ class Marker(Scatter):
     Positive signal values (>= 0) get one color/marker, negative values get another.
 
     Args:
-        data: DataFrame with marker positions
+        data: DataFrame with marker positions, or a StreamSource for live markers (e.g. fills)
         x: Column name for x-axis position
         y: Column name for y-axis position (e.g. 'close' price)
         signal: Column whose sign determines positive/negative styling.
@@ -35,11 +40,12 @@ class Marker(Scatter):
     Example:
         plt.marker(df, x='date', y='pnl')
         plt.ohlc(df) * plt.marker(df, x='date', y='close', signal='trade')
+        plt.ohlc(feed) * plt.marker(fills, y='price', signal='side')  # fills is a StreamSource
     """
 
     def __init__(
         self,
-        data: IntoFrame,
+        data: IntoFrame | MarketFeed | StreamSource,
         x: str | None = None,
         y: str | list[str] | None = None,
         signal: str | None = None,
@@ -100,6 +106,48 @@ class Marker(Scatter):
         )
         return df
 
+    def _get_streaming_schema(self, schema: dict[str, str]) -> dict[str, str]:
+        signal_col = self._signal if self._signal else self._y
+        if signal_col not in schema:
+            raise ValueError(
+                f"signal column {signal_col!r} is not one of the streaming columns {list(schema)}"
+            )
+        return {**schema, "_color": "object", "_marker": "object"}
+
+    def _write_streaming_rows(
+        self,
+        msg_key: MessageKey,
+        buffer: ColumnarRingBuffer,
+        last_row: tuple[Any, ...] | None,
+        columns: list[np.ndarray],
+    ) -> None:
+        signal_idx = buffer.columns.index(self._signal if self._signal else self._y)
+
+        def _derive(is_positive: np.ndarray) -> list[np.ndarray]:
+            return [
+                np.where(is_positive, self._pos_color, self._neg_color).astype(object),
+                np.where(is_positive, self._pos_marker, self._neg_marker).astype(
+                    object
+                ),
+            ]
+
+        if last_row is not None:
+            color, marker = _derive(np.asarray(last_row[signal_idx]) >= 0)
+            last_row = (*last_row, color.item(), marker.item())
+        super()._write_streaming_rows(
+            msg_key, buffer, last_row, [*columns, *_derive(columns[signal_idx] >= 0)]
+        )
+
+    def _get_stream_params(self) -> tuple[Hashable, ...]:
+        return (
+            *super()._get_stream_params(),
+            self._signal if self._signal else self._y,
+            self._pos_color,
+            self._neg_color,
+            self._pos_marker,
+            self._neg_marker,
+        )
+
     def _set_style(self, style: dict[str, Any] | None = None):
         super()._set_style(style)
         if self._style is not None:
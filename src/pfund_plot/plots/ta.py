@@ -1,6 +1,168 @@
-# TODO: add technical analysis plots using talib?
-"""
-e.g. plt.sma(df, period=10)
-first convert it to plt.ta(df, indicator='sma', period=10)
-it will use sma from talib directly, and return a plot
-"""
+# pyright: reportArgumentType=false, reportOptionalMemberAccess=false, reportOptionalSubscript=false, reportCallIssue=false, reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+if TYPE_CHECKING:
+    from narwhals.typing import IntoFrame
+    from pfeed.feeds.market_feed import MarketFeed
+
+    from pfund_plot.plots.plot import MessageKey
+    from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
+    from pfund_plot.typing import Control, Plot, Style
+    from pfund_plot.utils.ta import Indicator, IndicatorName
+
+import narwhals as nw
+import numpy as np
+
+from pfund_plot.plots.line import Line
+
+__all__ = ["TechnicalIndicator"]
+
+
+class TechnicalIndicator(Line):
+    """Technical indicator plot, computed from OHLCV data and drawn as lines,
+    usually overlaid on the plot of the same data.
+
+    Static data is computed at once with NumPy-vectorized kernels. When streaming, the indicator
+    is updated bar by bar in O(1) as bars arrive, and written into the streaming buffers
+    alongside them, so the history is never recomputed.
+
+    Args:
+        data: DataFrame with the indicator's input columns (e.g. close, or high/low/close for atr),
+            or pfeed's feed object for streaming bars (or ticks folded into bars with control(aggregate=...)).
+        indicator: one of "sma", "ema", "rsi", "bollinger", "vwap", "atr".
+        period: number of bars of the indicator's window, if None, the indicator's default
+            (20 for sma/ema/bollinger, 14 for rsi/atr). Ignored by vwap, which resets every day.
+        source: column sma/ema/rsi/bollinger are computed from, e.g. "price" for tick data.
+        num_std: number of standard deviations of the bollinger bands.
+
+    Example:
+        plt.ohlc(df) * plt.ta(df, indicator='sma', period=10)
+        plt.ohlc(feed) * plt.ta(feed, indicator='bollinger', period=20, num_std=2)
+    """
+
+    _DERIVED_ATTRS: ClassVar[frozenset[str]] = Line._DERIVED_ATTRS | {"_indicators"}
+
+    def __init__(
+        self,
+        data: IntoFrame | MarketFeed,
+        indicator: IndicatorName = "sma",
+        period: int | None = None,
+        source: str = "close",
+        num_std: float = 2.0,
+        x: str | None = None,
+        callback: Callable[..., Any] | None = None,
+        name: str | None = None,
+        plot_kwargs: dict[str, Any] | None = None,
+        **reactive_params: Any,
+    ):
+        from pfeed.feeds.base_feed import BaseFeed
+
+        from pfund_plot.sources.memory_mapped import MemoryMappedSource
+        from pfund_plot.utils.ta import create_indicator
+
+        params: dict[str, Any] = {"period": period, "source": source}
+        if indicator == "bollinger":
+            params["num_std"] = num_std
+        self._indicator: Indicator = create_indicator(indicator, **params)
+        # incremental state of the indicator per streaming buffer
+        self._indicators: dict[MessageKey, Indicator] = {}
+        if isinstance(data, MemoryMappedSource):
+            data = data.to_native()
+        if not isinstance(data, BaseFeed):
+            df = nw.from_native(data)
+            # indicators need the whole history, a lazy source would only collect the rows shown
+            if isinstance(df, nw.LazyFrame):
+                data = df.collect()
+        cols = self._indicator.columns
+        super().__init__(
+            data=data,
+            x=x,
+            y=cols[0] if len(cols) == 1 else cols,
+            callback=callback,
+            name=name or indicator,
+            plot_kwargs=plot_kwargs,
+            **reactive_params,
+        )
+
+    @property
+    def _plot_func(self) -> Callable[[nw.DataFrame[Any], Style, Control], Plot]:
+        """Runs the plot function for the current backend."""
+        import importlib
+
+        module_path = f"pfund_plot.plots.line.{self._backend}"
+        module = importlib.import_module(module_path)
+        return module.plot
+
+    def _standardize_df(self, df: IntoFrame) -> nw.DataFrame[Any]:
+        df: nw.DataFrame[Any] = super()._standardize_df(df)
+        # e.g. vwap resets every day
+        date_col = self._find_date_col(df.columns) or "date"
+        input_cols = {
+            col: date_col if col == "date" else col
+            for col in self._indicator.input_cols
+        }
+        missing_cols = [col for col in input_cols.values() if col not in df.columns]
+        if missing_cols:
+            raise ValueError(
+                f"Missing required columns for {self._indicator.NAME}: {missing_cols}"
+            )
+        values = self._indicator.compute(
+            {col: df[df_col].to_numpy() for col, df_col in input_cols.items()}
+        )
+        backend = nw.get_native_namespace(df)
+        return df.with_columns(
+            nw.new_series(col, col_values, nw.Float64(), backend=backend)
+            for col, col_values in zip(self._indicator.columns, values, strict=True)
+        )
+
+    def _get_streaming_schema(self, schema: dict[str, str]) -> dict[str, str]:
+        missing_cols = [col for col in self._indicator.input_cols if col not in schema]
+        if missing_cols:
+            raise ValueError(
+                f"{self._indicator.NAME} requires the columns {missing_cols}, "
+                + "stream bar data, or fold ticks into bars with control(aggregate=...)"
+            )
+        return {**schema, **dict.fromkeys(self._indicator.columns, "float64")}
+
+    def _write_streaming_rows(
+        self,
+        msg_key: MessageKey,
+        buffer: ColumnarRingBuffer,
+        last_row: tuple[Any, ...] | None,
+        columns: list[np.ndarray],
+    ) -> None:
+        from pfund_plot.utils.ta import create_indicator
+
+        indicator = self._indicators.get(msg_key)
+        if indicator is None:
+            indicator = create_indicator(**self._indicator.params)
+            self._indicators[msg_key] = indicator
+        rows = columns
+        if last_row is not None:
+            rows = [
+                np.insert(values, 0, value)
+                for value, values in zip(last_row, columns, strict=True)
+            ]
+        # the dummy row prepended to a new buffer is kept out of the indicator's state,
+        # so that the streamed values are the same as compute()'s
+        num_dummy_rows = int(self._HAS_DUMMY_ROW and not len(buffer))
+        names = buffer.columns[: len(columns)]
+        values = indicator.update(
+            {
+                name: col_values[num_dummy_rows:]
+                for name, col_values in zip(names, rows, strict=True)
+            },
+            replace_last=last_row is not None,
+        )
+        if num_dummy_rows:
+            values = [np.insert(col_values, 0, np.nan) for col_values in values]
+        if last_row is not None:
+            last_row = (*last_row, *(col_values[0] for col_values in values))
+            values = [col_values[1:] for col_values in values]
+        super()._write_streaming_rows(msg_key, buffer, last_row, [*columns, *values])
+
+    def _get_stream_params(self) -> tuple[Hashable, ...]:
+        return (*super()._get_stream_params(), *self._indicator.params.items())
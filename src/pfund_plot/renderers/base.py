@@ -10,6 +10,7 @@ if TYPE_CHECKING:
 
     from pfund_plot.enums import NotebookType
     from pfund_plot.typing import Component, RenderedResult
+    from pfund_plot.utils.refresh_scheduler import RefreshEntry, RefreshScheduler
 
 from abc import ABC, abstractmethod
 
@@ -21,6 +22,9 @@ class BaseRenderer(ABC):
         from pfund_kit.utils import get_notebook_type
 
         self._periodic_callbacks: list[PeriodicCallback] = []
+        # drives the streaming refreshes with adaptive intervals, see add_streaming_refresh()
+        self._refresh_scheduler: RefreshScheduler | None = None
+        self._refresh_callback: PeriodicCallback | None = None
         self._port: int | None = None
         self._server: StoppableThread | Server | None = None
         self._notebook_type: NotebookType | None = get_notebook_type()
@@ -41,9 +45,41 @@ class BaseRenderer(ABC):
             )
         self._periodic_callbacks.append(periodic_callback)
 
+    @property
+    def streaming_refreshes(self) -> list[RefreshEntry]:
+        if self._refresh_scheduler is None:
+            return []
+        return self._refresh_scheduler.entries
+
+    def add_streaming_refresh(self, entry: RefreshEntry):
+        """Add a plot's streaming refresh to the renderer's RefreshScheduler,
+        all of them are run by a single periodic callback sharing one frame budget.
+        """
+        from pfund_plot.utils.refresh_scheduler import RefreshScheduler
+
+        if self._refresh_scheduler is None:
+            self._refresh_scheduler = RefreshScheduler()
+        self._refresh_scheduler.add(entry)
+        if self._refresh_callback is None:
+            self._refresh_callback = pn.state.add_periodic_callback(
+                self._refresh_scheduler.tick,
+                period=self._refresh_scheduler.period,
+                start=False,
+            )
+        else:
+            self._refresh_callback.period = self._refresh_scheduler.period
+
     def run_periodic_callbacks(self):
         for periodic_callback in self._periodic_callbacks:
             periodic_callback.start()
+        if self._refresh_callback is not None:
+            self._refresh_callback.start()
+
+    def stop_periodic_callbacks(self):
+        for periodic_callback in self._periodic_callbacks:
+            periodic_callback.stop()
+        if self._refresh_callback is not None:
+            self._refresh_callback.stop()
 
     def set_port_in_use(self, port: int):
         self._port = port
@@ -0,0 +1,135 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import narwhals as nw
+    import pyarrow as pa
+
+import hashlib
+import os
+from pathlib import Path
+
+__all__ = ["MemoryMappedSource"]
+
+
+class MemoryMappedSource:
+    """Plot data backed by a memory-mapped Arrow IPC (Feather v2) file.
+
+    The file is mapped into memory instead of being read and plotted as a lazy frame over
+    the mapping: only the columns used by the plot and the rows shown (e.g. the last num_data
+    rows, or the range selected in the DatetimeRangeWidget) are ever materialized, and only
+    the pages actually touched are read from disk. Since the pages belong to the OS page cache,
+    several processes (e.g. Panel servers) plotting the same file share a single copy of the data.
+
+    Parquet files are encoded and compressed, so they can't be mapped as is: they are
+    converted once into an uncompressed Arrow IPC file in the cache directory
+    (see pfund_plot.configure(cache_path=...)), which is then mapped and reused by all
+    processes as long as the Parquet file doesn't change.
+
+    IPC files should be uncompressed, otherwise the columns are decompressed into private memory when used.
+
+    Example:
+        plt.ohlc(MemoryMappedSource("bars.parquet")).control(num_data=500)
+    """
+
+    def __init__(self, path: str | Path):
+        """
+        Args:
+            path: path to an Arrow IPC (.arrow, .feather, .ipc) or Parquet (.parquet) file.
+        """
+        path = Path(path).expanduser()
+        if not path.is_file():
+            raise FileNotFoundError(f"{path} does not exist")
+        self._source_path = path
+        if path.suffix.lower() == ".parquet":
+            path = self._convert_parquet(path)
+        self._path = path
+        self._table: pa.Table = self._map_table(path)
+
+    @property
+    def path(self) -> Path:
+        """The memory-mapped Arrow IPC file."""
+        return self._path
+
+    def __len__(self) -> int:
+        return self._table.num_rows
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({str(self._source_path)!r})"
+
+    @staticmethod
+    def _map_table(path: Path) -> pa.Table:
+        import pyarrow as pa
+        import pyarrow.ipc
+
+        return pa.ipc.open_file(pa.memory_map(str(path), "r")).read_all()
+
+    @staticmethod
+    def _get_cache_path(path: Path) -> Path:
+        """Returns the IPC file a Parquet file is converted to,
+        keyed by the Parquet file's path, size and modification time.
+        """
+        from pfund_plot.config import get_config
+
+        stat = path.stat()
+        key = f"{path.resolve()}:{stat.st_size}:{stat.st_mtime_ns}"
+        digest = hashlib.sha1(key.encode()).hexdigest()[:16]
+        cache_dir = Path(get_config().cache_path) / "mmap"
+        return cache_dir / f"{path.stem}-{digest}.arrow"
+
+    @classmethod
+    def _convert_parquet(cls, path: Path) -> Path:
+        """Converts a Parquet file into an uncompressed single-batch IPC file in the cache,
+        if it hasn't been converted yet, and returns its path.
+        """
+        import pyarrow as pa
+        import pyarrow.ipc
+        import pyarrow.parquet as pq
+
+        cache_path = cls._get_cache_path(path)
+        if cache_path.is_file():
+            return cache_path
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        table = pq.read_table(path).combine_chunks()
+        # store tz-aware timestamps as naive UTC (the values are UTC already, only the type changes),
+        # as BasePlot would otherwise convert them (i.e. copy the column) in every process
+        schema = pa.schema(
+            field.with_type(pa.timestamp(field.type.unit))
+            if pa.types.is_timestamp(field.type) and field.type.tz is not None
+            else field
+            for field in table.schema
+        )
+        table = table.cast(schema)
+        # write to a temporary file and rename it, so that other processes
+        # converting the same file at the same time never map a partial file
+        tmp_path = cache_path.with_suffix(f".{os.getpid()}.tmp")
+        try:
+            with (
+                pa.OSFile(str(tmp_path), "wb") as sink,
+                pa.ipc.new_file(sink, table.schema) as writer,
+            ):
+                writer.write_table(table, max_chunksize=max(table.num_rows, 1))
+            os.replace(tmp_path, cache_path)
+        finally:
+            tmp_path.unlink(missing_ok=True)
+        return cache_path
+
+    def to_native(self) -> Any:
+        """Returns a polars LazyFrame scanning the mapped file.
+
+        Column projections and filters (e.g. the DatetimeRangeWidget's range) are pushed down
+        into the scan, only the selected columns and rows are turned into a DataFrame,
+        which for numeric and datetime columns shares memory with the mapped file.
+        """
+        import polars as pl
+        import pyarrow.dataset as ds
+
+        return pl.scan_pyarrow_dataset(ds.dataset(self._table))
+
+    def to_frame(self) -> nw.LazyFrame[Any]:
+        """Returns a polars-backed narwhals LazyFrame scanning the mapped file, see to_native()."""
+        import narwhals as nw
+
+        return nw.from_native(self.to_native())
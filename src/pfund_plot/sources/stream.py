@@ -0,0 +1,138 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from collections.abc import Mapping
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from narwhals.typing import IntoDataFrame
+    from numpy.typing import DTypeLike
+
+from threading import Lock
+
+import numpy as np
+
+from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
+
+__all__ = ["StreamSource"]
+
+
+class StreamSource:
+    """Streaming plot data pushed by the user, e.g. the fills of a live strategy.
+
+    Rows are pushed from any thread into a ColumnarRingBuffer. Every plot reading the source
+    (e.g. one per session of a Panel server) keeps track of the rows it has already read,
+    and only copies the newly pushed rows into its own streaming buffers on refresh,
+    which are then streamed into the rendered plot, even when it is an overlay.
+
+    The "date" column is required (tz-naive, i.e. UTC, datetimes) and dates must not decrease.
+
+    Example:
+        fills = StreamSource({"date": "datetime64[ns]", "price": "float64", "side": "int8"})
+        plt.ohlc(feed) * plt.marker(fills, y="price", signal="side")
+        fills.push({"date": datetime.datetime.now(), "price": 101.5, "side": 1})
+        fills.push_batch(arrow_table)
+    """
+
+    def __init__(
+        self,
+        schema: Mapping[str, DTypeLike],
+        max_size: int | None = 100_000,
+        name: str = "stream",
+    ):
+        """
+        Args:
+            schema: mapping of column name -> NumPy dtype of the pushed rows, e.g. "float64",
+                use "object" for strings.
+            max_size: maximum number of rows kept for plots that haven't read them yet
+                (e.g. rendered later), oldest rows are dropped beyond it.
+                If None, all the rows are kept.
+            name: name of the stream.
+        """
+        if "date" not in schema:
+            raise ValueError(f"schema must have a 'date' column, got {list(schema)}")
+        # "date" first, as in the schemas of the market data buffers
+        self._schema: dict[str, DTypeLike] = {
+            "date": "datetime64[ns]",
+            **{col: dtype for col, dtype in schema.items() if col != "date"},
+        }
+        self._buffer = ColumnarRingBuffer(self._schema, max_size=max_size)
+        self.name = name
+        self._lock = Lock()
+
+    @property
+    def schema(self) -> dict[str, DTypeLike]:
+        return dict(self._schema)
+
+    @property
+    def num_pushed(self) -> int:
+        """Total number of rows pushed so far."""
+        return self._buffer.num_appended
+
+    def __len__(self) -> int:
+        return len(self._buffer)
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}({self.name!r}, columns={list(self._schema)})"
+
+    def push(self, row: Mapping[str, Any]) -> None:
+        """Push a single row, e.g. {"date": ..., "price": 101.5, "side": 1}.
+        Thread-safe, the row is written into the buffer as is, without building any arrays.
+        """
+        missing_cols = [col for col in self._schema if col not in row]
+        if missing_cols:
+            raise ValueError(f"Missing columns pushed to {self}: {missing_cols}")
+        date, *values = (row[col] for col in self._schema)
+        date = np.datetime64(date, "ns")
+        with self._lock:
+            self._check_dates(date)
+            self._buffer.append((date, *values))
+
+    def push_batch(self, data: Mapping[str, Any] | IntoDataFrame) -> None:
+        """Push a batch of rows in one vectorized append. Thread-safe.
+
+        Args:
+            data: one array-like (e.g. NumPy array) per column, or a dataframe
+                (e.g. a pyarrow Table, polars or pandas DataFrame) with the columns of the schema.
+        """
+        if not isinstance(data, Mapping):
+            import narwhals as nw
+
+            df = nw.from_native(data, eager_only=True)
+            data = {
+                col: df[col].to_numpy() for col in self._schema if col in df.columns
+            }
+        missing_cols = [col for col in self._schema if col not in data]
+        if missing_cols:
+            raise ValueError(f"Missing columns pushed to {self}: {missing_cols}")
+        arrays = [
+            np.asarray(data[col], dtype=dtype) for col, dtype in self._schema.items()
+        ]
+        num_rows = len(arrays[0])
+        if any(len(values) != num_rows for values in arrays):
+            raise ValueError(
+                f"All the columns pushed to {self} must have the same length"
+            )
+        if not num_rows:
+            return
+        dates = arrays[0]
+        if np.any(dates[1:] < dates[:-1]):
+            raise ValueError(f"Dates pushed to {self} must be sorted")
+        with self._lock:
+            self._check_dates(dates[0])
+            self._buffer.extend(arrays)
+
+    def _check_dates(self, first_date: np.datetime64) -> None:
+        if len(self._buffer) and first_date < self._buffer.last("date"):
+            raise ValueError(
+                f"Dates pushed to {self} must not be before the last date pushed"
+            )
+
+    def read(self, row_id: int) -> tuple[list[np.ndarray], int]:
+        """Returns the rows pushed from row_id on (rows already dropped are skipped),
+        one array per column (zero-copy views), and the row id to read from next time.
+        """
+        columns, first_row_id = self._buffer.snapshot()
+        arrays = list(columns.values())
+        start = max(row_id - first_row_id, 0)
+        return [values[start:] for values in arrays], first_row_id + len(arrays[0])
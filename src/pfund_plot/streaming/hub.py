@@ -0,0 +1,202 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportPrivateUsage=false
+from __future__ import annotations
+
+from collections.abc import Callable, Hashable
+from typing import TYPE_CHECKING, Any, TypeAlias
+
+if TYPE_CHECKING:
+    from pfeed.feeds.market_feed import MarketFeed
+
+    from pfund_plot.plots.plot import StreamingBuffers
+    from pfund_plot.streaming.ingest_queue import IngestQueue
+    from pfund_plot.streaming.ingest_worker import IngestWorker
+
+import asyncio
+from contextlib import suppress
+from dataclasses import dataclass
+from threading import Lock, Thread
+
+__all__ = ["StreamKey", "StreamingHub", "get_streaming_hub"]
+
+
+StreamKey: TypeAlias = tuple[Hashable, ...]
+# request fields that identify the data a stream produces
+_REQUEST_FIELDS = (
+    "data_source",
+    "data_origin",
+    "env",
+    "product",
+    "target_resolution",
+    "data_resolution",
+    "start_date",
+    "end_date",
+    "replay_pace",
+    "clean_data",
+)
+
+
+@dataclass(slots=True)
+class _SharedStream:
+    feed: MarketFeed
+    buffers: StreamingBuffers
+    queue: IngestQueue[Any] | None
+    ingest: Callable[[], None]
+    num_subscribers: int = 0
+    loop: asyncio.AbstractEventLoop | None = None
+    task: asyncio.Task[Any] | None = None
+    thread: Thread | None = None
+    # runs the feed in a separate process instead, see IngestWorker
+    worker: IngestWorker | None = None
+
+
+class StreamingHub:
+    """Process-level registry of the running streams, shared by all sessions of a server.
+
+    When a plot is served (e.g. `panel serve` or BaseRenderer.serve), every browser session
+    builds its own plot and feed. Instead of running one copy of the same feed per session,
+    the first plot subscribing to a stream runs its feed once and writes the messages into
+    its streaming buffers (one ring buffer per MessageKey), every later subscriber of the same
+    stream reads from these buffers and never runs its own feed. Each subscriber keeps track
+    of the rows it has already rendered, so it receives a snapshot when it starts and only
+    the new rows (deltas) afterwards.
+
+    Streams are reference-counted, once the last subscriber unsubscribes (e.g. its session is
+    destroyed), the feed is cancelled and the stream removed.
+    """
+
+    def __init__(self):
+        self._lock = Lock()
+        self._streams: dict[StreamKey, _SharedStream] = {}
+
+    @staticmethod
+    def create_key(feed: MarketFeed, *params: Hashable) -> StreamKey:
+        """Creates the key identifying the stream of feed, two feeds with the same key produce the same data.
+
+        Args:
+            params: anything else that changes the content of the buffers, e.g. their max size.
+        """
+        requests = tuple(
+            sorted(
+                tuple(repr(getattr(request, name, None)) for name in _REQUEST_FIELDS)
+                for request in feed._requests
+            )
+        )
+        return (type(feed).__name__, requests, *params)
+
+    def subscribe(
+        self,
+        key: StreamKey,
+        feed: MarketFeed,
+        buffers: StreamingBuffers,
+        queue: IngestQueue[Any] | None,
+        on_message: Callable[[Any], Any],
+        ingest: Callable[[], None],
+        create_worker: Callable[[], IngestWorker] | None = None,
+    ) -> tuple[StreamingBuffers, IngestQueue[Any] | None, Callable[[], None]]:
+        """Subscribes to the stream identified by key.
+
+        If the stream is not running yet, on_message (which puts the messages into queue) is added to
+        feed's dataflows and feed is started, otherwise feed, buffers, queue and the callbacks are unused.
+
+        Args:
+            ingest: writes the messages queued by on_message into buffers,
+                every subscriber calls it before reading the buffers.
+            create_worker: if not None, the stream is started by running its feed in the IngestWorker it returns,
+                in a separate process, instead of in a thread of this process. ingest then copies
+                the worker's rows into buffers, and queue and on_message are unused.
+
+        Returns:
+            the stream's buffers, queue (e.g. for its metrics) and ingest callback.
+        """
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                stream = _SharedStream(
+                    feed=feed, buffers=buffers, queue=queue, ingest=ingest
+                )
+                if create_worker is not None:
+                    # the worker runs its own copy of the feed
+                    stream.worker = create_worker()
+                    stream.worker.start()
+                else:
+                    for dataflows in feed._dataflows.values():
+                        for dataflow in dataflows:
+                            dataflow.add_default_transformations([on_message])
+                    # the same feed can back several streams (e.g. an overlay on the same feed with a different max_data)
+                    if not feed.is_running() and not any(
+                        other.feed is feed and other.worker is None
+                        for other in self._streams.values()
+                    ):
+                        self._start(stream)
+                self._streams[key] = stream
+            stream.num_subscribers += 1
+            return stream.buffers, stream.queue, stream.ingest
+
+    def unsubscribe(self, key: StreamKey) -> None:
+        """Drops a subscription, the stream is stopped when its last subscriber is gone."""
+        with self._lock:
+            stream = self._streams.get(key)
+            if stream is None:
+                return
+            stream.num_subscribers -= 1
+            if stream.num_subscribers > 0:
+                return
+            del self._streams[key]
+            if stream.worker is not None:
+                stream.worker.stop()
+                return
+            if stream.task is None:
+                return
+            for other in self._streams.values():
+                # the feed still backs another stream, which takes over stopping it
+                if other.feed is stream.feed and other.worker is None:
+                    other.loop, other.task, other.thread = (
+                        stream.loop,
+                        stream.task,
+                        stream.thread,
+                    )
+                    return
+            self._stop(stream)
+
+    def num_subscribers(self, key: StreamKey) -> int:
+        with self._lock:
+            stream = self._streams.get(key)
+            return stream.num_subscribers if stream is not None else 0
+
+    @staticmethod
+    def _start(stream: _SharedStream) -> None:
+        """Runs the feed in its own event loop in a daemon thread, so that it can be cancelled."""
+        loop = asyncio.new_event_loop()
+        stream.loop = loop
+        stream.task = loop.create_task(stream.feed.run_async())
+
+        def _run():
+            try:
+                loop.run_until_complete(stream.task)
+            except asyncio.CancelledError:
+                pass
+            finally:
+                loop.close()
+
+        stream.thread = Thread(target=_run, name="pfund_plot-stream", daemon=True)
+        stream.thread.start()
+
+    @staticmethod
+    def _stop(stream: _SharedStream) -> None:
+        # the feed ends its dataflows gracefully on cancellation
+        # RuntimeError if the loop is already closed, i.e. the feed has ended by itself
+        with suppress(RuntimeError):
+            _ = stream.loop.call_soon_threadsafe(stream.task.cancel)
+
+
+_hub: StreamingHub | None = None
+_hub_lock = Lock()
+
+
+def get_streaming_hub() -> StreamingHub:
+    """Returns the process-level StreamingHub."""
+    global _hub
+    with _hub_lock:
+        if _hub is None:
+            _hub = StreamingHub()
+        return _hub
@@ -0,0 +1,160 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+import time
+from collections import deque
+from collections.abc import Callable, Hashable
+from dataclasses import asdict, dataclass
+from threading import Condition
+from typing import Generic, Literal, TypeVar
+
+__all__ = ["BackpressurePolicy", "IngestMetrics", "IngestQueue"]
+
+
+BackpressurePolicy = Literal["block", "drop_oldest", "conflate"]
+_T = TypeVar("_T")
+
+
+@dataclass(slots=True)
+class IngestMetrics:
+    """Counters of an IngestQueue, see IngestQueue.metrics."""
+
+    # number of messages currently queued
+    depth: int = 0
+    # highest depth reached so far
+    max_depth: int = 0
+    max_size: int = 0
+    num_received: int = 0
+    # messages handed over to the streaming buffers
+    num_drained: int = 0
+    # messages dropped by "drop_oldest", or by "conflate" when there are max_size keys
+    num_dropped: int = 0
+    # messages replaced by a newer message of the same key by "conflate"
+    num_conflated: int = 0
+    # number of times a "block" producer has drained the queue itself, see IngestQueue.put()
+    num_overflows: int = 0
+    # total seconds "block" producers have waited for the queue to be drained
+    blocked_time: float = 0.0
+
+
+class IngestQueue(Generic[_T]):
+    """Bounded, thread-safe queue between a feed (the producer) and the streaming buffers (the consumer).
+
+    The feed queues its messages, which are drained in batches whenever the buffers are read
+    (i.e. at least every update_interval). When messages arrive faster than that (e.g. market-open bursts),
+    the queue applies a backpressure policy once it holds max_size messages, instead of growing unbounded:
+
+    - "block": the producer waits until the queue is drained, for at most block_timeout seconds,
+      then drains it itself with on_overflow. No message is lost, and a feed running in its own
+      thread (e.g. in the StreamingHub) is slowed down to the pace of the plot.
+    - "drop_oldest": the oldest message is dropped, the producer never waits.
+    - "conflate": the queued messages are conflated, only the latest message per key (see key_func)
+      is kept, e.g. per bar. If there are still max_size keys, the oldest message is dropped.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 10_000,
+        policy: BackpressurePolicy = "block",
+        key_func: Callable[[_T], Hashable] | None = None,
+        on_overflow: Callable[[], None] | None = None,
+        block_timeout: float = 0.0,
+    ):
+        """
+        Args:
+            max_size: number of queued messages from which the policy applies.
+            policy: backpressure policy, see above.
+            key_func: returns the key of a message, required by "conflate".
+            on_overflow: drains the queue into the buffers, called by a "block" producer
+                when the queue hasn't been drained within block_timeout.
+            block_timeout: longest time in seconds a "block" producer waits for the queue to be drained.
+                Must be 0 if the producer runs in the consumer's event loop (e.g. notebook mode),
+                which can't drain the queue while the producer is waiting.
+        """
+        if max_size < 1:
+            raise ValueError(f"max_size must be a positive integer, got {max_size}")
+        assert policy in ("block", "drop_oldest", "conflate"), (
+            f"policy must be one of 'block', 'drop_oldest', 'conflate', got {policy!r}"
+        )
+        assert policy != "conflate" or key_func is not None, (
+            "key_func is required by the 'conflate' policy"
+        )
+        self._max_size = max_size
+        self._policy: BackpressurePolicy = policy
+        self._key_func = key_func
+        self._on_overflow = on_overflow
+        self._block_timeout = block_timeout
+        self._cond = Condition()
+        self._messages: deque[_T] = deque()
+        self._metrics = IngestMetrics(max_size=max_size)
+
+    @property
+    def policy(self) -> BackpressurePolicy:
+        return self._policy
+
+    @property
+    def metrics(self) -> IngestMetrics:
+        """A copy of the queue's counters."""
+        with self._cond:
+            return IngestMetrics(**asdict(self._metrics))
+
+    def __len__(self) -> int:
+        return len(self._messages)
+
+    def _is_full(self) -> bool:
+        return len(self) >= self._max_size
+
+    def put(self, msg: _T) -> None:
+        """Queues msg, applying the backpressure policy if the queue is full."""
+        if self._policy == "block" and not self._wait_until_not_full():
+            if self._on_overflow is not None:
+                # outside of the queue's lock, on_overflow() takes the buffers' lock before draining
+                self._on_overflow()
+            with self._cond:
+                self._metrics.num_overflows += 1
+        with self._cond:
+            metrics = self._metrics
+            metrics.num_received += 1
+            if self._policy == "conflate" and self._is_full():
+                self._conflate()
+            if self._policy != "block" and self._is_full():
+                self._messages.popleft()
+                metrics.num_dropped += 1
+            self._messages.append(msg)
+            metrics.depth = len(self)
+            metrics.max_depth = max(metrics.max_depth, metrics.depth)
+
+    def _conflate(self) -> None:
+        """Keeps only the latest queued message per key, ordered by their latest update."""
+        latest: dict[Hashable, _T] = {}
+        for msg in self._messages:
+            key = self._key_func(msg)
+            # re-inserted, so that messages stay ordered by their latest update
+            latest.pop(key, None)
+            latest[key] = msg
+        self._metrics.num_conflated += len(self._messages) - len(latest)
+        self._messages = deque(latest.values())
+
+    def _wait_until_not_full(self) -> bool:
+        """Returns False if the queue is still full after waiting block_timeout."""
+        with self._cond:
+            if not self._is_full():
+                return True
+            if self._block_timeout <= 0:
+                return False
+            start = time.monotonic()
+            is_drained = self._cond.wait_for(
+                lambda: not self._is_full(), timeout=self._block_timeout
+            )
+            self._metrics.blocked_time += time.monotonic() - start
+            return is_drained
+
+    def drain(self) -> list[_T]:
+        """Removes and returns all the queued messages in order, waking up the waiting producers."""
+        with self._cond:
+            msgs = list(self._messages)
+            self._messages.clear()
+            self._metrics.num_drained += len(msgs)
+            self._metrics.depth = 0
+            self._cond.notify_all()
+            return msgs
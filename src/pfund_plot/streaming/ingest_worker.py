@@ -0,0 +1,189 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false, reportPrivateUsage=false, reportAttributeAccessIssue=false
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from multiprocessing.queues import Queue
+    from multiprocessing.synchronize import Event
+
+    from pfeed.feeds.market_feed import MarketFeed
+
+    from pfund_plot.plots.plot import BasePlot, MessageKey, StreamingBuffers
+    from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
+
+import multiprocessing as mp
+import queue
+from threading import Lock
+
+from pfund_kit.style import RichColor, TextStyle, cprint
+
+from pfund_plot.streaming.shared_ring import SharedColumnarRing
+
+__all__ = ["IngestWorker"]
+
+
+# capacity of the shared rings of buffers without max_data (i.e. unbounded)
+DEFAULT_RING_CAPACITY = 100_000
+
+
+class IngestWorker:
+    """Runs a plot's feed in a separate process, which writes the feed's messages into the streaming
+    buffers (e.g. decoding, folding ticks into bars, computing indicators) and publishes the rows
+    into shared memory, one SharedColumnarRing per MessageKey.
+
+    This process only copies the newly published rows into its own streaming buffers, see ingest(),
+    so heavy feeds don't compete with the UI (e.g. the Bokeh server's event loop) for the GIL.
+
+    The worker process receives a copy of the plot without its data and rendering state
+    (see BasePlot._clone_for_ingest()) and the feed, both sent with cloudpickle,
+    since feeds hold classes created on the fly (e.g. pfund's products).
+    """
+
+    def __init__(self, plot: BasePlot, feed: MarketFeed, interval: float):
+        """
+        Args:
+            plot: the plot whose streaming buffers are written by the worker.
+            feed: the feed run by the worker, it is never run in this process.
+            interval: seconds between two publications of the worker's buffers.
+        """
+        try:
+            import cloudpickle
+        except ImportError:
+            raise ImportError(
+                "cloudpickle is required to stream in a separate process, control(ingest_process=True), "
+                + "install it with `pip install cloudpickle`"
+            ) from None
+
+        self._max_size: int | None = plot._control["max_data"]
+        payload = cloudpickle.dumps((plot._clone_for_ingest(), feed))
+        # spawn, forking a process running threads (e.g. the Bokeh server) is unsafe
+        ctx = mp.get_context("spawn")
+        # (msg_key, shared memory name, schema, capacity) of the rings created by the worker
+        self._new_rings: Queue[tuple[MessageKey, str, dict[str, Any], int]] = (
+            ctx.Queue()
+        )
+        self._stop_event = ctx.Event()
+        self._process = ctx.Process(
+            target=_run_ingest_worker,
+            args=(payload, self._new_rings, self._stop_event, interval),
+            name="pfund_plot-ingest",
+            daemon=True,
+        )
+        self._rings: dict[MessageKey, SharedColumnarRing] = {}
+        self._has_exited = False
+
+    def start(self) -> None:
+        self._process.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stops the worker, which cancels its feed and frees the shared memory."""
+        self._stop_event.set()
+        if self._process.is_alive():
+            self._process.join(timeout)
+            if self._process.is_alive():
+                self._process.terminate()
+        for ring in self._rings.values():
+            ring.close()
+        self._rings.clear()
+
+    def ingest(self, buffers: StreamingBuffers) -> None:
+        """Copies the rows published by the worker since the last call into buffers,
+        creating the buffers of new message keys.
+        """
+        if self._process.exitcode is not None:
+            # a worker dying in the middle of a write leaves its rings unreadable
+            if not self._has_exited:
+                self._has_exited = True
+                cprint(
+                    f"Streaming ingest process exited with code {self._process.exitcode}, the plot stops updating",
+                    style=TextStyle.BOLD + RichColor.RED,
+                )
+            return
+        while True:
+            try:
+                msg_key, name, schema, capacity = self._new_rings.get_nowait()
+            except queue.Empty:
+                break
+            from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
+
+            self._rings[msg_key] = SharedColumnarRing(schema, capacity, name=name)
+            buffers[msg_key] = ColumnarRingBuffer(schema, max_size=self._max_size)
+        for msg_key, ring in self._rings.items():
+            rows = ring.read()
+            if rows is None:
+                continue
+            last_row, columns = rows
+            buffer = buffers[msg_key]
+            if last_row is not None:
+                buffer.replace_last(last_row)
+            buffer.extend(columns)
+
+
+class _RingPublisher:
+    """Publishes the rows written into a buffer (in the worker process) into its shared ring."""
+
+    def __init__(self, buffer: ColumnarRingBuffer):
+        self.ring = SharedColumnarRing(
+            buffer.schema, capacity=buffer.max_size or DEFAULT_RING_CAPACITY
+        )
+        # row id one past the last row published, and buffer version published
+        self._row_id = 0
+        self._version = -1
+
+    def publish(self, buffer: ColumnarRingBuffer) -> None:
+        if buffer.version == self._version:
+            return
+        columns, first_row_id = buffer.snapshot()
+        # the last row published may have been replaced since, e.g. an incremental bar update
+        start = max(self._row_id - 1, first_row_id)
+        self.ring.write(
+            start, [values[start - first_row_id :] for values in columns.values()]
+        )
+        self._row_id, self._version = first_row_id + len(buffer), buffer.version
+
+
+def _run_ingest_worker(
+    payload: bytes,
+    new_rings: Queue[tuple[MessageKey, str, dict[str, Any], int]],
+    stop_event: Event,
+    interval: float,
+) -> None:
+    """Entry point of the worker process."""
+    import pickle
+
+    from pfund_plot.streaming.hub import get_streaming_hub
+
+    plot, feed = pickle.loads(payload)
+    plot._streaming_lock = Lock()
+    plot._ingest_queue = plot._create_ingest_queue()
+    # the feed runs in its own thread, as it would in the server, see StreamingHub
+    hub = get_streaming_hub()
+    key = hub.create_key(feed, *plot._get_stream_params())
+    plot._streaming_buffers, _, _ = hub.subscribe(
+        key,
+        feed,
+        plot._streaming_buffers,
+        plot._ingest_queue,
+        plot._on_streaming_callback,
+        plot._ingest_streaming_messages,
+    )
+    publishers: dict[MessageKey, _RingPublisher] = {}
+    parent = mp.parent_process()
+    try:
+        # the worker is daemonic, but a killed parent can't terminate it
+        while not stop_event.wait(interval) and parent.is_alive():
+            plot._ingest_streaming_messages()
+            # the feed's thread writes into the buffers too when the queue overflows
+            with plot._streaming_lock:
+                for msg_key, buffer in plot._streaming_buffers.items():
+                    publisher = publishers.get(msg_key)
+                    if publisher is None:
+                        publisher = publishers[msg_key] = _RingPublisher(buffer)
+                        ring = publisher.ring
+                        new_rings.put((msg_key, ring.name, ring.schema, ring.capacity))
+                    publisher.publish(buffer)
+    finally:
+        hub.unsubscribe(key)
+        for publisher in publishers.values():
+            publisher.ring.close()
@@ -0,0 +1,194 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    import narwhals as nw
+    from numpy.typing import DTypeLike
+
+from threading import Lock
+
+import numpy as np
+
+__all__ = ["ColumnarRingBuffer"]
+
+
+class ColumnarRingBuffer:
+    """Bounded columnar buffer backed by one NumPy array per column.
+
+    Rows are appended in amortized O(1): each column is over-allocated to twice
+    its max size, rows are written linearly, and once the end of the storage is
+    reached the most recent `max_size` rows are moved into freshly allocated
+    arrays. Because the live rows are always contiguous, snapshots are plain
+    NumPy slices (zero-copy), and since compaction allocates new arrays instead
+    of overwriting the old ones, a snapshot stays valid after later appends.
+    The only in-place write to already published rows is replace_last(), which
+    is what incremental bar updates need.
+
+    If max_size is None, the buffer grows unbounded (capacity doubles when full).
+    """
+
+    _INITIAL_CAPACITY = 1024
+
+    def __init__(self, schema: dict[str, DTypeLike], max_size: int | None = None):
+        """
+        Args:
+            schema: ordered mapping of column name -> NumPy dtype.
+                Rows passed to append()/replace_last() follow the same column order.
+            max_size: maximum number of rows kept, oldest rows are dropped beyond it.
+                If None, the buffer grows unbounded.
+        """
+        if max_size is not None and max_size < 1:
+            raise ValueError(f"max_size must be a positive integer, got {max_size}")
+        self._schema: dict[str, np.dtype[Any]] = {
+            col: np.dtype(dtype) for col, dtype in schema.items()
+        }
+        self._max_size = max_size
+        capacity = 2 * max_size if max_size else self._INITIAL_CAPACITY
+        self._columns: dict[str, np.ndarray] = {
+            col: np.empty(capacity, dtype=dtype) for col, dtype in self._schema.items()
+        }
+        self._start = 0
+        self._end = 0
+        # total number of rows ever appended, gives every row a stable id
+        # (row id = position in the full, untruncated stream)
+        self._num_appended = 0
+        # bumped by every write, including in-place ones (replace_last)
+        self._version = 0
+        self._lock = Lock()
+
+    def __len__(self) -> int:
+        return self._end - self._start
+
+    @property
+    def columns(self) -> list[str]:
+        return list(self._schema)
+
+    @property
+    def schema(self) -> dict[str, np.dtype[Any]]:
+        return dict(self._schema)
+
+    @property
+    def max_size(self) -> int | None:
+        return self._max_size
+
+    @property
+    def num_appended(self) -> int:
+        return self._num_appended
+
+    @property
+    def version(self) -> int:
+        """Number of writes so far, changes whenever the buffer's content changes."""
+        return self._version
+
+    def _reserve(self, num_rows: int) -> None:
+        """Make room for num_rows more rows at the end of the storage."""
+        capacity = len(next(iter(self._columns.values())))
+        if self._end + num_rows <= capacity:
+            return
+        size = self._end - self._start
+        if self._max_size:
+            # keep at most max_size rows after the new ones are written
+            keep = min(size, max(self._max_size - num_rows, 0))
+            new_capacity = max(2 * self._max_size, keep + num_rows)
+        else:
+            keep = size
+            new_capacity = max(2 * (size + num_rows), self._INITIAL_CAPACITY)
+        # allocate new arrays rather than compacting in place, so that snapshots
+        # handed out earlier keep pointing at unchanged memory
+        for col, dtype in self._schema.items():
+            new_array = np.empty(new_capacity, dtype=dtype)
+            new_array[:keep] = self._columns[col][self._end - keep : self._end]
+            self._columns[col] = new_array
+        self._start, self._end = 0, keep
+
+    def append(self, row: Sequence[Any]) -> None:
+        """Append a single row, values ordered as in the schema."""
+        with self._lock:
+            self._reserve(1)
+            end = self._end
+            for array, value in zip(self._columns.values(), row, strict=True):
+                array[end] = value
+            self._end = end + 1
+            self._num_appended += 1
+            self._version += 1
+            if self._max_size and self._end - self._start > self._max_size:
+                self._start += 1
+
+    def extend(self, columns: Sequence[Any]) -> None:
+        """Append a batch of rows given as one array per column, ordered as in the schema.
+        Each column is written with a single slice assignment instead of row by row.
+        """
+        arrays = [
+            np.asarray(values, dtype=dtype)
+            for values, dtype in zip(columns, self._schema.values(), strict=True)
+        ]
+        num_rows = len(arrays[0])
+        if num_rows == 0:
+            return
+        # rows beyond max_size would be dropped right away, so they aren't written
+        skip = max(num_rows - self._max_size, 0) if self._max_size else 0
+        num_written = num_rows - skip
+        with self._lock:
+            self._reserve(num_written)
+            end = self._end
+            for array, values in zip(self._columns.values(), arrays, strict=True):
+                array[end : end + num_written] = values[skip:]
+            self._end = end + num_written
+            self._num_appended += num_rows
+            self._version += 1
+            if self._max_size and self._end - self._start > self._max_size:
+                self._start = self._end - self._max_size
+
+    def replace_last(self, row: Sequence[Any]) -> None:
+        """Overwrite the last row in place, e.g. for an incremental bar update."""
+        with self._lock:
+            if self._end == self._start:
+                raise IndexError("cannot replace the last row of an empty buffer")
+            last = self._end - 1
+            for array, value in zip(self._columns.values(), row, strict=True):
+                array[last] = value
+            self._version += 1
+
+    def last(self, col: str) -> Any:
+        """Return the value of `col` in the last row."""
+        if self._end == self._start:
+            raise IndexError("buffer is empty")
+        return self._columns[col][self._end - 1]
+
+    def snapshot(self) -> tuple[dict[str, np.ndarray], int]:
+        """Return zero-copy views of the live rows keyed by column name,
+        together with the row id of the first live row.
+        """
+        with self._lock:
+            start, end = self._start, self._end
+            first_row_id = self._num_appended - (end - start)
+            columns = {col: array[start:end] for col, array in self._columns.items()}
+            return columns, first_row_id
+
+    def read_frame(self) -> tuple[nw.DataFrame[Any], int]:
+        """Return a polars-backed narwhals DataFrame sharing memory with the buffer,
+        together with the row id of its first row.
+
+        datetime64 columns are passed to polars as their int64 view and cast back,
+        polars would otherwise copy them.
+        """
+        import narwhals as nw
+        import polars as pl
+
+        columns, first_row_id = self.snapshot()
+        series: list[pl.Series] = []
+        for col, array in columns.items():
+            if array.dtype.kind == "M":
+                unit, _ = np.datetime_data(array.dtype)
+                s = pl.Series(col, array.view("int64")).cast(pl.Datetime(unit))
+            else:
+                s = pl.Series(col, array)
+            series.append(s)
+        return nw.from_native(pl.DataFrame(series)), first_row_id
+
+    def to_frame(self) -> nw.DataFrame[Any]:
+        """Return a polars-backed narwhals DataFrame sharing memory with the buffer."""
+        return self.read_frame()[0]
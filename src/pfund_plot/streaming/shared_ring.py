@@ -0,0 +1,157 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from numpy.typing import DTypeLike
+
+import time
+from multiprocessing.shared_memory import SharedMemory
+
+import numpy as np
+
+__all__ = ["SharedColumnarRing"]
+
+
+# header of the shared memory, one int64 each
+_SEQ, _END, _VERSION = range(3)
+_HEADER_SIZE = 3 * 8
+# reads retried while the writer is writing, before giving up until the next read()
+_MAX_READ_ATTEMPTS = 100
+
+
+class SharedColumnarRing:
+    """Fixed-capacity columnar ring buffer in shared memory, written by one process and read by another.
+
+    Row ids are those of the writer's ColumnarRingBuffer, row id r is stored at r % capacity in
+    one array per column, so only numeric columns are supported. Writes are published with a
+    sequence lock: the writer makes the sequence number odd while writing, and a reader retries
+    if it changed while reading, so readers never lock out the writer and never see a half-written batch.
+
+    The reader keeps track of the rows it has read, read() only copies the rows written since the
+    last call out of the shared memory, which are then appended to the reader's own buffer, whose
+    snapshots stay zero-copy (see ColumnarRingBuffer). Rows overwritten before being read
+    (i.e. more than capacity rows behind) are skipped.
+    """
+
+    def __init__(
+        self,
+        schema: dict[str, DTypeLike],
+        capacity: int,
+        name: str | None = None,
+    ):
+        """
+        Args:
+            schema: ordered mapping of column name -> NumPy dtype.
+            capacity: number of rows the ring holds.
+            name: name of the shared memory to attach to (the reader),
+                if None, the shared memory is created (the writer).
+        """
+        if capacity < 1:
+            raise ValueError(f"capacity must be a positive integer, got {capacity}")
+        self._schema: dict[str, np.dtype[Any]] = {
+            col: np.dtype(dtype) for col, dtype in schema.items()
+        }
+        if object_cols := [
+            col for col, dtype in self._schema.items() if dtype.hasobject
+        ]:
+            raise ValueError(
+                f"Columns of dtype object can't be stored in shared memory: {object_cols}"
+            )
+        self._capacity = capacity
+        offsets: list[int] = []
+        size = _HEADER_SIZE
+        for dtype in self._schema.values():
+            offsets.append(size)
+            # 8-byte aligned columns
+            size += -(-capacity * dtype.itemsize // 8) * 8
+        self._is_writer = name is None
+        self._shm = SharedMemory(name=name, create=self._is_writer, size=size)
+        self._header: np.ndarray = np.ndarray(3, dtype=np.int64, buffer=self._shm.buf)
+        self._columns: list[np.ndarray] = [
+            np.ndarray(capacity, dtype=dtype, buffer=self._shm.buf, offset=offset)
+            for dtype, offset in zip(self._schema.values(), offsets, strict=True)
+        ]
+        if self._is_writer:
+            self._header[:] = 0
+        # row id of the next row to read and version last read, see read()
+        self._row_id = 0
+        self._version = 0
+
+    @property
+    def name(self) -> str:
+        """Name of the shared memory, passed to the reader to attach to it."""
+        return self._shm.name
+
+    @property
+    def schema(self) -> dict[str, np.dtype[Any]]:
+        return dict(self._schema)
+
+    @property
+    def capacity(self) -> int:
+        return self._capacity
+
+    def write(self, first_row_id: int, columns: list[np.ndarray]) -> None:
+        """Writes rows with consecutive ids starting at first_row_id, given as one array per column.
+        Rows already written (e.g. an incremental update of the last bar) are overwritten.
+        """
+        num_rows = len(columns[0])
+        if not num_rows:
+            return
+        # only the last capacity rows fit
+        skip = max(num_rows - self._capacity, 0)
+        positions = (
+            np.arange(first_row_id + skip, first_row_id + num_rows) % self._capacity
+        )
+        header = self._header
+        header[_SEQ] += 1
+        for array, values in zip(self._columns, columns, strict=True):
+            array[positions] = values[skip:]
+        header[_END] = max(int(header[_END]), first_row_id + num_rows)
+        header[_VERSION] += 1
+        header[_SEQ] += 1
+
+    def read(self) -> tuple[tuple[Any, ...] | None, list[np.ndarray]] | None:
+        """Returns the rows written since the last call, None if nothing has been written,
+        or if the writer kept writing (or died while writing) during every attempt to read.
+
+        Returns:
+            last_row: the current values of the last row returned by the previous call, which the writer
+                may have overwritten since, None if it's not in the ring anymore or there was no previous call.
+            columns: the new rows, one array (copied out of the shared memory) per column.
+        """
+        header = self._header
+        for _ in range(_MAX_READ_ATTEMPTS):
+            seq = int(header[_SEQ])
+            if seq % 2:
+                # the writer is in the middle of a write
+                time.sleep(0)
+                continue
+            end, version = int(header[_END]), int(header[_VERSION])
+            if version == self._version:
+                return None
+            start = max(self._row_id - 1, end - self._capacity, 0)
+            positions = np.arange(start, end) % self._capacity
+            # fancy indexing copies
+            columns = [array[positions] for array in self._columns]
+            if int(header[_SEQ]) == seq:
+                break
+        else:
+            return None
+        has_last_row = 0 < self._row_id == start + 1
+        self._row_id, self._version = end, version
+        if has_last_row:
+            return tuple(values[0] for values in columns), [
+                values[1:] for values in columns
+            ]
+        return None, columns
+
+    def close(self) -> None:
+        """Detaches from the shared memory, which the writer also frees."""
+        # the shared memory can't be closed while arrays are pointing at it
+        self._header = None
+        self._columns = []
+        self._shm.close()
+        if self._is_writer:
+            self._shm.unlink()
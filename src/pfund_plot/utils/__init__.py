@@ -68,16 +68,6 @@ def is_daily_data(df: nw.DataFrame[Any]) -> bool:
     return False
 
 
-def load_panel_extensions(extensions: list[str] | None = None):
-    import panel as pn
-
-    extensions = extensions or []
-    for extension in extensions:
-        if extension not in pn.extension._loaded_extensions:
-            pn.extension(extension)
-            print(f"loaded Panel extension: {extension}")
-
-
 def match_df_with_data_tool(df: IntoFrame) -> DataTool:
     import pandas as pd
 
@@ -1,13 +1,30 @@
 # pyright: reportArgumentType=false, reportUnknownMemberType=false, reportUnknownVariableType=false
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Any, Literal
+from collections.abc import Callable, Container, Hashable, Iterator
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
 
 if TYPE_CHECKING:
     import narwhals as nw
-    from bokeh.models import CustomJSHover, HoverTool
+    from bokeh.models import (
+        ColumnDataSource,
+        CrosshairTool,
+        CustomJSHover,
+        HoverTool,
+        Range1d,
+    )
+
+from contextlib import contextmanager
+from contextvars import ContextVar
 
 DatetimePrecision = Literal["d", "s", "ms"]
+ToolCache = dict[Hashable, Any]
+_T = TypeVar("_T")
+
+# the cache of the plot being built, see cache_tools()
+_tool_cache: ContextVar[ToolCache | None] = ContextVar(
+    "pfund_plot_tool_cache", default=None
+)
 
 DATETIME_PRECISION_FORMATS: dict[DatetimePrecision, str] = {
     "d": "%Y-%m-%d",
@@ -24,6 +41,49 @@ def get_datetime_hover_format(datetime_precision: DatetimePrecision) -> str:
     return DATETIME_PRECISION_FORMATS[datetime_precision]
 
 
+@contextmanager
+def cache_tools(cache: ToolCache) -> Iterator[None]:
+    """Reuse the hover tools, their formatters and the crosshair tools created in this context from cache.
+
+    A plot is rebuilt on every DynamicMap re-render (e.g. streaming refreshes and widget drags),
+    building its tools only once per (schema, columns, datetime_precision) saves creating them
+    again and again, and the rendered plot keeps the same Bokeh models.
+
+    NOTE: cache must belong to a single plot. HoloViews copies the tools into every figure it renders,
+    but not the formatters of a hover tool, which are Bokeh models and can only be in one document,
+    so they can't be shared with e.g. another session's plot.
+    """
+    token = _tool_cache.set(cache)
+    try:
+        yield
+    finally:
+        _tool_cache.reset(token)
+
+
+def _get_cached(key: Hashable, create: Callable[[], _T]) -> _T:
+    cache = _tool_cache.get()
+    if cache is None:
+        return create()
+    if key not in cache:
+        cache[key] = create()
+    return cache[key]
+
+
+def _get_hover_key(
+    schema: nw.Schema,
+    x_col: str | None,
+    y_cols: list[str],
+    datetime_precision: DatetimePrecision,
+) -> tuple[Hashable, ...]:
+    """Identifies a tooltip, i.e. the columns it shows, their dtypes and the datetime_precision."""
+    cols = ([x_col] if x_col is not None else []) + y_cols
+    return (
+        x_col,
+        tuple((col, str(schema[col])) for col in cols),
+        datetime_precision,
+    )
+
+
 def create_number_formatter_for_hover_tool(
     significant_digits: int = 6,
 ) -> CustomJSHover:
@@ -44,16 +104,23 @@ def create_hover_col_format(
     df: nw.DataFrame[Any],
     col: str,
     datetime_precision: DatetimePrecision = "s",
+    schema: nw.Schema | None = None,
+    num_formatter: CustomJSHover | None = None,
 ) -> tuple[tuple[str, str], tuple[str, str | CustomJSHover] | None]:
     """Create the tooltip and formatter for a single column based on its dtype.
 
+    Args:
+        schema: df's schema, to avoid collecting it again for every column.
+        num_formatter: formatter of numeric columns, can be shared by all the columns of a tooltip.
+            If None, a new one is created.
+
     Returns:
         (tooltip, formatter_entry or None)
         - tooltip: e.g. ("date", "@{date}{%Y-%m-%d %H:%M:%S}")
         - formatter_entry: e.g. ("@{date}", "datetime"), or None if no formatter needed
     """
-    num_formatter = create_number_formatter_for_hover_tool()
-    schema = df.collect_schema()
+    if schema is None:
+        schema = df.collect_schema()
     col_dtype = schema[col]
     is_datetime = (
         "datetime" in str(col_dtype).lower() or "date" in str(col_dtype).lower()
@@ -62,6 +129,8 @@ def create_hover_col_format(
         date_format = get_datetime_hover_format(datetime_precision)
         return (col, f"@{{{col}}}{{{date_format}}}"), (f"@{{{col}}}", "datetime")
     elif col_dtype.is_numeric():
+        if num_formatter is None:
+            num_formatter = create_number_formatter_for_hover_tool()
         return (col, f"@{{{col}}}{{custom}}"), (f"@{{{col}}}", num_formatter)
     else:
         return (col, f"@{{{col}}}"), None
@@ -80,15 +149,25 @@ def _bundle_hover_config(
     hvplot creates separate renderers per y column, use create_hover_col_format()
     to build per-column tooltips instead.
     """
-    tooltips: list[tuple[str, str]] = []
-    formatters: dict[str, str | CustomJSHover] = {}
     cols = ([x_col] if x_col is not None else []) + y_cols
-    for col in cols:
-        tooltip, formatter_entry = create_hover_col_format(df, col, datetime_precision)
-        tooltips.append(tooltip)
-        if formatter_entry is not None:
-            formatters[formatter_entry[0]] = formatter_entry[1]
-    return tooltips, formatters
+    schema = df.collect_schema()
+
+    def _create() -> tuple[list[tuple[str, str]], dict[str, str | CustomJSHover]]:
+        tooltips: list[tuple[str, str]] = []
+        formatters: dict[str, str | CustomJSHover] = {}
+        # all the numeric columns share one formatter model
+        num_formatter = create_number_formatter_for_hover_tool()
+        for col in cols:
+            tooltip, formatter_entry = create_hover_col_format(
+                df, col, datetime_precision, schema=schema, num_formatter=num_formatter
+            )
+            tooltips.append(tooltip)
+            if formatter_entry is not None:
+                formatters[formatter_entry[0]] = formatter_entry[1]
+        return tooltips, formatters
+
+    key = ("hover_config", *_get_hover_key(schema, x_col, y_cols, datetime_precision))
+    return _get_cached(key, _create)
 
 
 def create_bundled_hover_tool(
@@ -106,7 +185,24 @@ def create_bundled_hover_tool(
     from bokeh.models import HoverTool
 
     tooltips, formatters = _bundle_hover_config(df, x_col, y_cols, datetime_precision)
-    return HoverTool(tooltips=tooltips, formatters=formatters, mode="vline")
+    key = (
+        "hover_tool",
+        *_get_hover_key(df.collect_schema(), x_col, y_cols, datetime_precision),
+    )
+    return _get_cached(
+        key,
+        lambda: HoverTool(tooltips=tooltips, formatters=formatters, mode="vline"),
+    )
+
+
+def create_crosshair_tool() -> CrosshairTool:
+    """Create the vertical crosshair shared by the plots of the bokeh backend."""
+    from bokeh.models import CrosshairTool
+
+    return _get_cached(
+        "crosshair_tool",
+        lambda: CrosshairTool(dimensions="height", line_color="gray", line_alpha=0.3),
+    )
 
 
 def create_hover_scatter(
@@ -132,7 +228,14 @@ def create_hover_scatter(
     """
     import holoviews as hv
 
-    native_df = df.to_native()
+    # NOTE: pass plain NumPy columns rather than e.g. a polars frame, HoloViews would put
+    # polars Series into the ColumnDataSource, and comparing them against the next update's
+    # Series fails when the length changes (e.g. filtered by a widget or downsampled)
+    native_df = (
+        {col: df[col].to_numpy() for col in [x_col, *y_cols]}
+        if x_col is not None
+        else df.to_native()
+    )
     hover_tool = create_bundled_hover_tool(df, x_col, y_cols, datetime_precision)
     scatter_opts: dict[str, Any] = dict(
         size=7 if marker else 15,
@@ -175,3 +278,111 @@ def create_vline_hover_opts(
         hover_tooltips=[("series", "@{Variable}"), *tooltips],
         hover_formatters=formatters,
     )
+
+
+def get_hv_plot_sources(
+    plot: Any, subplots: Container[Any] | None = None
+) -> list[ColumnDataSource]:
+    """Return the ColumnDataSources of all glyphs in a rendered HoloViews (bokeh) plot,
+    in traversal order, e.g. [segments source, rectangles source] for an ohlc plot.
+
+    Args:
+        subplots: if not None, only the glyphs rendered by these (sub)plots of plot,
+            e.g. the layers of one of the plots composited into an overlay.
+    """
+    return plot.traverse(
+        lambda subplot: subplot.handles["source"],
+        [
+            lambda subplot: (
+                "source" in subplot.handles
+                and (subplots is None or subplot in subplots)
+            )
+        ],
+    )
+
+
+def run_on_hv_plot(plot: Any, func: Callable[[], None]) -> None:
+    """Run func, which mutates the Bokeh models of a rendered HoloViews plot,
+    the same way Panel's HoloViews pane applies its own plot updates:
+    immediately if the document is not locked by a server session (e.g. notebook comms,
+    then pushed to the frontend), otherwise on the next tick of the session's event loop.
+    """
+    from panel.io import state, unlocked
+
+    document = plot.document
+    if plot.comm or state._unblocked(document) or not document.session_context:
+        with unlocked():
+            func()
+        if plot.comm and "embedded" not in plot.root.tags:
+            plot.push()
+    else:
+        document.add_next_tick_callback(func)
+
+
+def stream_to_sources(
+    updates: dict[ColumnDataSource, dict[str, Any]],
+    rollover: int | None = None,
+) -> None:
+    """Patch the last row of each source with the first row of its update,
+    then append the remaining rows with ColumnDataSource.stream().
+
+    Only the changed last row and the new rows are sent to the browser,
+    instead of re-serializing every column of the source.
+
+    Args:
+        updates: source -> {column: values}, values[0] replaces the source's last row,
+            values[1:] are new rows.
+        rollover: maximum number of rows kept in each source (oldest dropped first).
+    """
+    for source, columns in updates.items():
+        last_idx = len(next(iter(source.data.values()))) - 1
+        source.patch({col: [(last_idx, values[0])] for col, values in columns.items()})
+        new_rows = {col: values[1:] for col, values in columns.items()}
+        if len(next(iter(new_rows.values()))):
+            source.stream(new_rows, rollover=rollover)
+
+
+def to_epoch_ms(value: Any) -> float:
+    """Convert a datetime-like range value to milliseconds since epoch, Bokeh's datetime unit.
+    Range values are numpy datetimes when set by HoloViews, but floats once synced back from the browser.
+    """
+    import numpy as np
+
+    if isinstance(value, int | float):
+        return float(value)
+    return np.datetime64(value, "ns").astype("int64") / 1e6
+
+
+def follow_x_range(
+    x_range: Range1d,
+    old_bounds: tuple[float, float],
+    new_bounds: tuple[float, float],
+) -> None:
+    """Move a datetime Range1d along with streamed data.
+
+    Only follows if the view currently reaches the last data point (i.e. the user
+    hasn't panned back in time). If the view includes the first data point, the range is
+    expanded to keep showing all the data, otherwise the window is scrolled.
+
+    Args:
+        old_bounds: (first, last) dates in epoch ms of the data before the update.
+        new_bounds: (first, last) dates in epoch ms of the data after the update.
+    """
+    (old_first, old_last), (new_first, new_last) = old_bounds, new_bounds
+    start, end = to_epoch_ms(x_range.start), to_epoch_ms(x_range.end)
+    if end < old_last:
+        return
+    end_shift = new_last - old_last
+    start_shift = new_first - old_first if start <= old_first else end_shift
+    x_range.update(start=start + start_shift, end=end + end_shift)
+
+
+def fit_y_range(
+    y_range: Range1d, low: float, high: float, padding: float = 0.1
+) -> None:
+    """Fit a Range1d to [low, high] with HoloViews' default padding (10% of the span on each side).
+    A zero baseline (e.g. bar plots) is kept.
+    """
+    pad = (high - low) * padding
+    start = 0 if y_range.start == 0 and low >= 0 else low - pad
+    y_range.update(start=start, end=high + pad)
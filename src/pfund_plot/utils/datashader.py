@@ -0,0 +1,138 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    import narwhals as nw
+    from holoviews.core.overlay import Overlay
+
+__all__ = ["RasterGlyph", "is_rasterized", "rasterize_df"]
+
+
+# how the data points are drawn onto the raster:
+# "line" connects consecutive points (line), "point" draws each point (scatter),
+# "spike" draws a vertical line from 0 to each point (bar, area)
+RasterGlyph = Literal["line", "point", "spike"]
+# raster size used when the plot's size in pixels is not known (yet)
+DEFAULT_WIDTH = 1000
+DEFAULT_HEIGHT = 280
+# colors cycled through for multiple y columns
+DEFAULT_COLORS = [
+    "#1f77b4",
+    "#ff7f0e",
+    "#2ca02c",
+    "#d62728",
+    "#9467bd",
+    "#8c564b",
+    "#e377c2",
+    "#7f7f7f",
+    "#bcbd22",
+    "#17becf",
+]
+
+
+def is_rasterized(control: dict[str, Any] | None, num_rows: int) -> bool:
+    """Whether a plot with num_rows rows should be rasterized given its control,
+    i.e. control["rasterize"] is True, or "auto" and num_rows reaches control["rasterize_threshold"].
+    """
+    rasterize = (control or {}).get("rasterize", False)
+    if rasterize == "auto":
+        return num_rows >= control["rasterize_threshold"]
+    return bool(rasterize)
+
+
+def _slice_x_range(
+    df: nw.DataFrame[Any], x_col: str, x_range: tuple[Any, Any] | None
+) -> tuple[nw.DataFrame[Any], tuple[Any, Any] | None]:
+    """Slice df (sorted by x_col) to x_range, plus one row on each side so lines reach the edges.
+
+    Returns the sliced df and x_range in the x column's unit,
+    x_range is None if it doesn't apply (e.g. it doesn't overlap the data).
+    """
+    import numpy as np
+
+    if x_range is None or None in x_range:
+        return df, None
+    x = df[x_col].to_numpy()
+    if len(x) < 2 or np.any(x[1:] < x[:-1]):
+        return df, None
+    if x.dtype.kind == "M":
+        # range values are epoch ms (Bokeh's datetime unit) once synced back from the browser
+        x_range = tuple(
+            np.datetime64(int(value * 1e6), "ns")
+            if isinstance(value, int | float)
+            else np.datetime64(value, "ns")
+            for value in x_range
+        )
+    start, end = x_range
+    first = max(int(np.searchsorted(x, start, side="left")) - 1, 0)
+    last = min(int(np.searchsorted(x, end, side="right")) + 1, len(x))
+    # the range doesn't overlap the data (e.g. the data was just replaced), rasterize everything
+    if last - first < 2:
+        return df, None
+    return df[first:last], x_range
+
+
+def rasterize_df(
+    df: nw.DataFrame[Any],
+    x_col: str,
+    y_cols: list[str],
+    glyph: RasterGlyph,
+    color: str | list[str] | None = None,
+    x_range: tuple[Any, Any] | None = None,
+    y_range: tuple[Any, Any] | None = None,
+    width: int | None = None,
+    height: int | None = None,
+) -> Overlay:
+    """Render df server-side into one image per y column with datashader,
+    for plots with too many points to be sent to the browser.
+
+    Only the rows in the visible x range are aggregated, at the plot's size in pixels,
+    the caller re-runs it when the range or size changes (e.g. in a DynamicMap with
+    RangeXY and PlotSize streams).
+
+    Args:
+        glyph: how the points are drawn, see RasterGlyph.
+        color: the color of each y column, cycled through DEFAULT_COLORS if None.
+        x_range: the visible x range, if None, the full range.
+        y_range: the visible y range, if None, the full range.
+        width: the plot's width in pixels, DEFAULT_WIDTH if None.
+        height: the plot's height in pixels, DEFAULT_HEIGHT if None.
+    """
+    import holoviews as hv
+    from holoviews.operation.datashader import datashade
+
+    df, x_range = _slice_x_range(df, x_col, x_range)
+    if x_range is None:
+        # the y range belongs to the same view as the x range
+        y_range = None
+    if color is None:
+        colors = DEFAULT_COLORS
+    else:
+        colors = [color] if isinstance(color, str) else color
+    x_values = df[x_col].to_numpy()
+    ElementClass = {"line": hv.Curve, "point": hv.Points, "spike": hv.Spikes}[glyph]
+    images = []
+    for i, y_col in enumerate(y_cols):
+        data = {x_col: x_values, y_col: df[y_col].to_numpy()}
+        if ElementClass is hv.Points:
+            element = hv.Points(data, kdims=[x_col, y_col])
+        else:
+            element = ElementClass(data, kdims=[x_col], vdims=[y_col])
+        images.append(
+            datashade(
+                element,
+                dynamic=False,
+                cmap=[colors[i % len(colors)]],
+                # keep sparse pixels visible instead of almost transparent
+                min_alpha=100,
+                x_range=x_range,
+                y_range=y_range
+                if y_range is not None and None not in y_range
+                else None,
+                width=width or DEFAULT_WIDTH,
+                height=height or DEFAULT_HEIGHT,
+            )
+        )
+    return hv.Overlay(images)
@@ -0,0 +1,178 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Literal
+
+if TYPE_CHECKING:
+    import narwhals as nw
+
+import numpy as np
+
+__all__ = ["DownsampleAlgorithm", "downsample_df", "lttb", "minmax"]
+
+
+DownsampleAlgorithm = Literal["lttb", "minmax"]
+# number of points used when the plot's width in pixels is not known (yet)
+DEFAULT_NUM_POINTS = 1000
+# share of num_points used for the data outside of the visible x range
+OUT_OF_RANGE_RATIO = 0.2
+
+
+def lttb(x: np.ndarray, y: np.ndarray, num_points: int) -> np.ndarray:
+    """Largest-Triangle-Three-Buckets downsampling.
+
+    Keeps the first and last points, splits the rest into num_points - 2 buckets of
+    equal size and picks from each bucket the point forming the largest triangle with
+    the point picked from the previous bucket and the average of the next bucket.
+    The loop is over buckets only, each bucket is processed with NumPy.
+
+    Args:
+        x: sorted x values as floats
+        y: y values as floats, without NaNs
+        num_points: number of points to keep
+
+    Returns:
+        indices of the selected points
+    """
+    n = len(x)
+    if num_points >= n or num_points < 3:
+        return np.arange(n)
+    # bucket i covers [edges[i], edges[i + 1]), the first and last points are buckets of their own
+    edges = np.linspace(1, n - 1, num_points - 1).astype(np.int64)
+    # average point of each bucket, the next bucket's average is the third triangle vertex
+    counts = np.diff(edges)
+    avg_x = np.add.reduceat(x[1 : n - 1], edges[:-1] - 1) / counts
+    avg_y = np.add.reduceat(y[1 : n - 1], edges[:-1] - 1) / counts
+    avg_x = np.append(avg_x[1:], x[-1])
+    avg_y = np.append(avg_y[1:], y[-1])
+    indices = np.empty(num_points, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    prev = 0
+    for i in range(num_points - 2):
+        start, end = edges[i], edges[i + 1]
+        bucket_x, bucket_y = x[start:end], y[start:end]
+        # twice the triangle area, the constant factor doesn't change the argmax
+        areas = np.abs(
+            (x[prev] - avg_x[i]) * (bucket_y - y[prev])
+            - (x[prev] - bucket_x) * (avg_y[i] - y[prev])
+        )
+        prev = start + int(np.argmax(areas))
+        indices[i + 1] = prev
+    return indices
+
+
+def minmax(x: np.ndarray, y: np.ndarray, num_points: int) -> np.ndarray:
+    """Min/max downsampling over equal-width x buckets (e.g. one bucket per 2 pixels).
+
+    Keeps the minimum and the maximum of each bucket plus the first and last points,
+    so spikes are never lost, which LTTB doesn't guarantee.
+
+    Args:
+        x: x values as floats, unsorted values are sorted first
+        y: y values as floats, without NaNs
+        num_points: maximum number of points to keep (2 per bucket)
+
+    Returns:
+        indices of the selected points
+    """
+    n = len(x)
+    # the first and last points are kept besides the buckets' min and max
+    num_buckets = (num_points - 2) // 2
+    if num_points >= n or num_buckets < 1:
+        return np.arange(n)
+    order = None
+    if np.any(x[1:] < x[:-1]):
+        order = np.argsort(x, kind="stable")
+        x, y = x[order], y[order]
+    # start of each non-empty bucket, buckets are contiguous since x is sorted
+    edges = np.linspace(x[0], x[-1], num_buckets + 1)[1:-1]
+    starts = np.unique(np.r_[0, np.searchsorted(x, edges)])
+    starts = starts[starts < n]
+    counts = np.diff(np.r_[starts, n])
+    selected = [np.array([0, n - 1])]
+    for reduce in (np.minimum, np.maximum):
+        extremes = reduce.reduceat(y, starts)
+        # first row of each bucket holding its extreme value
+        hits = np.flatnonzero(y == np.repeat(extremes, counts))
+        selected.append(hits[np.searchsorted(hits, starts)])
+    indices = np.unique(np.concatenate(selected))
+    return order[indices] if order is not None else indices
+
+
+def _to_numeric(values: np.ndarray) -> np.ndarray:
+    if values.dtype.kind == "M":
+        return values.astype("datetime64[ns]").view("int64").astype(np.float64)
+    return values.astype(np.float64, copy=False)
+
+
+def _to_numeric_bound(value: Any, is_datetime: bool) -> float:
+    # x range values are datetimes for datetime axes,
+    # but may also arrive as epoch ms (Bokeh's datetime unit)
+    if is_datetime:
+        if isinstance(value, int | float):
+            return float(value) * 1e6
+        return float(np.datetime64(value, "ns").astype("int64"))
+    return float(value)
+
+
+def downsample_df(
+    df: nw.DataFrame[Any],
+    x_col: str | None,
+    y_cols: list[str],
+    algorithm: DownsampleAlgorithm,
+    num_points: int | None = None,
+    x_range: tuple[Any, Any] | None = None,
+) -> nw.DataFrame[Any]:
+    """Downsample df to about num_points rows for plotting, keeping full detail in the visible range.
+
+    The rows inside x_range are downsampled to num_points, the rows outside of it
+    (kept so that the plot's extent doesn't change) to a fraction of that.
+    For multiple y columns, the union of the rows selected for each column is kept.
+
+    Args:
+        df: the data, sorted by x_col for "lttb"
+        x_col: the x column, if None, the row position is used
+        y_cols: the y columns, non-numeric ones are ignored
+        algorithm: "lttb" or "minmax"
+        num_points: number of points to keep in the visible range, usually the plot's width in pixels.
+            If None, DEFAULT_NUM_POINTS is used.
+        x_range: (start, end) of the visible x range, if None, the full range is visible.
+    """
+    num_points = num_points or DEFAULT_NUM_POINTS
+    num_rows = len(df)
+    if num_rows <= num_points:
+        return df
+    downsample_func = {"lttb": lttb, "minmax": minmax}[algorithm]
+
+    if x_col is not None:
+        x_values = df[x_col].to_numpy()
+        is_datetime = x_values.dtype.kind == "M"
+        x = _to_numeric(x_values)
+    else:
+        is_datetime = False
+        x = np.arange(num_rows, dtype=np.float64)
+
+    # rows inside and outside of the visible x range are downsampled separately
+    if x_range is not None and None not in x_range:
+        start, end = (_to_numeric_bound(value, is_datetime) for value in x_range)
+        is_visible = (x >= start) & (x <= end)
+    else:
+        is_visible = np.ones(num_rows, dtype=bool)
+    num_out_of_range_points = max(int(num_points * OUT_OF_RANGE_RATIO), 2)
+    masks = [(is_visible, num_points), (~is_visible, num_out_of_range_points)]
+
+    selected: list[np.ndarray] = []
+    for y_col in y_cols:
+        y_values = df[y_col].to_numpy()
+        if y_values.dtype.kind not in "biuf":
+            continue
+        y = y_values.astype(np.float64, copy=False)
+        is_valid = ~np.isnan(y)
+        for mask, n in masks:
+            rows = np.flatnonzero(mask & is_valid)
+            if len(rows):
+                selected.append(rows[downsample_func(x[rows], y[rows], n)])
+    if not selected:
+        return df
+    indices = np.unique(np.concatenate(selected))
+    return df[indices]
@@ -0,0 +1,112 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from typing import Any
+
+import narwhals as nw
+import numpy as np
+
+__all__ = ["aggregate_ticks", "choose_resolution", "infer_resolution", "resample_ohlc"]
+
+
+_NS_PER_SECOND = 1_000_000_000
+# resolutions bars can be re-aggregated to, in seconds
+RESOLUTIONS: dict[str, int] = {
+    "1s": 1,
+    "5s": 5,
+    "15s": 15,
+    "30s": 30,
+    "1m": 60,
+    "5m": 5 * 60,
+    "15m": 15 * 60,
+    "30m": 30 * 60,
+    "1h": 60 * 60,
+    "4h": 4 * 60 * 60,
+    "1d": 24 * 60 * 60,
+    "1w": 7 * 24 * 60 * 60,
+}
+# the epoch (1970-01-01) is a Thursday, shift weekly buckets by 3 days so that they start on Mondays
+_WEEK_OFFSET_NS = 3 * 24 * 60 * 60 * _NS_PER_SECOND
+
+
+def _to_ns(dates: np.ndarray) -> np.ndarray:
+    return dates.astype("datetime64[ns]").view("int64")
+
+
+def infer_resolution(dates: np.ndarray) -> int:
+    """Infer the bar resolution in ns from sorted dates, as the smallest gap between two bars."""
+    diffs = np.diff(_to_ns(dates))
+    diffs = diffs[diffs > 0]
+    return int(diffs.min()) if len(diffs) else 0
+
+
+def choose_resolution(resolution_ns: int, span_ns: float, max_bars: int) -> str | None:
+    """Choose the finest resolution in RESOLUTIONS, coarser than the bars' resolution,
+    that fits the span into at most max_bars bars.
+
+    Returns None if the bars' own resolution already fits (i.e. no re-aggregation needed).
+    """
+    if resolution_ns <= 0 or span_ns / resolution_ns <= max_bars:
+        return None
+    for resolution, seconds in RESOLUTIONS.items():
+        every_ns = seconds * _NS_PER_SECOND
+        if every_ns > resolution_ns and span_ns / every_ns <= max_bars:
+            return resolution
+    return list(RESOLUTIONS)[-1]
+
+
+def _group_by_bucket(
+    dates: np.ndarray, resolution: str
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Group sorted dates by their bucket (date floored to the resolution).
+
+    Returns the start date of each bucket, and the index of its first and last row.
+    """
+    every_ns = RESOLUTIONS[resolution] * _NS_PER_SECOND
+    offset_ns = _WEEK_OFFSET_NS if resolution == "1w" else 0
+    buckets = (_to_ns(dates) + offset_ns) // every_ns
+    starts = np.flatnonzero(np.r_[True, buckets[1:] != buckets[:-1]])
+    ends = np.r_[starts[1:], len(buckets)] - 1
+    bucket_dates = (buckets[starts] * every_ns - offset_ns).astype("datetime64[ns]")
+    return bucket_dates, starts, ends
+
+
+def aggregate_ticks(
+    dates: np.ndarray, prices: np.ndarray, volumes: np.ndarray, resolution: str
+) -> list[np.ndarray]:
+    """Fold sorted ticks into OHLCV bars of a resolution in RESOLUTIONS, e.g. "1m".
+
+    Like resample_ohlc(), with open/high/low/close all taken from the tick prices.
+
+    Returns:
+        the bars' date, open, high, low, close and volume columns
+    """
+    bar_dates, starts, ends = _group_by_bucket(dates, resolution)
+    return [
+        bar_dates,
+        prices[starts],
+        np.maximum.reduceat(prices, starts),
+        np.minimum.reduceat(prices, starts),
+        prices[ends],
+        np.add.reduceat(volumes, starts),
+    ]
+
+
+def resample_ohlc(df: nw.DataFrame[Any], resolution: str) -> nw.DataFrame[Any]:
+    """Re-aggregate OHLC(V) bars sorted by "date" to a coarser resolution, e.g. "1h".
+
+    Vectorized with NumPy: rows are grouped by their bucket (date floored to the resolution),
+    open/close are the first/last of each bucket, high/low the max/min, and volume the sum.
+    Each new bar is dated at the start of its bucket.
+    """
+    bar_dates, starts, ends = _group_by_bucket(df["date"].to_numpy(), resolution)
+    data: dict[str, np.ndarray] = {
+        "date": bar_dates,
+        "open": df["open"].to_numpy()[starts],
+        "high": np.maximum.reduceat(df["high"].to_numpy(), starts),
+        "low": np.minimum.reduceat(df["low"].to_numpy(), starts),
+        "close": df["close"].to_numpy()[ends],
+    }
+    if "volume" in df.columns:
+        data["volume"] = np.add.reduceat(df["volume"].to_numpy(), starts)
+    return nw.from_dict(data, backend=nw.get_native_namespace(df))
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import time
+from collections.abc import Callable, Hashable
+from dataclasses import dataclass
+
+__all__ = ["RefreshEntry", "RefreshScheduler"]
+
+
+# shortest period in ms of the scheduler's periodic callback
+MIN_PERIOD = 50
+# share of the scheduler's period that can be spent refreshing plots (the frame budget),
+# plots that didn't fit are refreshed first on the next tick
+FRAME_BUDGET = 0.5
+# share of the time a single plot can spend refreshing,
+# e.g. a plot taking 100ms to refresh is refreshed at most every 100 / 0.2 = 500ms
+MAX_LOAD = 0.2
+# weight of the latest measurement in the moving average of the refresh cost
+SMOOTHING = 0.3
+
+
+@dataclass(slots=True)
+class RefreshEntry:
+    """A plot's streaming refresh driven by a RefreshScheduler.
+
+    Args:
+        refresh: updates the plot with the data received since the last refresh.
+        get_version: returns a value that changes whenever new data has been received.
+        min_interval: shortest interval between two refreshes in ms.
+        max_interval: longest interval between two refreshes in ms while data keeps arriving.
+    """
+
+    refresh: Callable[[], None]
+    get_version: Callable[[], Hashable]
+    min_interval: int
+    max_interval: int
+    # the adapted interval in seconds
+    interval: float = 0.0
+    last_refresh: float = 0.0
+    refreshed_version: Hashable = None
+    # moving average of the refresh duration in seconds
+    cost: float = 0.0
+
+    def __post_init__(self):
+        self.interval = self.min_interval / 1000
+
+
+class RefreshScheduler:
+    """Refreshes the streaming plots of a renderer (e.g. all the plots in a Layout or Tabs)
+    from one periodic callback, instead of every plot polling at a fixed update_interval.
+
+    A plot is only refreshed when its data has changed, so it follows the data's arrival rate
+    (e.g. a quiet instrument is not refreshed at all), and no more often than its interval, which
+    adapts to how long the plot takes to refresh: it spends at most MAX_LOAD of the time
+    refreshing, within [min_interval, max_interval]. On every tick, due plots are refreshed,
+    most overdue first, until FRAME_BUDGET of the period is spent, so that many plots
+    can't overload the server.
+    """
+
+    def __init__(self):
+        self._entries: list[RefreshEntry] = []
+
+    @property
+    def entries(self) -> list[RefreshEntry]:
+        return self._entries
+
+    @property
+    def period(self) -> int:
+        """Period in ms the scheduler has to tick at, i.e. the shortest min_interval of its plots."""
+        if not self._entries:
+            return MIN_PERIOD
+        return max(min(entry.min_interval for entry in self._entries), MIN_PERIOD)
+
+    def add(self, entry: RefreshEntry) -> None:
+        if entry not in self._entries:
+            self._entries.append(entry)
+
+    def tick(self) -> None:
+        now = time.monotonic()
+        deadline = now + self.period / 1000 * FRAME_BUDGET
+        due: list[tuple[RefreshEntry, Hashable]] = []
+        for entry in self._entries:
+            if now - entry.last_refresh < entry.interval:
+                continue
+            version = entry.get_version()
+            if version != entry.refreshed_version:
+                due.append((entry, version))
+        due.sort(key=lambda item: item[0].last_refresh + item[0].interval)
+        for i, (entry, version) in enumerate(due):
+            # at least one plot is refreshed per tick, so that none starves
+            if i > 0 and time.monotonic() >= deadline:
+                break
+            start = time.monotonic()
+            entry.refresh()
+            end = time.monotonic()
+            entry.cost = _smooth(entry.cost, end - start)
+            entry.last_refresh, entry.refreshed_version = end, version
+            entry.interval = min(
+                max(entry.min_interval / 1000, entry.cost / MAX_LOAD),
+                entry.max_interval / 1000,
+            )
+
+
+def _smooth(average: float, value: float) -> float:
+    return value if average == 0.0 else average + SMOOTHING * (value - average)
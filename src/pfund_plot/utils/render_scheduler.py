@@ -0,0 +1,168 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from asyncio import AbstractEventLoop
+
+    from bokeh.document import Document
+
+import asyncio
+import time
+from dataclasses import dataclass
+from functools import partial
+from threading import Condition, Thread
+
+__all__ = ["RenderScheduler"]
+
+
+# seconds without a newer request before a render starts
+DEFAULT_DELAY = 0.05
+# seconds the worker thread stays alive without requests, it is restarted by the next submit()
+IDLE_TIMEOUT = 30.0
+
+
+@dataclass(slots=True)
+class _RenderRequest:
+    generation: int
+    compute: Callable[[], Any]
+    apply: Callable[[Any], None]
+    doc: Document | None
+    loop: AbstractEventLoop | None
+    deadline: float
+
+
+class RenderScheduler:
+    """Sits between widgets and a pane, coalescing bursts of render requests
+    (e.g. dragging a slider) into a single render of the latest one.
+
+    submit(compute, apply) records a request, the most recent request replaces any pending one.
+    Once no newer request has arrived for `delay` seconds, a worker thread runs compute()
+    (e.g. filtering the data and building the plot) off the Bokeh event loop, then apply(result)
+    is scheduled back onto the event loop, where the Document's events are held so the browser
+    receives the update in one go. Results of requests superseded while they were being
+    computed (or waiting for the event loop) are dropped.
+
+    Without an event loop to hand the result back to (e.g. in a plain Python script),
+    requests are computed and applied synchronously.
+    """
+
+    def __init__(self, delay: float = DEFAULT_DELAY):
+        """
+        Args:
+            delay: seconds without a newer request before a render starts.
+        """
+        self._delay = delay
+        self._cond = Condition()
+        self._pending: _RenderRequest | None = None
+        # bumped by every submit() and cancel(), results of older generations are dropped
+        self._generation = 0
+        self._worker: Thread | None = None
+
+    @staticmethod
+    def _get_event_loop() -> tuple[Document | None, AbstractEventLoop | None]:
+        """Returns the Bokeh server session's document or else the running asyncio loop
+        (e.g. the notebook kernel's) the result should be applied on, both None if there is none.
+        """
+        import panel as pn
+
+        doc = pn.state.curdoc
+        if doc is not None and doc.session_context is not None:
+            return doc, None
+        try:
+            return doc, asyncio.get_running_loop()
+        except RuntimeError:
+            return doc, None
+
+    def submit(self, compute: Callable[[], Any], apply: Callable[[Any], None]) -> None:
+        """Schedules apply(compute()), superseding any request that hasn't been applied yet.
+
+        Args:
+            compute: the expensive part of the render, runs in the worker thread,
+                so it must not modify Bokeh models.
+            apply: applies compute()'s result to the pane, runs on the event loop.
+        """
+        doc, loop = self._get_event_loop()
+        if loop is None and (doc is None or doc.session_context is None):
+            # no event loop to hand the result back to, render synchronously
+            self.cancel()
+            apply(compute())
+            return
+        with self._cond:
+            self._generation += 1
+            self._pending = _RenderRequest(
+                generation=self._generation,
+                compute=compute,
+                apply=apply,
+                doc=doc,
+                loop=loop,
+                deadline=time.monotonic() + self._delay,
+            )
+            self._cond.notify()
+            if self._worker is None:
+                self._worker = Thread(
+                    target=self._run, name="pfund_plot-render", daemon=True
+                )
+                self._worker.start()
+
+    def cancel(self) -> None:
+        """Drops the pending request and the result of the request being computed, if any."""
+        with self._cond:
+            self._generation += 1
+            self._pending = None
+            self._cond.notify()
+
+    def _next_request(self) -> _RenderRequest | None:
+        """Blocks until the pending request is due, returns None if the worker has been idle for too long."""
+        with self._cond:
+            while True:
+                if self._pending is None and not self._cond.wait_for(
+                    lambda: self._pending is not None, timeout=IDLE_TIMEOUT
+                ):
+                    # cleared under the lock, so that submit() starts a new worker
+                    self._worker = None
+                    return None
+                # debounce, every newer request pushes the deadline back
+                remaining = self._pending.deadline - time.monotonic()
+                if remaining <= 0:
+                    request, self._pending = self._pending, None
+                    return request
+                _ = self._cond.wait(remaining)
+
+    def _run(self) -> None:
+        from pfund_kit.style import RichColor, TextStyle, cprint
+
+        while (request := self._next_request()) is not None:
+            try:
+                result = request.compute()
+            # anything a plot function or a user callback raises, the worker thread must survive it
+            # (RUF100: BLE001 isn't selected by every ruff config this code is checked with)
+            except Exception as err:  # noqa: BLE001, RUF100
+                cprint(
+                    f"Failed to render: {err!r}",
+                    style=TextStyle.BOLD + RichColor.RED,
+                )
+                continue
+            # superseded while being computed, the newer request is already pending
+            if request.generation != self._generation:
+                continue
+            callback = partial(self._apply, request, result)
+            if request.loop is not None:
+                request.loop.call_soon_threadsafe(callback)
+            else:
+                request.doc.add_next_tick_callback(callback)
+
+    def _apply(self, request: _RenderRequest, result: Any) -> None:
+        from panel.io import hold
+        from panel.io.state import set_curdoc
+
+        # superseded while waiting for the event loop
+        if request.generation != self._generation:
+            return
+        if request.doc is None:
+            request.apply(result)
+            return
+        with set_curdoc(request.doc), hold(request.doc):
+            request.apply(result)
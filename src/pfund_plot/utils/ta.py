@@ -0,0 +1,469 @@
+# pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportUnknownArgumentType=false
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import deque
+from collections.abc import Mapping
+from typing import Any, ClassVar, Literal
+
+import numpy as np
+
+__all__ = ["INDICATORS", "Indicator", "IndicatorName", "create_indicator"]
+
+
+IndicatorName = Literal["sma", "ema", "rsi", "bollinger", "vwap", "atr"]
+# decay powers of an exponential moving average are computed in chunks over which they stay above e^-CHUNK_LOG,
+# so that their inverse doesn't overflow
+_CHUNK_LOG = 300.0
+
+
+def _to_float(values: Any) -> np.ndarray:
+    return np.asarray(values, dtype=np.float64)
+
+
+def _rolling_sum(values: np.ndarray, period: int) -> np.ndarray:
+    """Sum over the last `period` values, NaN for the first period - 1 rows."""
+    out = np.full(len(values), np.nan)
+    if len(values) >= period:
+        out[period - 1 :] = np.convolve(values, np.ones(period), mode="valid")
+    return out
+
+
+def _ewm(values: np.ndarray, alpha: float, initial: float) -> np.ndarray:
+    """Exponential moving average y[i] = (1 - alpha) * y[i-1] + alpha * values[i], with y[-1] = initial.
+
+    Vectorized with the closed form y[i] = d[i] * (initial + alpha * cumsum(values / d)[i]) where d[i] = (1 - alpha)^(i+1),
+    computed chunk by chunk so that 1 / d doesn't overflow.
+    """
+    beta = 1.0 - alpha
+    out = np.empty(len(values))
+    if beta <= 0.0:
+        out[:] = values
+        return out
+    chunk_size = max(int(_CHUNK_LOG / -math.log(beta)), 1)
+    previous = initial
+    for start in range(0, len(values), chunk_size):
+        chunk = values[start : start + chunk_size]
+        decay = beta ** np.arange(1, len(chunk) + 1)
+        out[start : start + len(chunk)] = decay * (
+            previous + alpha * np.cumsum(chunk / decay)
+        )
+        previous = out[start + len(chunk) - 1]
+    return out
+
+
+def _wilder(values: np.ndarray, period: int, first: int) -> np.ndarray:
+    """Wilder's smoothing of values[first:], seeded with the mean of values[first : first + period],
+    NaN before first + period - 1.
+    """
+    out = np.full(len(values), np.nan)
+    seed = first + period - 1
+    if len(values) > seed:
+        out[seed] = values[first : seed + 1].mean()
+        out[seed + 1 :] = _ewm(values[seed + 1 :], 1.0 / period, out[seed])
+    return out
+
+
+class Indicator(ABC):
+    """A technical indicator, computed over a whole frame with NumPy-vectorized kernels (compute())
+    or bar by bar in O(1) as streaming bars arrive (update()).
+
+    The incremental state can revise the last bar (e.g. a bar in progress updated by every new tick),
+    it keeps whatever it needs to undo the last bar's contribution.
+    """
+
+    NAME: ClassVar[str]
+    # default period of the indicator
+    PERIOD: ClassVar[int]
+
+    def __init__(self, period: int | None = None, source: str = "close"):
+        """
+        Args:
+            period: number of bars of the indicator's window, if None, PERIOD.
+            source: column the indicator is computed from, e.g. "close" or "price" for tick data.
+                Ignored by indicators computed from high/low/close (e.g. atr).
+        """
+        self.period = period or self.PERIOD
+        assert self.period >= 1, f"period must be a positive integer, got {self.period}"
+        self.source = source
+
+    @property
+    def params(self) -> dict[str, Any]:
+        """The arguments of create_indicator() that recreate this indicator."""
+        return {"indicator": self.NAME, "period": self.period, "source": self.source}
+
+    @property
+    def input_cols(self) -> list[str]:
+        return [self.source]
+
+    @property
+    def columns(self) -> list[str]:
+        """Names of the output columns."""
+        return [f"{self.NAME}_{self.period}"]
+
+    def _get_inputs(self, inputs: Mapping[str, Any]) -> list[np.ndarray]:
+        return [_to_float(inputs[col]) for col in self.input_cols]
+
+    def compute(self, inputs: Mapping[str, Any]) -> list[np.ndarray]:
+        """Compute the indicator over whole columns at once, one array per output column.
+
+        Args:
+            inputs: the input columns (see input_cols) by name, e.g. a dataframe.
+        """
+        return self._compute(*self._get_inputs(inputs))
+
+    def update(
+        self, inputs: Mapping[str, Any], replace_last: bool = False
+    ) -> list[np.ndarray]:
+        """Feed new bars to the incremental state, and return the indicator's values for them.
+
+        Args:
+            inputs: the input columns of the new bars.
+            replace_last: whether the first bar replaces the last bar fed (e.g. an update of the bar in progress).
+        """
+        arrays = self._get_inputs(inputs)
+        num_rows = len(arrays[0])
+        out = np.empty((len(self.columns), num_rows))
+        for i in range(num_rows):
+            out[:, i] = self._update_row(
+                *(values[i] for values in arrays), replace=replace_last and i == 0
+            )
+        return list(out)
+
+    @abstractmethod
+    def _compute(self, *inputs: np.ndarray) -> list[np.ndarray]: ...
+
+    @abstractmethod
+    def _update_row(self, *values: Any, replace: bool) -> tuple[float, ...]: ...
+
+
+class _ScalarStateIndicator(Indicator):
+    """Indicator whose incremental state is a tuple of scalars, so the state before the last bar
+    is simply kept to revise it.
+    """
+
+    def __init__(self, period: int | None = None, source: str = "close"):
+        super().__init__(period=period, source=source)
+        self._state: tuple[Any, ...] = self._initial_state()
+        self._state_before_last = self._state
+
+    @abstractmethod
+    def _initial_state(self) -> tuple[Any, ...]: ...
+
+    @abstractmethod
+    def _step(
+        self, state: tuple[Any, ...], *values: Any
+    ) -> tuple[tuple[Any, ...], tuple[float, ...]]:
+        """Returns the state after the bar and the indicator's values for it."""
+
+    def _update_row(self, *values: Any, replace: bool) -> tuple[float, ...]:
+        if not replace:
+            self._state_before_last = self._state
+        self._state, out = self._step(self._state_before_last, *values)
+        return out
+
+
+class _WindowIndicator(Indicator):
+    """Indicator over the last `period` values, kept in a window with their running sums.
+
+    Running sums drift with floating-point errors, so they are recomputed from the window
+    every `period` bars, which is still O(1) per bar on average.
+    """
+
+    def __init__(self, period: int | None = None, source: str = "close"):
+        super().__init__(period=period, source=source)
+        self._window: deque[float] = deque(maxlen=self.period)
+        # values are shifted by the first one to limit cancellation in the sum of squares
+        self._shift: float | None = None
+        self._sum = 0.0
+        self._sum_sq = 0.0
+        self._num_updates = 0
+
+    def _push(self, value: float, replace: bool) -> None:
+        window = self._window
+        if self._shift is None:
+            self._shift = value
+        value -= self._shift
+        if replace and window:
+            old = window[-1]
+            window[-1] = value
+        else:
+            old = window[0] if len(window) == self.period else 0.0
+            window.append(value)
+            self._num_updates += 1
+        self._sum += value - old
+        self._sum_sq += value * value - old * old
+        if self._num_updates % self.period == 0:
+            self._sum = math.fsum(window)
+            self._sum_sq = math.fsum(v * v for v in window)
+
+    @property
+    def _mean(self) -> float:
+        if len(self._window) < self.period:
+            return math.nan
+        return self._sum / self.period + self._shift
+
+    @property
+    def _std(self) -> float:
+        if len(self._window) < self.period:
+            return math.nan
+        mean = self._sum / self.period
+        return math.sqrt(max(self._sum_sq / self.period - mean * mean, 0.0))
+
+
+class SMA(_WindowIndicator):
+    """Simple moving average."""
+
+    NAME = "sma"
+    PERIOD = 20
+
+    def _compute(self, values: np.ndarray) -> list[np.ndarray]:
+        return [_rolling_sum(values, self.period) / self.period]
+
+    def _update_row(self, value: float, replace: bool) -> tuple[float, ...]:
+        self._push(value, replace)
+        return (self._mean,)
+
+
+class Bollinger(_WindowIndicator):
+    """Bollinger bands, the simple moving average +/- num_std population standard deviations."""
+
+    NAME = "bollinger"
+    PERIOD = 20
+
+    def __init__(
+        self, period: int | None = None, source: str = "close", num_std: float = 2.0
+    ):
+        super().__init__(period=period, source=source)
+        self.num_std = num_std
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return {**super().params, "num_std": self.num_std}
+
+    @property
+    def columns(self) -> list[str]:
+        return [f"bb_{band}_{self.period}" for band in ("upper", "middle", "lower")]
+
+    def _compute(self, values: np.ndarray) -> list[np.ndarray]:
+        finite = values[np.isfinite(values)]
+        shift = finite[0] if len(finite) else 0.0
+        shifted = values - shift
+        mean = _rolling_sum(shifted, self.period) / self.period
+        mean_sq = _rolling_sum(shifted * shifted, self.period) / self.period
+        std = np.sqrt(np.maximum(mean_sq - mean * mean, 0.0))
+        middle = mean + shift
+        return [middle + self.num_std * std, middle, middle - self.num_std * std]
+
+    def _update_row(self, value: float, replace: bool) -> tuple[float, ...]:
+        self._push(value, replace)
+        middle, band = self._mean, self.num_std * self._std
+        return middle + band, middle, middle - band
+
+
+class EMA(_ScalarStateIndicator):
+    """Exponential moving average, with smoothing 2 / (period + 1), seeded with the simple moving average
+    of the first `period` values.
+    """
+
+    NAME = "ema"
+    PERIOD = 20
+
+    @property
+    def _alpha(self) -> float:
+        return 2.0 / (self.period + 1)
+
+    def _compute(self, values: np.ndarray) -> list[np.ndarray]:
+        out = np.full(len(values), np.nan)
+        period = self.period
+        if len(values) >= period:
+            out[period - 1] = values[:period].mean()
+            out[period:] = _ewm(values[period:], self._alpha, out[period - 1])
+        return [out]
+
+    def _initial_state(self) -> tuple[Any, ...]:
+        # (number of values, their sum until the seed, ema)
+        return 0, 0.0, math.nan
+
+    def _step(
+        self, state: tuple[Any, ...], value: float
+    ) -> tuple[tuple[Any, ...], tuple[float, ...]]:
+        count, total, ema = state
+        count += 1
+        if count < self.period:
+            return (count, total + value, ema), (math.nan,)
+        if count == self.period:
+            ema = (total + value) / self.period
+        else:
+            ema += self._alpha * (value - ema)
+        return (count, total, ema), (ema,)
+
+
+class RSI(_ScalarStateIndicator):
+    """Relative strength index with Wilder's smoothing of the average gains and losses."""
+
+    NAME = "rsi"
+    PERIOD = 14
+
+    def _compute(self, values: np.ndarray) -> list[np.ndarray]:
+        change = np.diff(values, prepend=np.nan)
+        avg_gain = _wilder(np.maximum(change, 0.0), self.period, first=1)
+        avg_loss = _wilder(np.maximum(-change, 0.0), self.period, first=1)
+        total = avg_gain + avg_loss
+        # a flat window is neutral
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return [np.where(total == 0, 50.0, 100.0 * avg_gain / total)]
+
+    def _initial_state(self) -> tuple[Any, ...]:
+        # (number of values, previous value, average gain, average loss),
+        # the averages are sums until the first `period` changes have been seen
+        return 0, math.nan, 0.0, 0.0
+
+    def _step(
+        self, state: tuple[Any, ...], value: float
+    ) -> tuple[tuple[Any, ...], tuple[float, ...]]:
+        count, previous, avg_gain, avg_loss = state
+        count += 1
+        if count == 1:
+            return (count, value, avg_gain, avg_loss), (math.nan,)
+        change = value - previous
+        gain, loss = max(change, 0.0), max(-change, 0.0)
+        period = self.period
+        # count - 1 changes so far
+        if count - 1 < period:
+            return (count, value, avg_gain + gain, avg_loss + loss), (math.nan,)
+        if count - 1 == period:
+            avg_gain, avg_loss = (avg_gain + gain) / period, (avg_loss + loss) / period
+        else:
+            avg_gain += (gain - avg_gain) / period
+            avg_loss += (loss - avg_loss) / period
+        total = avg_gain + avg_loss
+        rsi = 50.0 if total == 0 else 100.0 * avg_gain / total
+        return (count, value, avg_gain, avg_loss), (rsi,)
+
+
+class ATR(_ScalarStateIndicator):
+    """Average true range with Wilder's smoothing, starting from the second bar
+    (the true range of a bar needs the previous close).
+    """
+
+    NAME = "atr"
+    PERIOD = 14
+
+    @property
+    def input_cols(self) -> list[str]:
+        return ["high", "low", "close"]
+
+    def _compute(
+        self, high: np.ndarray, low: np.ndarray, close: np.ndarray
+    ) -> list[np.ndarray]:
+        previous = np.r_[np.nan, close[:-1]]
+        true_range = np.maximum.reduce(
+            [high - low, np.abs(high - previous), np.abs(low - previous)]
+        )
+        return [_wilder(true_range, self.period, first=1)]
+
+    def _initial_state(self) -> tuple[Any, ...]:
+        # (number of bars, previous close, atr), atr is the sum of true ranges until the first `period` ones
+        return 0, math.nan, 0.0
+
+    def _step(
+        self, state: tuple[Any, ...], high: float, low: float, close: float
+    ) -> tuple[tuple[Any, ...], tuple[float, ...]]:
+        count, previous, atr = state
+        count += 1
+        if count == 1:
+            return (count, close, atr), (math.nan,)
+        true_range = max(high - low, abs(high - previous), abs(low - previous))
+        period = self.period
+        if count - 1 < period:
+            return (count, close, atr + true_range), (math.nan,)
+        if count - 1 == period:
+            atr = (atr + true_range) / period
+        else:
+            atr += (true_range - atr) / period
+        return (count, close, atr), (atr,)
+
+
+class VWAP(_ScalarStateIndicator):
+    """Volume-weighted average of the typical price (high + low + close) / 3, reset every (UTC) day.
+    It has no period, period and source are ignored.
+    """
+
+    NAME = "vwap"
+    PERIOD = 1
+
+    @property
+    def params(self) -> dict[str, Any]:
+        return {"indicator": self.NAME}
+
+    @property
+    def input_cols(self) -> list[str]:
+        return ["date", "high", "low", "close", "volume"]
+
+    @property
+    def columns(self) -> list[str]:
+        return ["vwap"]
+
+    def _get_inputs(self, inputs: Mapping[str, Any]) -> list[np.ndarray]:
+        dates, *values = (np.asarray(inputs[col]) for col in self.input_cols)
+        days = dates.astype("datetime64[D]").astype(np.int64)
+        return [days, *(_to_float(v) for v in values)]
+
+    def _compute(
+        self,
+        days: np.ndarray,
+        high: np.ndarray,
+        low: np.ndarray,
+        close: np.ndarray,
+        volume: np.ndarray,
+    ) -> list[np.ndarray]:
+        price_volume = np.cumsum((high + low + close) / 3 * volume)
+        cum_volume = np.cumsum(volume)
+        # subtract the sums up to the start of each day
+        is_start = np.r_[True, days[1:] != days[:-1]]
+        start = np.maximum.accumulate(np.where(is_start, np.arange(len(days)), 0))
+        price_volume -= np.r_[0.0, price_volume][start]
+        cum_volume -= np.r_[0.0, cum_volume][start]
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return [np.where(cum_volume > 0, price_volume / cum_volume, np.nan)]
+
+    def _initial_state(self) -> tuple[Any, ...]:
+        # (day, cumulative price * volume, cumulative volume)
+        return None, 0.0, 0.0
+
+    def _step(
+        self,
+        state: tuple[Any, ...],
+        day: int,
+        high: float,
+        low: float,
+        close: float,
+        volume: float,
+    ) -> tuple[tuple[Any, ...], tuple[float, ...]]:
+        last_day, price_volume, cum_volume = state
+        if day != last_day:
+            price_volume, cum_volume = 0.0, 0.0
+        price_volume += (high + low + close) / 3 * volume
+        cum_volume += volume
+        vwap = price_volume / cum_volume if cum_volume > 0 else math.nan
+        return (day, price_volume, cum_volume), (vwap,)
+
+
+INDICATORS: dict[str, type[Indicator]] = {
+    cls.NAME: cls for cls in (SMA, EMA, RSI, Bollinger, VWAP, ATR)
+}
+
+
+def create_indicator(indicator: IndicatorName, **params: Any) -> Indicator:
+    """Create an indicator by name, e.g. create_indicator("sma", period=10).
+
+    Args:
+        params: the indicator's arguments, e.g. period, source, or num_std for bollinger.
+    """
+    if indicator not in INDICATORS:
+        raise ValueError(
+            f"Unsupported indicator: {indicator!r}, must be one of {list(INDICATORS)}"
+        )
+    return INDICATORS[indicator](**params)
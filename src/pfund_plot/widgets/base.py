@@ -8,7 +8,7 @@ if TYPE_CHECKING:
     import narwhals as nw
     import panel as pn
 
-    from pfund_plot.plots.plot import MessageKey, StreamingDfs
+    from pfund_plot.plots.plot import MessageKey, StreamingBuffers
 
 
 class BaseWidget(ABC):
@@ -20,8 +20,16 @@ class BaseWidget(ABC):
         df: nw.DataFrame[Any],
         control: dict[str, Any],
         update_callback: Callable[[nw.DataFrame[Any]], None],
+        lazy_df: nw.LazyFrame[Any] | None = None,
     ):
+        """
+        Args:
+            df: the plot's data, only the rows shown initially if the plot has a lazy source.
+            lazy_df: the plot's lazy source (e.g. polars' scan_parquet), if any.
+                Widgets should query it for the full data instead of using df.
+        """
         self._df = df
+        self._lazy_df = lazy_df
         self._control: dict[str, Any] = control
         self._update_callback = update_callback
         self._overlays: list[BaseWidget] = []
@@ -48,17 +56,17 @@ class BaseWidget(ABC):
 class BaseStreamingWidget(ABC):
     def __init__(
         self,
-        streaming_dfs: StreamingDfs,
+        streaming_buffers: StreamingBuffers,
         active_key: MessageKey,
         update_callback: Callable[[MessageKey], None],
     ):
-        self._streaming_dfs = streaming_dfs
+        self._streaming_buffers = streaming_buffers
         self._active_key = active_key
         self._update_callback = update_callback
         self._overlays: list[BaseStreamingWidget] = []
 
     @abstractmethod
-    def update_streaming_state(self, streaming_dfs: StreamingDfs) -> None: ...
+    def update_streaming_state(self, streaming_buffers: StreamingBuffers) -> None: ...
 
     @abstractmethod
     def get_panel_objects(self) -> list[pn.widgets.Widget]:
@@ -69,7 +77,9 @@ class BaseStreamingWidget(ABC):
         """Can this widget merge with another streaming widget of the same class?
         Merge if they operate on the same set of msg_keys (i.e. same feed).
         """
-        return set(self._streaming_dfs.keys()) == set(other._streaming_dfs.keys())
+        return set(self._streaming_buffers.keys()) == set(
+            other._streaming_buffers.keys()
+        )
 
     def add_overlay(self, other: BaseStreamingWidget) -> None:
         """Register an overlay streaming widget so this widget's actions also update the overlay."""
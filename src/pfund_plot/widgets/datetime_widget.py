@@ -11,6 +11,7 @@ if TYPE_CHECKING:
 import datetime
 
 import narwhals as nw
+import numpy as np
 import panel as pn
 
 from pfund_plot.utils import convert_to_datetime
@@ -51,15 +52,32 @@ class DatetimeRangeWidget(BaseWidget):
         df: nw.DataFrame[Any],
         control: dict[str, Any],
         update_callback: Callable[[nw.DataFrame[Any]], None],
+        lazy_df: nw.LazyFrame[Any] | None = None,
     ):
-        super().__init__(df, control, update_callback)
+        super().__init__(df, control, update_callback, lazy_df=lazy_df)
+        # the date column as datetime64 if it is sorted, for binary search in _filter_df.
+        # Computed once per df on the first filter, None if not computed yet or not sorted
+        self._sorted_dates: np.ndarray | None = None
+        self._is_sorted: bool | None = None
         date_col = self._df["date"]
         num_data_shown = date_col.len()
         if "num_data" in control and control["num_data"] is not None:
             num_data_shown = min(control["num_data"], num_data_shown)
+        if self._lazy_df is not None:
+            # the bounds of the full data, only the date column is read
+            first_date, last_date = (
+                self._lazy_df.select(
+                    nw.col("date").min().alias("start"),
+                    nw.col("date").max().alias("end"),
+                )
+                .collect()
+                .row(0)
+            )
+        else:
+            first_date, last_date = date_col[0], date_col[-1]
         start_date, end_date = (
-            convert_to_datetime(date_col[0]),
-            convert_to_datetime(date_col[-1]),
+            convert_to_datetime(first_date),
+            convert_to_datetime(last_date),
         )
         start_date = round_date(start_date, to="floor")
         end_date = round_date(end_date, to="ceil")
@@ -109,13 +127,51 @@ class DatetimeRangeWidget(BaseWidget):
     def get_panel_objects(self) -> list[pn.widgets.Widget]:
         return [self._datetime_range_input, self._datetime_range_slider]
 
-    @staticmethod
+    def _get_sorted_dates(self) -> np.ndarray | None:
+        """Returns the date column as datetime64 (naive UTC) if it is sorted, None otherwise.
+        Sortedness is only checked once per df.
+
+        The array is a zero-copy view of the column where possible, so that for a
+        memory-mapped source (see MemoryMappedSource) the date index stays in the
+        shared page cache instead of being copied into each process.
+        """
+        if self._is_sorted is None:
+            dates = self._df["date"].to_numpy()
+            self._is_sorted = dates.dtype.kind == "M" and bool(
+                np.all(dates[1:] >= dates[:-1])
+            )
+            self._sorted_dates = dates if self._is_sorted else None
+        return self._sorted_dates
+
     def _filter_df(
-        df: nw.DataFrame[Any],
+        self,
         start_date: datetime.datetime,
         end_date: datetime.datetime,
     ) -> Frame:
-        return df.filter((nw.col("date") >= start_date) & (nw.col("date") <= end_date))
+        """Returns the rows of the df within [start_date, end_date].
+
+        If the dates are sorted (the usual case), the bounds are found by binary search
+        and the df is sliced (zero-copy), instead of scanning the whole date column.
+        If the plot has a lazy source, the filter is pushed down into it and only the rows
+        in the range are collected.
+        """
+        if self._lazy_df is not None:
+            return self._lazy_df.filter(
+                (nw.col("date") >= start_date) & (nw.col("date") <= end_date)
+            ).collect()
+        dates = self._get_sorted_dates()
+        if dates is None:
+            return self._df.filter(
+                (nw.col("date") >= start_date) & (nw.col("date") <= end_date)
+            )
+        # dates from the widgets are naive UTC datetimes, see convert_to_datetime()
+        start, end = (
+            np.datetime64(convert_to_datetime(date)).astype(dates.dtype)
+            for date in (start_date, end_date)
+        )
+        first = int(np.searchsorted(dates, start, side="left"))
+        last = int(np.searchsorted(dates, end, side="right"))
+        return self._df[first:last]
 
     def _fan_out_to_overlays(
         self, start_date: datetime.datetime, end_date: datetime.datetime
@@ -125,7 +181,7 @@ class DatetimeRangeWidget(BaseWidget):
         picks up the updated overlay dfs.
         """
         for overlay_widget in self._overlays:
-            filtered = self._filter_df(overlay_widget._df, start_date, end_date)
+            filtered = overlay_widget._filter_df(start_date, end_date)
             overlay_widget._update_callback(filtered)
 
     def _derive_slider_step(self) -> int:
@@ -148,7 +204,7 @@ class DatetimeRangeWidget(BaseWidget):
             )
         # update overlay dfs BEFORE parent re-render so DynamicMap picks them up
         self._fan_out_to_overlays(start_date, end_date)
-        df_filtered = self._filter_df(self._df, start_date, end_date)
+        df_filtered = self._filter_df(start_date, end_date)
         self._update_callback(df_filtered)
 
     def _update_datetime_range_slider(self, event: Event):
@@ -163,16 +219,20 @@ class DatetimeRangeWidget(BaseWidget):
             )
         # update overlay dfs BEFORE parent re-render so DynamicMap picks them up
         self._fan_out_to_overlays(start_date, end_date)
-        df_filtered = self._filter_df(self._df, start_date, end_date)
+        df_filtered = self._filter_df(start_date, end_date)
         self._update_callback(df_filtered)
 
     def update_df(self, df: nw.DataFrame[Any]):
         """Update widget bounds and df reference for new df (currently only used when receiving streaming data)."""
         self._df = df
+        self._sorted_dates, self._is_sorted = None, None
         if self._df.shape[0] < 2:
             raise ValueError("df must have at least 2 rows")
         date_col = df["date"]
         new_end = round_date(convert_to_datetime(date_col[-1]), to="ceil")
+        # the new rows are still within the current bounds (e.g. an updated last bar)
+        if new_end == convert_to_datetime(self._datetime_range_slider.end):
+            return
 
         self._datetime_range_input.param.unwatch(self._input_watcher)
         self._datetime_range_slider.param.unwatch(self._slider_watcher)
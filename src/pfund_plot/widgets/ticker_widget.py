@@ -6,7 +6,7 @@ from collections.abc import Callable
 from typing import TYPE_CHECKING, Any
 
 if TYPE_CHECKING:
-    from pfund_plot.plots.plot import MessageKey, StreamingDfs
+    from pfund_plot.plots.plot import MessageKey, StreamingBuffers
 
 import panel as pn
 
@@ -24,12 +24,13 @@ class TickerSelectWidget(BaseStreamingWidget):
 
     def __init__(
         self,
-        streaming_dfs: StreamingDfs,
+        streaming_buffers: StreamingBuffers,
         active_key: MessageKey,
         update_callback: Callable[[MessageKey], None],
     ):
-        super().__init__(streaming_dfs, active_key, update_callback)
-        msg_keys = list(streaming_dfs.keys())
+        super().__init__(streaming_buffers, active_key, update_callback)
+        msg_keys = list(streaming_buffers.keys())
+        self._num_keys = len(msg_keys)
         self._select = pn.widgets.Select(
             name="Ticker",
             options=self._build_options(msg_keys),
@@ -59,9 +60,13 @@ class TickerSelectWidget(BaseStreamingWidget):
         self._fan_out_to_overlays(event.new)
         self._update_callback(event.new)
 
-    def update_streaming_state(self, streaming_dfs: StreamingDfs) -> None:
+    def update_streaming_state(self, streaming_buffers: StreamingBuffers) -> None:
         """Update dropdown options when new products start streaming."""
-        msg_keys = list(streaming_dfs.keys())
+        # streams are only ever added, so an unchanged count means unchanged options
+        if len(streaming_buffers) == self._num_keys:
+            return
+        self._num_keys = len(streaming_buffers)
+        msg_keys = list(streaming_buffers.keys())
         current_keys = (
             set(self._select.options.values())
             if isinstance(self._select.options, dict)
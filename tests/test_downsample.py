@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+from pfund_plot.utils.downsample import lttb, minmax
+
+
+def _lttb_reference(x: np.ndarray, y: np.ndarray, num_points: int) -> list[int]:
+    """Point by point LTTB, with the same buckets as lttb()."""
+    n = len(x)
+    edges = np.linspace(1, n - 1, num_points - 1).astype(np.int64)
+    indices, prev = [0], 0
+    for i in range(num_points - 2):
+        start, end = edges[i], edges[i + 1]
+        if i + 1 < num_points - 2:
+            next_start, next_end = edges[i + 1], edges[i + 2]
+            avg_x, avg_y = x[next_start:next_end].mean(), y[next_start:next_end].mean()
+        else:
+            avg_x, avg_y = x[-1], y[-1]
+        areas = [
+            abs(
+                (x[prev] - avg_x) * (y[j] - y[prev])
+                - (x[prev] - x[j]) * (avg_y - y[prev])
+            )
+            for j in range(start, end)
+        ]
+        prev = start + int(np.argmax(areas))
+        indices.append(prev)
+    return [*indices, n - 1]
+
+
+@pytest.fixture
+def series() -> tuple[np.ndarray, np.ndarray]:
+    rng = np.random.default_rng(0)
+    x = np.arange(10_000, dtype=np.float64)
+    return x, np.cumsum(rng.normal(size=len(x)))
+
+
+@pytest.mark.parametrize("num_points", [3, 10, 500])
+def test_lttb_matches_reference(series: tuple[np.ndarray, np.ndarray], num_points: int):
+    x, y = series
+    indices = lttb(x, y, num_points)
+    assert len(indices) == num_points
+    assert indices.tolist() == _lttb_reference(x, y, num_points)
+
+
+def test_lttb_keeps_all_points_when_few(series: tuple[np.ndarray, np.ndarray]):
+    x, y = series
+    np.testing.assert_array_equal(lttb(x[:100], y[:100], 200), np.arange(100))
+    np.testing.assert_array_equal(lttb(x[:100], y[:100], 2), np.arange(100))
+
+
+def test_minmax_keeps_extremes(series: tuple[np.ndarray, np.ndarray]):
+    x, y = series
+    y = y.copy()
+    y[1234], y[5678] = 1e6, -1e6
+    indices = minmax(x, y, 200)
+    assert len(indices) <= 200
+    assert np.all(np.diff(indices) > 0)
+    assert {0, len(x) - 1, 1234, 5678} <= set(indices.tolist())
+    # the min and max of every bucket
+    edges = np.linspace(x[0], x[-1], 100)
+    buckets = np.clip(np.searchsorted(edges, x, side="right") - 1, 0, 98)
+    for bucket in range(99):
+        rows = np.flatnonzero(buckets == bucket)
+        assert rows[np.argmin(y[rows])] in indices
+        assert rows[np.argmax(y[rows])] in indices
+
+
+def test_minmax_unsorted_x(series: tuple[np.ndarray, np.ndarray]):
+    x, y = series
+    order = np.random.default_rng(1).permutation(len(x))
+    indices = minmax(x[order], y[order], 200)
+    # same points as with sorted x
+    np.testing.assert_array_equal(np.sort(order[indices]), minmax(x, y, 200))
+
+
+def test_minmax_keeps_all_points_when_few(series: tuple[np.ndarray, np.ndarray]):
+    x, y = series
+    np.testing.assert_array_equal(minmax(x[:100], y[:100], 200), np.arange(100))
@@ -0,0 +1,28 @@
+import subprocess
+import sys
+
+# generous, importing pfund_plot takes ~0.1s without the plotting libraries
+MAX_IMPORT_SECONDS = 3.0
+
+
+def _run(code: str, *args: str) -> subprocess.CompletedProcess[str]:
+    return subprocess.run(
+        [sys.executable, *args, "-c", code], capture_output=True, text=True, check=True
+    )
+
+
+def test_import_does_not_load_plotting_libraries():
+    result = _run(
+        "import sys, pfund_plot; "
+        + "print(sorted({'panel', 'holoviews', 'hvplot', 'bokeh'} & set(sys.modules)))"
+    )
+    assert result.stdout.strip() == "[]"
+
+
+def test_import_time():
+    result = _run("import pfund_plot", "-X", "importtime")
+    # the last line is pfund_plot itself: "import time: self [us] | cumulative [us] | package"
+    last_line = result.stderr.strip().splitlines()[-1]
+    _, cumulative_us, package = (field.strip() for field in last_line.split("|"))
+    assert package == "pfund_plot"
+    assert int(cumulative_us) / 1e6 < MAX_IMPORT_SECONDS
@@ -0,0 +1,13 @@
+import pfeed as pe
+import pytest
+
+import pfund_plot as plt
+
+
+def test_marker_rejects_ingest_process():
+    # pipeline_mode only adds the stream request, nothing is connected
+    feed = pe.Bybit(pipeline_mode=True).market_feed
+    feed.stream(product="BTC_USDT_PERP", resolution="1m")
+    marker = plt.marker(feed, y="close", signal="close").control(ingest_process=True)
+    with pytest.raises(ValueError, match=r"\['_color', '_marker'\] of dtype object"):
+        marker._plot._create_ingest_worker()
@@ -0,0 +1,85 @@
+import threading
+
+import pytest
+
+from pfund_plot.streaming.ingest_queue import IngestQueue
+
+
+def _key(msg: tuple[str, int]) -> str:
+    return msg[0]
+
+
+def test_drain_returns_messages_in_order():
+    queue = IngestQueue(max_size=10)
+    for i in range(5):
+        queue.put(i)
+    assert queue.drain() == [0, 1, 2, 3, 4]
+    assert len(queue) == 0
+    metrics = queue.metrics
+    assert metrics.num_received == metrics.num_drained == 5
+    assert metrics.max_depth == 5 and metrics.depth == 0
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        IngestQueue(max_size=0)
+
+
+def test_drop_oldest():
+    queue = IngestQueue(max_size=3, policy="drop_oldest")
+    for i in range(5):
+        queue.put(i)
+    assert queue.drain() == [2, 3, 4]
+    assert queue.metrics.num_dropped == 2
+
+
+def test_block_overflow_drains_into_consumer():
+    drained: list[int] = []
+    queue: IngestQueue[int] = IngestQueue(
+        max_size=3, policy="block", on_overflow=lambda: drained.extend(queue.drain())
+    )
+    for i in range(7):
+        queue.put(i)
+    assert drained + queue.drain() == list(range(7))
+    assert queue.metrics.num_overflows == 2
+    assert queue.metrics.num_dropped == 0
+
+
+def test_block_waits_for_consumer():
+    queue = IngestQueue(max_size=2, policy="block", block_timeout=5.0)
+    queue.put(0)
+    queue.put(1)
+    timer = threading.Timer(0.05, queue.drain)
+    timer.start()
+    queue.put(2)
+    timer.join()
+    assert queue.drain() == [2]
+    assert queue.metrics.num_overflows == 0
+    assert queue.metrics.blocked_time > 0
+
+
+def test_conflate_keeps_all_messages_until_full():
+    queue = IngestQueue(max_size=10, policy="conflate", key_func=_key)
+    msgs = [("a", 0), ("a", 1), ("b", 2), ("a", 3)]
+    for msg in msgs:
+        queue.put(msg)
+    assert queue.drain() == msgs
+    assert queue.metrics.num_conflated == 0
+
+
+def test_conflate_keeps_latest_per_key_when_full():
+    queue = IngestQueue(max_size=4, policy="conflate", key_func=_key)
+    for msg in [("a", 0), ("b", 1), ("a", 2), ("b", 3), ("a", 4)]:
+        queue.put(msg)
+    # ordered by their latest update
+    assert queue.drain() == [("a", 2), ("b", 3), ("a", 4)]
+    assert queue.metrics.num_conflated == 2
+    assert queue.metrics.num_dropped == 0
+
+
+def test_conflate_drops_oldest_when_all_keys_differ():
+    queue = IngestQueue(max_size=2, policy="conflate", key_func=_key)
+    for msg in [("a", 0), ("b", 1), ("c", 2)]:
+        queue.put(msg)
+    assert queue.drain() == [("b", 1), ("c", 2)]
+    assert queue.metrics.num_dropped == 1
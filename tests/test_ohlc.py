@@ -0,0 +1,91 @@
+import narwhals as nw
+import numpy as np
+import pandas as pd
+import pytest
+
+from pfund_plot.utils.ohlc import (
+    aggregate_ticks,
+    choose_resolution,
+    infer_resolution,
+    resample_ohlc,
+)
+
+
+@pytest.fixture
+def bars() -> pd.DataFrame:
+    rng = np.random.default_rng(0)
+    n = 600
+    close = 100 + np.cumsum(rng.normal(size=n))
+    return pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01 00:03", periods=n, freq="1min"),
+            "open": close + rng.normal(size=n),
+            "high": close + 2,
+            "low": close - 2,
+            "close": close,
+            "volume": rng.random(n),
+        }
+    )
+
+
+def test_resample_ohlc_matches_pandas(bars: pd.DataFrame):
+    resampled = resample_ohlc(nw.from_native(bars), "15m").to_native()
+    expected = (
+        bars.resample("15min", on="date")
+        .agg(
+            {
+                "open": "first",
+                "high": "max",
+                "low": "min",
+                "close": "last",
+                "volume": "sum",
+            }
+        )
+        .reset_index()
+    )
+    pd.testing.assert_frame_equal(resampled, expected, check_dtype=False)
+
+
+def test_resample_ohlc_weeks_start_on_mondays():
+    dates = pd.date_range("2024-01-03", periods=20, freq="1D")  # a Wednesday
+    df = pd.DataFrame(
+        {"date": dates, "open": 1.0, "high": 2.0, "low": 0.0, "close": 1.0}
+    )
+    resampled = resample_ohlc(nw.from_native(df), "1w").to_native()
+    assert (resampled["date"].dt.dayofweek == 0).all()
+    assert resampled["date"].iloc[0] == pd.Timestamp("2024-01-01")
+    assert "volume" not in resampled.columns
+
+
+def test_infer_resolution(bars: pd.DataFrame):
+    dates = bars["date"].to_numpy()
+    assert infer_resolution(dates) == 60 * 1_000_000_000
+    assert infer_resolution(dates[:1]) == 0
+
+
+def test_choose_resolution():
+    minute_ns, day_ns = 60 * 1_000_000_000, 24 * 60 * 60 * 1_000_000_000
+    # fits already
+    assert choose_resolution(minute_ns, 100 * minute_ns, max_bars=200) is None
+    assert choose_resolution(minute_ns, day_ns, max_bars=200) == "15m"
+    assert choose_resolution(minute_ns, 1000 * day_ns, max_bars=10) == "1w"
+
+
+def test_aggregate_ticks():
+    seconds = np.array([0, 10, 59, 60, 61, 185])
+    dates = np.datetime64("2024-01-01", "ns") + seconds * np.timedelta64(1, "s")
+    prices = np.array([5.0, 7.0, 3.0, 4.0, 6.0, 2.0])
+    volumes = np.array([1.0, 2.0, 3.0, 4.0, 5.0, 6.0])
+    date, open_, high, low, close, volume = aggregate_ticks(
+        dates, prices, volumes, "1m"
+    )
+    np.testing.assert_array_equal(
+        date,
+        np.datetime64("2024-01-01", "ns")
+        + np.array([0, 1, 3]) * np.timedelta64(1, "m"),
+    )
+    np.testing.assert_array_equal(open_, [5.0, 4.0, 2.0])
+    np.testing.assert_array_equal(high, [7.0, 6.0, 2.0])
+    np.testing.assert_array_equal(low, [3.0, 4.0, 2.0])
+    np.testing.assert_array_equal(close, [3.0, 6.0, 2.0])
+    np.testing.assert_array_equal(volume, [6.0, 9.0, 6.0])
@@ -0,0 +1,32 @@
+import holoviews as hv
+import narwhals as nw
+import numpy as np
+import pandas as pd
+
+import pfund_plot as plt
+
+
+def test_overlay_update_rebuilds_prebuilt_plot():
+    n = 50
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=n, freq="1min"),
+            "close": np.random.rand(n),
+        }
+    )
+    plot = (
+        plt.line(df, x="date", y="close") * plt.scatter(df.head(5), x="date", y="close")
+    )._plot
+    plot._create_pane()
+    dmap = plot._pane.object
+    overlay = plot._overlays[0]
+    overlay._parent_plot = plot
+
+    def num_points() -> list[int]:
+        out = dmap[()]
+        assert isinstance(out, hv.Overlay)
+        return [len(element) for element in out.values()]
+
+    assert num_points() == [n, 5]
+    overlay._update_pane(nw.from_native(df.head(20)))
+    assert num_points() == [n, 20]
@@ -0,0 +1,84 @@
+import numpy as np
+import pytest
+
+from pfund_plot.streaming.ring_buffer import ColumnarRingBuffer
+
+SCHEMA = {"date": "datetime64[ns]", "value": "float64"}
+
+
+def _rows(start: int, stop: int) -> list[np.ndarray]:
+    ids = np.arange(start, stop)
+    return [ids.astype("datetime64[s]").astype("datetime64[ns]"), ids * 1.0]
+
+
+def test_append_and_extend():
+    buffer = ColumnarRingBuffer(SCHEMA, max_size=10)
+    buffer.append((np.datetime64(0, "ns"), 0.0))
+    buffer.extend(_rows(1, 4))
+    columns, first_row_id = buffer.snapshot()
+    assert len(buffer) == 4 and first_row_id == 0
+    np.testing.assert_array_equal(columns["value"], [0.0, 1.0, 2.0, 3.0])
+    assert buffer.last("value") == 3.0
+    assert buffer.num_appended == 4 and buffer.version == 2
+
+
+def test_keeps_the_last_max_size_rows_across_compactions():
+    buffer = ColumnarRingBuffer(SCHEMA, max_size=5)
+    # more rows than the storage (2 * max_size) holds, one by one and in batches
+    for i in range(13):
+        buffer.append(tuple(values[0] for values in _rows(i, i + 1)))
+    buffer.extend(_rows(13, 20))
+    columns, first_row_id = buffer.snapshot()
+    assert len(buffer) == 5 and first_row_id == 15
+    np.testing.assert_array_equal(columns["value"], np.arange(15, 20))
+    assert buffer.num_appended == 20
+
+
+def test_extend_more_rows_than_max_size():
+    buffer = ColumnarRingBuffer(SCHEMA, max_size=5)
+    buffer.extend(_rows(0, 12))
+    columns, first_row_id = buffer.snapshot()
+    assert first_row_id == 7
+    np.testing.assert_array_equal(columns["value"], np.arange(7, 12))
+
+
+def test_snapshot_stays_valid_after_compaction():
+    buffer = ColumnarRingBuffer(SCHEMA, max_size=4)
+    buffer.extend(_rows(0, 4))
+    columns, _ = buffer.snapshot()
+    buffer.extend(_rows(4, 12))
+    np.testing.assert_array_equal(columns["value"], [0.0, 1.0, 2.0, 3.0])
+
+
+def test_unbounded_buffer_grows():
+    buffer = ColumnarRingBuffer(SCHEMA)
+    buffer.extend(_rows(0, 3000))
+    buffer.append(tuple(values[0] for values in _rows(3000, 3001)))
+    columns, first_row_id = buffer.snapshot()
+    assert len(buffer) == 3001 and first_row_id == 0
+    np.testing.assert_array_equal(columns["value"], np.arange(3001))
+
+
+def test_replace_last():
+    buffer = ColumnarRingBuffer(SCHEMA, max_size=4)
+    with pytest.raises(IndexError):
+        buffer.replace_last((np.datetime64(0, "ns"), 0.0))
+    buffer.extend(_rows(0, 3))
+    version = buffer.version
+    buffer.replace_last((np.datetime64(2, "s"), 100.0))
+    assert buffer.last("value") == 100.0
+    assert len(buffer) == 3 and buffer.version == version + 1
+
+
+def test_read_frame():
+    buffer = ColumnarRingBuffer(SCHEMA, max_size=4)
+    buffer.extend(_rows(0, 6))
+    df, first_row_id = buffer.read_frame()
+    assert first_row_id == 2
+    assert df["value"].to_list() == [2.0, 3.0, 4.0, 5.0]
+    np.testing.assert_array_equal(df["date"].to_numpy(), _rows(2, 6)[0])
+
+
+def test_invalid_max_size():
+    with pytest.raises(ValueError):
+        ColumnarRingBuffer(SCHEMA, max_size=0)
@@ -0,0 +1,90 @@
+from collections.abc import Iterator
+
+import numpy as np
+import pytest
+
+from pfund_plot.streaming.shared_ring import SharedColumnarRing
+
+SCHEMA = {"ts": "int64", "value": "float64"}
+
+
+@pytest.fixture
+def rings() -> Iterator[tuple[SharedColumnarRing, SharedColumnarRing]]:
+    writer = SharedColumnarRing(SCHEMA, capacity=8)
+    reader = SharedColumnarRing(writer.schema, writer.capacity, name=writer.name)
+    yield writer, reader
+    reader.close()
+    writer.close()
+
+
+def _rows(start: int, stop: int) -> list[np.ndarray]:
+    ids = np.arange(start, stop)
+    return [ids, ids * 1.5]
+
+
+def test_read_returns_new_rows(rings: tuple[SharedColumnarRing, SharedColumnarRing]):
+    writer, reader = rings
+    assert reader.read() is None
+    writer.write(0, _rows(0, 3))
+    last_row, columns = reader.read()
+    assert last_row is None
+    np.testing.assert_array_equal(columns[0], [0, 1, 2])
+    assert reader.read() is None
+    writer.write(3, _rows(3, 5))
+    last_row, columns = reader.read()
+    # the previous last row, which the writer may have revised
+    assert last_row == (2, 3.0)
+    np.testing.assert_array_equal(columns[0], [3, 4])
+    np.testing.assert_array_equal(columns[1], [4.5, 6.0])
+
+
+def test_read_revised_last_row(rings: tuple[SharedColumnarRing, SharedColumnarRing]):
+    writer, reader = rings
+    writer.write(0, _rows(0, 3))
+    reader.read()
+    # e.g. an incremental update of the last bar
+    writer.write(2, [np.array([2]), np.array([100.0])])
+    last_row, columns = reader.read()
+    assert last_row == (2, 100.0)
+    assert all(len(values) == 0 for values in columns)
+
+
+def test_lagging_reader_skips_overwritten_rows(
+    rings: tuple[SharedColumnarRing, SharedColumnarRing],
+):
+    writer, reader = rings
+    writer.write(0, _rows(0, 2))
+    reader.read()
+    # wraps around the ring more than once
+    for start in range(2, 30, 4):
+        writer.write(start, _rows(start, start + 4))
+    last_row, columns = reader.read()
+    assert last_row is None
+    np.testing.assert_array_equal(columns[0], np.arange(22, 30))
+
+
+def test_write_more_rows_than_capacity(
+    rings: tuple[SharedColumnarRing, SharedColumnarRing],
+):
+    writer, reader = rings
+    writer.write(0, _rows(0, 20))
+    _, columns = reader.read()
+    np.testing.assert_array_equal(columns[0], np.arange(12, 20))
+
+
+def test_read_gives_up_while_writing(
+    rings: tuple[SharedColumnarRing, SharedColumnarRing],
+):
+    writer, reader = rings
+    writer.write(0, _rows(0, 3))
+    # a writer dying in the middle of a write leaves the sequence number odd
+    writer._header[0] += 1
+    assert reader.read() is None
+    writer._header[0] += 1
+    _, columns = reader.read()
+    np.testing.assert_array_equal(columns[0], [0, 1, 2])
+
+
+def test_object_columns_are_not_supported():
+    with pytest.raises(ValueError):
+        SharedColumnarRing({"name": "object"}, capacity=8)
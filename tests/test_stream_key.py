@@ -0,0 +1,34 @@
+from types import SimpleNamespace
+
+import pandas as pd
+
+import pfund_plot as plt
+from pfund_plot.plots.lazy import LazyPlot
+from pfund_plot.streaming.hub import StreamingHub
+
+
+def _create_key(lazyplot: LazyPlot) -> tuple:
+    # only the feed's requests identify its stream
+    feed = SimpleNamespace(_requests=[SimpleNamespace(product="BTC_USDT_PERP")])
+    return StreamingHub.create_key(feed, *lazyplot._plot._get_stream_params())
+
+
+def test_markers_with_different_styling_get_different_keys():
+    df = pd.DataFrame(
+        {
+            "date": pd.date_range("2024-01-01", periods=3, freq="1min"),
+            "close": [1.0, 2.0, 3.0],
+            "side": [1, -1, 1],
+            "pnl": [-1.0, 1.0, 2.0],
+        }
+    )
+    marker = plt.marker(df, x="date", y="close", signal="side")
+    assert _create_key(marker) == _create_key(
+        plt.marker(df, x="date", y="close", signal="side")
+    )
+    for other in (
+        plt.marker(df, x="date", y="close", signal="pnl"),
+        plt.marker(df, x="date", y="close", signal="side", pos_color="blue"),
+        plt.marker(df, x="date", y="close", signal="side", neg_marker="x"),
+    ):
+        assert _create_key(marker) != _create_key(other)
@@ -0,0 +1,71 @@
+import numpy as np
+import pytest
+
+from pfund_plot.utils.ta import INDICATORS, Indicator, create_indicator
+
+
+@pytest.fixture
+def bars() -> dict[str, np.ndarray]:
+    rng = np.random.default_rng(0)
+    n = 200
+    close = 100 + np.cumsum(rng.normal(size=n))
+    return {
+        # a few bars per day, so that vwap resets
+        "date": np.datetime64("2024-01-01", "ns")
+        + np.arange(n) * np.timedelta64(7, "h"),
+        "high": close + rng.random(n),
+        "low": close - rng.random(n),
+        "close": close,
+        "volume": rng.random(n) * 10,
+    }
+
+
+def _slice(bars: dict[str, np.ndarray], start: int, stop: int) -> dict[str, np.ndarray]:
+    return {col: values[start:stop] for col, values in bars.items()}
+
+
+@pytest.mark.parametrize("name", list(INDICATORS))
+def test_update_matches_compute(name: str, bars: dict[str, np.ndarray]):
+    expected = create_indicator(name, period=10).compute(bars)
+    indicator = create_indicator(name, period=10)
+    # fed in uneven batches
+    batches = [
+        indicator.update(_slice(bars, start, start + 7)) for start in range(0, 200, 7)
+    ]
+    for col, expected_values in enumerate(expected):
+        values = np.concatenate([batch[col] for batch in batches])
+        np.testing.assert_allclose(values, expected_values, rtol=1e-9, equal_nan=True)
+
+
+@pytest.mark.parametrize("name", list(INDICATORS))
+def test_replace_last_revises_last_bar(name: str, bars: dict[str, np.ndarray]):
+    expected = create_indicator(name, period=10).compute(bars)
+    indicator = create_indicator(name, period=10)
+    values: list[list[float]] = []
+    for i in range(200):
+        # the bar in progress is first seen with a stale close, then revised
+        stale = {col: col_values[i : i + 1].copy() for col, col_values in bars.items()}
+        stale["close"] += 5.0
+        indicator.update(stale)
+        values.append(
+            [v[0] for v in indicator.update(_slice(bars, i, i + 1), replace_last=True)]
+        )
+    np.testing.assert_allclose(
+        np.array(values).T, np.array(expected), rtol=1e-9, equal_nan=True
+    )
+
+
+def test_warm_up_is_nan(bars: dict[str, np.ndarray]):
+    (sma,) = create_indicator("sma", period=10).compute(bars)
+    assert np.isnan(sma[:9]).all()
+    assert sma[9] == pytest.approx(bars["close"][:10].mean())
+
+
+def test_indicator_is_abstract():
+    with pytest.raises(TypeError):
+        Indicator()  # pyright: ignore[reportAbstractUsage]
+
+
+def test_unsupported_indicator():
+    with pytest.raises(ValueError):
+        create_indicator("macd")  # pyright: ignore[reportArgumentType]